@@ -0,0 +1,33 @@
+"""Add trigram search index on boat listings
+
+Revision ID: 3f2b9c1d4e57
+Revises: 656a4c7853b1
+Create Date: 2026-10-17 09:12:41.208533
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from app.core.search import CREATE_SEARCH_INDEX_SQL, DROP_SEARCH_INDEX_SQL
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f2b9c1d4e57'
+down_revision: Union[str, None] = '656a4c7853b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # pg_trgm is Postgres only; SQLite ranks in-process (see app.core.search)
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for statement in CREATE_SEARCH_INDEX_SQL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for statement in DROP_SEARCH_INDEX_SQL:
+        op.execute(statement)
@@ -0,0 +1,43 @@
+"""Add map revisions and position tombstones for delta sync
+
+Revision ID: 8c41d7e2a9b3
+Revises: 3f2b9c1d4e57
+Create Date: 2026-10-17 14:03:22.517306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c41d7e2a9b3'
+down_revision: Union[str, None] = '3f2b9c1d4e57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('maps', sa.Column('revision', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('boat_positions', sa.Column('revision', sa.Integer(), server_default='0', nullable=False))
+    op.create_index('ix_boat_positions_map_revision', 'boat_positions', ['map_id', 'revision'], unique=False)
+    op.create_table('position_tombstones',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('map_id', sa.Integer(), nullable=False),
+    sa.Column('position_id', sa.Integer(), nullable=False),
+    sa.Column('revision', sa.Integer(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_position_tombstones_id'), 'position_tombstones', ['id'], unique=False)
+    op.create_index('ix_position_tombstones_map_revision', 'position_tombstones', ['map_id', 'revision'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_position_tombstones_map_revision', table_name='position_tombstones')
+    op.drop_index(op.f('ix_position_tombstones_id'), table_name='position_tombstones')
+    op.drop_table('position_tombstones')
+    op.drop_index('ix_boat_positions_map_revision', table_name='boat_positions')
+    op.drop_column('boat_positions', 'revision')
+    op.drop_column('maps', 'revision')
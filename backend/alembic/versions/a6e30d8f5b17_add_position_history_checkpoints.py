@@ -0,0 +1,35 @@
+"""Add position history checkpoints
+
+Revision ID: a6e30d8f5b17
+Revises: f8d24b6c1a39
+Create Date: 2026-10-17 23:18:47.905126
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6e30d8f5b17'
+down_revision: Union[str, None] = 'f8d24b6c1a39'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Filled lazily by the first reads of each map's history
+    op.create_table(
+        'position_history_checkpoints',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('map_id', sa.Integer(), nullable=False),
+        sa.Column('ts', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('positions', sa.JSON(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('map_id', 'ts', name='uq_position_history_checkpoints_map_ts')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('position_history_checkpoints')
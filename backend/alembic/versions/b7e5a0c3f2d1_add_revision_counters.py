@@ -0,0 +1,32 @@
+"""Add revision counters for boat list ETags
+
+Revision ID: b7e5a0c3f2d1
+Revises: 8c41d7e2a9b3
+Create Date: 2026-10-17 16:40:09.114872
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e5a0c3f2d1'
+down_revision: Union[str, None] = '8c41d7e2a9b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    counters = op.create_table('revision_counters',
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('revision', sa.Integer(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    # Seed the row so concurrent first writers only ever UPDATE it
+    op.bulk_insert(counters, [{'name': 'boats', 'revision': 0}])
+
+
+def downgrade() -> None:
+    op.drop_table('revision_counters')
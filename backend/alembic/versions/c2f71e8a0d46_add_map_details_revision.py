@@ -0,0 +1,30 @@
+"""Add details revision to maps
+
+Revision ID: c2f71e8a0d46
+Revises: a6e30d8f5b17
+Create Date: 2026-10-17 23:52:06.318402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2f71e8a0d46'
+down_revision: Union[str, None] = 'a6e30d8f5b17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'maps', sa.Column('details_revision', sa.Integer(), server_default='0', nullable=False)
+    )
+    # Earlier edits are unknown, so every delta client gets the map once
+    op.execute('UPDATE maps SET details_revision = revision')
+
+
+def downgrade() -> None:
+    op.drop_column('maps', 'details_revision')
@@ -0,0 +1,88 @@
+"""Add footprint bounds to boat positions for viewport queries
+
+Revision ID: d3a9f6b21c84
+Revises: b7e5a0c3f2d1
+Create Date: 2026-10-17 19:12:40.118204
+
+"""
+import math
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3a9f6b21c84'
+down_revision: Union[str, None] = 'b7e5a0c3f2d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+positions = sa.table(
+    'boat_positions',
+    sa.column('id', sa.Integer),
+    sa.column('x', sa.Float),
+    sa.column('y', sa.Float),
+    sa.column('width', sa.Float),
+    sa.column('height', sa.Float),
+    sa.column('rotation', sa.Float),
+    sa.column('bbox_x0', sa.Float),
+    sa.column('bbox_y0', sa.Float),
+    sa.column('bbox_x1', sa.Float),
+    sa.column('bbox_y1', sa.Float),
+    sa.column('bbox_size', sa.Float),
+)
+
+
+def _bounds(row) -> dict:
+    # Same as app.core.geometry.footprint_bounds, frozen for this migration
+    radians = math.radians(row.rotation)
+    cos, sin = abs(math.cos(radians)), abs(math.sin(radians))
+    half_width = (row.width * cos + row.height * sin) / 2
+    half_height = (row.width * sin + row.height * cos) / 2
+    return {
+        'row_id': row.id,
+        'bbox_x0': row.x - half_width,
+        'bbox_y0': row.y - half_height,
+        'bbox_x1': row.x + half_width,
+        'bbox_y1': row.y + half_height,
+        'bbox_size': 2 * max(half_width, half_height),
+    }
+
+
+def upgrade() -> None:
+    for name in ('bbox_x0', 'bbox_y0', 'bbox_x1', 'bbox_y1', 'bbox_size'):
+        op.add_column('boat_positions', sa.Column(name, sa.Float(), nullable=True))
+
+    # Backfill in keyset batches so large tables never load at once
+    connection = op.get_bind()
+    statement = (
+        positions.update()
+        .where(positions.c.id == sa.bindparam('row_id'))
+        .values({name: sa.bindparam(name) for name in ('bbox_x0', 'bbox_y0', 'bbox_x1', 'bbox_y1', 'bbox_size')})
+    )
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(positions.c.id, positions.c.x, positions.c.y, positions.c.width,
+                      positions.c.height, positions.c.rotation)
+            .where(positions.c.id > last_id)
+            .order_by(positions.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        connection.execute(statement, [_bounds(row) for row in rows])
+        last_id = rows[-1].id
+
+    op.create_index('ix_boat_positions_map_bbox', 'boat_positions', ['map_id', 'bbox_x0', 'bbox_y0'], unique=False)
+    op.create_index('ix_boat_positions_map_bbox_size', 'boat_positions', ['map_id', 'bbox_size'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_boat_positions_map_bbox_size', table_name='boat_positions')
+    op.drop_index('ix_boat_positions_map_bbox', table_name='boat_positions')
+    for name in ('bbox_size', 'bbox_y1', 'bbox_x1', 'bbox_y0', 'bbox_x0'):
+        op.drop_column('boat_positions', name)
@@ -0,0 +1,74 @@
+"""Add parsed length and beam to boat listings
+
+Revision ID: e5c17a4b9f02
+Revises: d3a9f6b21c84
+Create Date: 2026-10-17 21:40:12.512093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from app.core.sizes import parse_size
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5c17a4b9f02'
+down_revision: Union[str, None] = 'd3a9f6b21c84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+listings = sa.table(
+    'boat_listings',
+    sa.column('id', sa.Integer),
+    sa.column('size', sa.String),
+    sa.column('length_ft', sa.Float),
+    sa.column('beam_ft', sa.Float),
+)
+
+
+def upgrade() -> None:
+    op.add_column('boat_listings', sa.Column('length_ft', sa.Float(), nullable=True))
+    op.add_column('boat_listings', sa.Column('beam_ft', sa.Float(), nullable=True))
+
+    # Backfill in keyset batches so large tables never load at once. Uses the
+    # live parser: if it learns new formats, re-run the backfill for NULL lengths
+    connection = op.get_bind()
+    statement = (
+        listings.update()
+        .where(listings.c.id == sa.bindparam('row_id'))
+        .values(length_ft=sa.bindparam('length'), beam_ft=sa.bindparam('beam'))
+    )
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(listings.c.id, listings.c.size)
+            .where(listings.c.id > last_id, listings.c.size.isnot(None))
+            .order_by(listings.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        parsed = [(row.id, parse_size(row.size)) for row in rows]
+        values = [
+            {'row_id': row_id, 'length': size.length_ft, 'beam': size.beam_ft}
+            for row_id, size in parsed if size is not None
+        ]
+        if values:
+            connection.execute(statement, values)
+        last_id = rows[-1].id
+
+    op.create_index('ix_boat_listings_length_ft', 'boat_listings', ['length_ft'], unique=False)
+    op.create_index(
+        'ix_boat_listings_length_sort', 'boat_listings',
+        [sa.text('coalesce(length_ft, 0.0)'), sa.text('"index"')], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_boat_listings_length_sort', table_name='boat_listings')
+    op.drop_index('ix_boat_listings_length_ft', table_name='boat_listings')
+    op.drop_column('boat_listings', 'beam_ft')
+    op.drop_column('boat_listings', 'length_ft')
@@ -0,0 +1,49 @@
+"""Add append-only position history
+
+Revision ID: f8d24b6c1a39
+Revises: e5c17a4b9f02
+Create Date: 2026-10-17 22:31:05.774310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8d24b6c1a39'
+down_revision: Union[str, None] = 'e5c17a4b9f02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'position_history',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('map_id', sa.Integer(), nullable=False),
+        sa.Column('position_id', sa.Integer(), nullable=False),
+        sa.Column('boat_id', sa.Integer(), nullable=True),
+        sa.Column('x', sa.Float(), nullable=False),
+        sa.Column('y', sa.Float(), nullable=False),
+        sa.Column('rotation', sa.Float(), nullable=False),
+        sa.Column('removed', sa.Boolean(), nullable=False),
+        sa.Column('ts', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_position_history_map_ts', 'position_history', ['map_id', 'ts'], unique=False)
+    op.create_index('ix_position_history_boat_ts', 'position_history', ['boat_id', 'ts'], unique=False)
+
+    # Start the history from where every position is now
+    op.execute(
+        "INSERT INTO position_history (map_id, position_id, boat_id, x, y, rotation, removed, ts) "
+        "SELECT p.map_id, p.id, b.id, p.x, p.y, p.rotation, false, COALESCE(p.updated_at, p.created_at, CURRENT_TIMESTAMP) "
+        "FROM boat_positions p LEFT JOIN boat_listings b ON b.position_id = p.id"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_position_history_boat_ts', table_name='position_history')
+    op.drop_index('ix_position_history_map_ts', table_name='position_history')
+    op.drop_table('position_history')
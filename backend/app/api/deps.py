@@ -1,20 +1,21 @@
 # backend/app/api/deps.py
 from typing import Generator, Optional
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, WebSocketException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
-from ..core.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..core.database import get_db, get_async_db
+from ..core.exceptions import ValidationError
+from ..core.geometry import Bounds, parse_bbox
 from ..core.security import verify_token
 from ..models.user import User, UserRole
 from ..services.auth import AuthService
+from ..services.aio import AsyncAuthService
 
 security = HTTPBearer()
 
-def get_current_user(
-    db: Session = Depends(get_db),
-    credentials: HTTPAuthorizationCredentials = Depends(security)
-) -> User:
-    """Get current authenticated user"""
+def _credentials_email(credentials: HTTPAuthorizationCredentials) -> str:
+    """Extract the subject email from bearer credentials"""
     token = credentials.credentials
     email = verify_token(token)
     
@@ -24,8 +25,10 @@ def get_current_user(
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
-    user = AuthService.get_user_by_email(db, email=email)
+    return email
+
+def _check_user(user: Optional[User]) -> User:
+    """Reject missing or inactive users"""
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -41,6 +44,24 @@ def get_current_user(
     
     return user
 
+def get_current_user(
+    db: Session = Depends(get_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> User:
+    """Get current authenticated user"""
+    email = _credentials_email(credentials)
+    user = AuthService.get_cached_user(db, email=email)
+    return _check_user(user)
+
+async def get_current_user_async(
+    db: AsyncSession = Depends(get_async_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> User:
+    """Get current authenticated user on an async session"""
+    email = _credentials_email(credentials)
+    user = await AsyncAuthService.get_cached_user(db, email=email)
+    return _check_user(user)
+
 def get_current_admin_user(current_user: User = Depends(get_current_user)) -> User:
     """Require admin role"""
     if current_user.role != UserRole.ADMIN:
@@ -50,3 +71,51 @@ def get_current_admin_user(current_user: User = Depends(get_current_user)) -> Us
         )
     return current_user
 
+
+def _token_user(db: Session, token: str) -> Optional[User]:
+    """Resolve an active user from a raw access token"""
+    email = verify_token(token)
+    if email is None:
+        return None
+    user = AuthService.get_cached_user(db, email=email)
+    return user if user is not None and user.is_active else None
+
+def get_stream_user(
+    token: str = Query(...),
+    db: Session = Depends(get_db)
+) -> User:
+    """Authenticate an event stream from a ?token= query parameter
+    
+    EventSource cannot send headers. The session is closed straight away
+    so a long-lived stream does not hold a pooled connection.
+    """
+    user = _token_user(db, token)
+    db.close()
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials"
+        )
+    return user
+
+def get_websocket_user(
+    token: str = Query(...),
+    db: Session = Depends(get_db)
+) -> User:
+    """Authenticate a WebSocket from a ?token= query parameter"""
+    user = _token_user(db, token)
+    db.close()
+    if user is None:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION)
+    return user
+
+def get_bbox(
+    bbox: Optional[str] = Query(None, description="Viewport as x0,y0,x1,y1 in map pixels")
+) -> Optional[Bounds]:
+    """Optional viewport rectangle from the ``bbox`` query parameter"""
+    if bbox is None:
+        return None
+    try:
+        return parse_bbox(bbox)
+    except ValueError as error:
+        raise ValidationError(str(error))
@@ -4,6 +4,7 @@ from .auth import router as auth_router
 from .maps import router as maps_router  
 from .boats import router as boats_router
 from .positions import router as positions_router
+from .jobs import router as jobs_router
 
 api_router = APIRouter()
 
@@ -11,4 +12,5 @@ api_router.include_router(auth_router, prefix="/auth", tags=["authentication"])
 api_router.include_router(maps_router, prefix="/maps", tags=["maps"])
 api_router.include_router(boats_router, prefix="/boats", tags=["boats"])
 api_router.include_router(positions_router, prefix="/positions", tags=["positions"])
+api_router.include_router(jobs_router, prefix="/jobs", tags=["jobs"])
 
@@ -0,0 +1,118 @@
+# backend/app/api/v1/aio.py
+"""Async handlers for the hot read and drag endpoints.
+
+Included ahead of the sync routers when ``settings.DATABASE_ASYNC`` is on,
+so these paths are served on the event loop instead of the threadpool;
+every other endpoint keeps its sync handler. Each handler runs the sync
+router's response builder through ``AsyncSession.run_sync``, so the two
+modes share one code path.
+"""
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, Header, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from ...core.geometry import Bounds
+from ...core.database import get_async_db
+from ...core.serialization import ALTERNATE_RESPONSES
+from ...schemas.boat_listing import BoatListingResponse, BoatSort
+from ...schemas.boat_position import BoatPositionUpdate, BoatPositionResponse
+from ...schemas.map import MapResponse
+from ...schemas.composite import MapWithBoats
+from ...services.aio import AsyncBoatService
+from ..deps import get_bbox, get_current_user_async
+from .boats import build_boats_response
+from .maps import build_map_response, build_maps_response
+from .positions import build_positions_response
+
+router = APIRouter()
+
+@router.get("/boats/", response_model=List[BoatListingResponse], tags=["boats"])
+async def read_boats_async(
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None),
+    search: Optional[str] = Query(None),
+    mapped_only: Optional[bool] = Query(None),
+    section: Optional[str] = Query(None),
+    min_length: Optional[float] = Query(None, ge=0, description="Shortest length in feet"),
+    max_length: Optional[float] = Query(None, ge=0, description="Longest length in feet"),
+    sort: BoatSort = Query("index"),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Any = Depends(get_current_user_async)
+) -> Any:
+    """Retrieve boats with filtering and pagination"""
+    return await db.run_sync(
+        build_boats_response,
+        response,
+        if_none_match,
+        limit=limit,
+        cursor=cursor,
+        skip=skip,
+        search=search,
+        mapped_only=mapped_only,
+        section=section,
+        min_length=min_length,
+        max_length=max_length,
+        sort=sort
+    )
+
+@router.get("/maps/", response_model=List[MapResponse], tags=["maps"])
+async def read_maps_async(
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None),
+    active_only: bool = Query(True),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Any = Depends(get_current_user_async)
+) -> Any:
+    """Retrieve maps with pagination"""
+    return await db.run_sync(build_maps_response, response, limit, cursor, skip, active_only)
+
+@router.get(
+    "/maps/{map_id}", response_model=MapWithBoats, responses=ALTERNATE_RESPONSES, tags=["maps"]
+)
+async def read_map_async(
+    map_id: int,
+    accept: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Any = Depends(get_current_user_async)
+) -> Any:
+    """Get map with all boat positions (served from the snapshot cache when warm)"""
+    return await db.run_sync(build_map_response, map_id, accept, if_none_match)
+
+@router.get(
+    "/positions/map/{map_id}",
+    response_model=List[BoatPositionResponse],
+    responses=ALTERNATE_RESPONSES,
+    tags=["positions"]
+)
+async def read_positions_by_map_async(
+    map_id: int,
+    response: Response,
+    accept: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
+    bbox: Optional[Bounds] = Depends(get_bbox),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Any = Depends(get_current_user_async)
+) -> Any:
+    """Get all boat positions for a specific map (optionally within a bbox viewport)"""
+    return await db.run_sync(
+        build_positions_response, map_id, response, accept, if_none_match, bbox
+    )
+
+@router.put("/positions/{position_id}", response_model=BoatPositionResponse, tags=["positions"])
+async def update_position_async(
+    position_id: int,
+    position_update: BoatPositionUpdate,
+    reject_overlaps: bool = Query(False, description="Answer 409 if the footprint overlaps another"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Any = Depends(get_current_user_async)
+) -> Any:
+    """Update boat position"""
+    position = await AsyncBoatService.update_position(
+        db, position_id, position_update, reject_overlaps=reject_overlaps
+    )
+    return position
@@ -1,34 +1,103 @@
 # backend/app/api/v1/boats.py
-from typing import Any, List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from datetime import datetime
+from typing import Any, List, Literal, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, UploadFile, File
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from ...core.database import get_db
-from ...schemas.boat_listing import BoatListingCreate, BoatListingUpdate, BoatListingResponse
+from ...core.conditional import etag_matches, make_etag, not_modified, set_etag
+from ...core.config import settings
+from ...core.pagination import set_cursor_headers
+from ...core.serialization import fast_list_response
+from ...schemas.boat_listing import (
+    BoatListingCreate, BoatListingUpdate, BoatListingResponse, BoatImportResult, BoatSort
+)
+from ...schemas.history import PositionHistoryEntry
 from ...services.boat import BoatService
-from ..deps import get_current_user
+from ...services.boat_import import BoatImportService
+from ...services.history import HistoryService
+from ...services.export import ExportService, EXPORT_FORMATS
+from ..deps import get_current_user, get_current_admin_user
 
 router = APIRouter()
 
+def build_boats_response(
+    db: Session,
+    response: Response,
+    if_none_match: Optional[str],
+    **filters: Any
+) -> Any:
+    """Boat list page for ``read_boats`` (shared with the async route)"""
+    etag = make_etag("boats", BoatService.get_boats_revision(db))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    
+    page = BoatService.get_boats_page(db, **filters)
+    set_cursor_headers(response, page)
+    set_etag(response, etag)
+    if settings.FAST_JSON:
+        return fast_list_response(page["items"], BoatListingResponse, response)
+    return page["items"]
+
 @router.get("/", response_model=List[BoatListingResponse])
 def read_boats(
+    response: Response,
     skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=100),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None),
     search: Optional[str] = Query(None),
     mapped_only: Optional[bool] = Query(None),
     section: Optional[str] = Query(None),
+    min_length: Optional[float] = Query(None, ge=0, description="Shortest length in feet"),
+    max_length: Optional[float] = Query(None, ge=0, description="Longest length in feet"),
+    sort: BoatSort = Query("index"),
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     current_user: Any = Depends(get_current_user)
 ) -> Any:
-    """Retrieve boats with filtering and pagination"""
-    boats = BoatService.get_boats(
-        db, 
-        skip=skip, 
-        limit=limit, 
-        search=search, 
+    """Retrieve boats with filtering and pagination
+    
+    Pass the X-Next-Cursor / X-Prev-Cursor response headers back as
+    ``cursor`` for keyset pagination; ``skip`` is ignored with a cursor.
+    The ETag tracks every boat write, so an unchanged list answers 304.
+    """
+    return build_boats_response(
+        db,
+        response,
+        if_none_match,
+        limit=limit,
+        cursor=cursor,
+        skip=skip,
+        search=search,
         mapped_only=mapped_only,
-        section=section
+        section=section,
+        min_length=min_length,
+        max_length=max_length,
+        sort=sort
+    )
+
+@router.get("/export")
+def export_boats(
+    format: Literal["csv", "ndjson"] = Query("csv"),
+    search: Optional[str] = Query(None),
+    mapped_only: Optional[bool] = Query(None),
+    section: Optional[str] = Query(None),
+    min_length: Optional[float] = Query(None, ge=0),
+    max_length: Optional[float] = Query(None, ge=0),
+    sort: BoatSort = Query("index"),
+    db: Session = Depends(get_db),
+    current_user: Any = Depends(get_current_user)
+) -> Any:
+    """Stream every boat listing matching the filters as CSV or NDJSON"""
+    query = ExportService.boats_query(
+        db, search=search, mapped_only=mapped_only, section=section,
+        min_length=min_length, max_length=max_length, sort=sort
+    )
+    return StreamingResponse(
+        ExportService.stream(query, format),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="boats.{format}"'}
     )
-    return boats
 
 @router.post("/", response_model=BoatListingResponse)
 def create_boat(
@@ -40,6 +109,21 @@ def create_boat(
     boat = BoatService.create_boat(db, boat_in)
     return boat
 
+@router.post("/import", response_model=BoatImportResult)
+def import_boats(
+    file: UploadFile = File(...),
+    batch_size: int = Query(1000, ge=1, le=10000),
+    db: Session = Depends(get_db),
+    current_admin: Any = Depends(get_current_admin_user)
+) -> Any:
+    """Bulk import boat listings from a CSV or XLSX upload (admin only)
+    
+    Rows are streamed, validated and inserted in batches; invalid rows and
+    duplicate indexes are reported per row and skipped.
+    """
+    rows = BoatImportService.iter_upload_rows(file.file, file.filename)
+    return BoatImportService.import_boats(db, rows, batch_size=batch_size)
+
 @router.get("/{boat_id}", response_model=BoatListingResponse)
 def read_boat(
     boat_id: int,
@@ -52,6 +136,20 @@ def read_boat(
         raise HTTPException(status_code=404, detail="Boat not found")
     return boat
 
+@router.get("/{boat_id}/history", response_model=List[PositionHistoryEntry])
+def read_boat_history(
+    boat_id: int,
+    until: Optional[datetime] = Query(None, description="Only changes at or before this time"),
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    current_user: Any = Depends(get_current_user)
+) -> Any:
+    """Where a boat has sat on the maps, newest change first
+    
+    Page back through older changes by passing the last ``ts`` as ``until``.
+    """
+    return HistoryService.get_boat_history(db, boat_id, until=until, limit=limit)
+
 @router.get("/index/{index}", response_model=BoatListingResponse)
 def read_boat_by_index(
     index: int,
@@ -0,0 +1,82 @@
+# backend/app/api/v1/jobs.py
+from typing import Any
+from fastapi import APIRouter, Depends, File, Query, Response, UploadFile, status
+from sqlalchemy.orm import Session
+from ...core.database import get_db
+from ...core.exceptions import ConflictError
+from ...core.jobs import SUCCEEDED, Job
+from ...core.config import settings
+from ...schemas.job import JobResponse
+from ...schemas.layout import LayoutRequest
+from ...services.jobs import JobService
+from ..deps import get_current_user, get_current_admin_user
+
+router = APIRouter()
+
+def _accepted(job: Job, response: Response) -> Job:
+    """202 with the URL to poll"""
+    response.status_code = status.HTTP_202_ACCEPTED
+    response.headers["Location"] = f"{settings.API_V1_STR}/jobs/{job.id}"
+    return job
+
+@router.post("/maps/{map_id}/layout", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+def submit_layout(
+    map_id: int,
+    layout_in: LayoutRequest,
+    response: Response,
+    db: Session = Depends(get_db),
+    current_user: Any = Depends(get_current_admin_user)
+) -> Any:
+    """Run POST /maps/{id}/layout as a background job (admin only)"""
+    job = JobService.submit_layout(
+        db, map_id,
+        owner_id=current_user.id,
+        boat_ids=layout_in.boat_ids,
+        section=layout_in.section,
+        region=tuple(layout_in.region) if layout_in.region else None,
+        spacing=layout_in.spacing,
+        pixels_per_foot=layout_in.pixels_per_foot,
+        time_budget=layout_in.time_budget,
+        dry_run=layout_in.dry_run
+    )
+    return _accepted(job, response)
+
+@router.post("/maps/{map_id}/overlaps", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+def submit_overlaps(
+    map_id: int,
+    response: Response,
+    db: Session = Depends(get_db),
+    current_user: Any = Depends(get_current_user)
+) -> Any:
+    """Run GET /maps/{id}/overlaps as a background job"""
+    return _accepted(JobService.submit_overlaps(db, map_id, owner_id=current_user.id), response)
+
+@router.post("/boats/import", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+def submit_import(
+    response: Response,
+    file: UploadFile = File(...),
+    batch_size: int = Query(1000, ge=1, le=10000),
+    current_admin: Any = Depends(get_current_admin_user)
+) -> Any:
+    """Run POST /boats/import as a background job (admin only)"""
+    job = JobService.submit_import(file.file.read(), file.filename, batch_size, owner_id=current_admin.id)
+    return _accepted(job, response)
+
+@router.get("/{job_id}", response_model=JobResponse)
+def read_job(job_id: str, current_user: Any = Depends(get_current_user)) -> Any:
+    """Status and progress of a job"""
+    return JobService.get_job(job_id, current_user)
+
+@router.get("/{job_id}/result")
+def read_job_result(job_id: str, current_user: Any = Depends(get_current_user)) -> Any:
+    """Result of a finished job, shaped like the matching synchronous endpoint"""
+    job = JobService.get_job(job_id, current_user)
+    if job.status != SUCCEEDED:
+        detail = f"Job is {job.status}"
+        raise ConflictError(f"{detail}: {job.error}" if job.error else detail)
+    return job.result
+
+@router.delete("/{job_id}", response_model=JobResponse)
+def cancel_job(job_id: str, current_user: Any = Depends(get_current_user)) -> Any:
+    """Cancel a job; a running job stops at its next progress report"""
+    return JobService.cancel_job(job_id, current_user)
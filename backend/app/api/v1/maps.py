@@ -1,32 +1,104 @@
 # backend/app/api/v1/maps.py
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import asyncio
+from datetime import datetime, timezone
+from typing import Any, List, Literal, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, status, Query, Response, WebSocket
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from ...core.database import get_db
+from ...core.compression import skip_compression
+from ...core.conditional import etag_matches, json_response, make_etag, not_modified
+from ...core.config import settings
+from ...core.pagination import set_cursor_headers
+from ...core.realtime import RESYNC, broadcaster
+from ...core.serialization import (
+    ALTERNATE_RESPONSES, MEDIA_TYPES, fast_list_response, negotiate, variant
+)
+from ...core.snapshot_cache import map_snapshots
 from ...schemas.map import MapCreate, MapUpdate, MapResponse
-from ...schemas.composite import MapWithBoats, BoatWithPosition
+from ...schemas.boat_position import FreePlacement, PositionOverlap
+from ...schemas.composite import MapWithBoats, MapChanges
+from ...schemas.history import MapAtTime, MapDiff
+from ...schemas.layout import LayoutRequest, LayoutResult
 from ...services.map import MapService
 from ...services.boat import BoatService
-from ..deps import get_current_user, get_current_admin_user
+from ...services.export import ExportService, EXPORT_FORMATS
+from ...services.history import HistoryService
+from ...services.layout import LayoutService
+from ..deps import get_current_user, get_current_admin_user, get_stream_user, get_websocket_user
 
 router = APIRouter()
 
+# Seconds between SSE comments that keep idle proxies from closing the stream
+SSE_KEEPALIVE_SECONDS = 15.0
+
+def build_maps_response(
+    db: Session,
+    response: Response,
+    limit: int,
+    cursor: Optional[str],
+    skip: int,
+    active_only: bool
+) -> Any:
+    """Map list page for ``read_maps`` (shared with the async route)"""
+    # Boat counts are attached by the service in the same query
+    page = MapService.get_maps_page(
+        db, limit=limit, cursor=cursor, skip=skip, active_only=active_only
+    )
+    set_cursor_headers(response, page)
+    if settings.FAST_JSON:
+        return fast_list_response(page["items"], MapResponse, response)
+    return page["items"]
+
+def build_map_response(
+    db: Session, map_id: int, accept: Optional[str], if_none_match: Optional[str]
+) -> Any:
+    """Map snapshot response for ``read_map`` (shared with the async route)"""
+    fmt = negotiate(accept)
+    media_type = MEDIA_TYPES[fmt]
+    ticket = map_snapshots.ticket(map_id)
+    revision = MapService.get_map_revision(db, map_id)
+    if revision is None:
+        raise HTTPException(status_code=404, detail="Map not found")
+    
+    etag = make_etag("map", map_id, revision, variant(fmt))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, vary="Accept")
+    
+    cached = map_snapshots.get(map_id, fmt, revision=revision)
+    if cached is not None:
+        return json_response(cached[1], etag, media_type, vary="Accept")
+    
+    body = map_snapshots.get_shared(map_id, revision, fmt)
+    if body is not None:
+        map_snapshots.store(map_id, ticket, revision, body, fmt, share=False)
+        return json_response(body, etag, media_type, vary="Accept")
+    
+    # Map, positions and listings are loaded up front in two statements
+    map_obj = MapService.get_map_snapshot(db, map_id)
+    if map_obj is None:
+        raise HTTPException(status_code=404, detail="Map not found")
+    
+    body = MapWithBoats.snapshot_body(map_obj, fmt)
+    map_snapshots.store(map_id, ticket, revision, body, fmt)
+    return json_response(body, etag, media_type, vary="Accept")
+
 @router.get("/", response_model=List[MapResponse])
 def read_maps(
+    response: Response,
     skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=100),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None),
     active_only: bool = Query(True),
     db: Session = Depends(get_db),
     current_user: Any = Depends(get_current_user)
 ) -> Any:
-    """Retrieve maps with pagination"""
-    maps = MapService.get_maps(db, skip=skip, limit=limit, active_only=active_only)
+    """Retrieve maps with pagination
     
-    # Add boat count to each map
-    for map_obj in maps:
-        map_obj.boat_count = MapService.get_map_boat_count(db, map_obj.id)
-    
-    return maps
+    Pass the X-Next-Cursor / X-Prev-Cursor response headers back as
+    ``cursor`` for keyset pagination; ``skip`` is ignored with a cursor.
+    """
+    return build_maps_response(db, response, limit, cursor, skip, active_only)
 
 @router.post("/", response_model=MapResponse)
 def create_map(
@@ -39,34 +111,130 @@ def create_map(
     map_obj.boat_count = 0
     return map_obj
 
-@router.get("/{map_id}", response_model=MapWithBoats)
+@router.get("/{map_id}", response_model=MapWithBoats, responses=ALTERNATE_RESPONSES)
 def read_map(
     map_id: int,
+    accept: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     current_user: Any = Depends(get_current_user)
 ) -> Any:
-    """Get map with all boat positions"""
-    map_obj = MapService.get_map_by_id(db, map_id)
-    if map_obj is None:
-        raise HTTPException(status_code=404, detail="Map not found")
+    """Get map with all boat positions
     
-    # Get all boats with positions for this map
-    boats_with_positions = BoatService.get_boats_with_positions(db, map_id)
+    The ETag tracks the map revision; a matching If-None-Match gets a 304
+    without loading positions or boats. Serialized snapshots are cached
+    per map revision, so repeat reads only look up the revision.
+    An Accept of the columnar or MessagePack media type returns positions
+    and boats as one array per field.
+    """
+    return build_map_response(db, map_id, accept, if_none_match)
+
+@router.get("/{map_id}/changes", response_model=MapChanges)
+def read_map_changes(
+    map_id: int,
+    since: int = Query(..., ge=0),
+    db: Session = Depends(get_db),
+    current_user: Any = Depends(get_current_user)
+) -> Any:
+    """Positions changed or deleted since a map revision (delta sync)
     
-    # Format response
-    boats = []
-    for item in boats_with_positions:
-        boat_with_pos = BoatWithPosition(
-            boat=item["boat"] if item["boat"] else None,
-            position=item["position"]
-        )
-        boats.append(boat_with_pos)
+    Start from ``map.revision`` in GET /maps/{id} and pass back the returned
+    ``revision`` as the next ``since``. ``map`` is set when the map's own
+    fields were edited in that range.
+    """
+    changes = MapService.get_map_changes(db, map_id, since)
+    return MapChanges.from_changes(changes)
+
+@router.get("/{map_id}/overlaps", response_model=List[PositionOverlap])
+def read_map_overlaps(
+    map_id: int,
+    db: Session = Depends(get_db),
+    current_user: Any = Depends(get_current_user)
+) -> Any:
+    """Every pair of positions on a map whose footprints overlap"""
+    if MapService.get_map_by_id(db, map_id) is None:
+        raise HTTPException(status_code=404, detail="Map not found")
+    
+    return [
+        PositionOverlap(position_id=first, other_position_id=second)
+        for first, second in BoatService.get_map_overlaps(db, map_id)
+    ]
+
+@router.get("/{map_id}/at", response_model=MapAtTime)
+def read_map_at(
+    map_id: int,
+    ts: datetime = Query(..., description="Point in time; without a timezone it is taken as UTC"),
+    db: Session = Depends(get_db),
+    current_user: Any = Depends(get_current_user)
+) -> Any:
+    """The map's positions and their boats as they were at ``ts``, from the position history"""
+    return HistoryService.get_map_at(db, map_id, ts)
+
+@router.get("/{map_id}/diff", response_model=MapDiff)
+def read_map_diff(
+    map_id: int,
+    start: datetime = Query(..., description="Earlier time, e.g. the start of the season"),
+    end: Optional[datetime] = Query(None, description="Later time; defaults to now"),
+    db: Session = Depends(get_db),
+    current_user: Any = Depends(get_current_user)
+) -> Any:
+    """Boats added, removed and moved on the map between two times"""
+    return HistoryService.diff_map(db, map_id, start, end or datetime.now(timezone.utc))
+
+@router.get("/{map_id}/free-space", response_model=List[FreePlacement])
+def read_map_free_space(
+    map_id: int,
+    width: float = Query(..., gt=0, le=10000),
+    height: float = Query(..., gt=0, le=10000),
+    x: Optional[float] = Query(None, description="Target point; defaults to the map centre"),
+    y: Optional[float] = Query(None),
+    rotation: float = Query(0.0, ge=-360, le=360),
+    limit: int = Query(5, ge=1, le=50),
+    db: Session = Depends(get_db),
+    current_user: Any = Depends(get_current_user)
+) -> Any:
+    """Nearest spots where a width x height footprint fits on the map"""
+    return MapService.find_free_space(db, map_id, width, height, x, y, rotation, limit)
+
+@router.post("/{map_id}/layout", response_model=LayoutResult)
+def layout_map(
+    map_id: int,
+    layout_in: LayoutRequest,
+    db: Session = Depends(get_db),
+    current_user: Any = Depends(get_current_admin_user)
+) -> Any:
+    """Place unmapped boats in a region of the map automatically (admin only)
     
-    map_obj.boat_count = len(boats)
+    Sizes come from each boat's ``size``; boats that do not fit are listed
+    in ``unplaced``. Pass ``dry_run`` to preview the layout without saving.
+    """
+    return LayoutService.auto_layout(
+        db, map_id,
+        boat_ids=layout_in.boat_ids,
+        section=layout_in.section,
+        region=tuple(layout_in.region) if layout_in.region else None,
+        spacing=layout_in.spacing,
+        pixels_per_foot=layout_in.pixels_per_foot,
+        time_budget=layout_in.time_budget,
+        dry_run=layout_in.dry_run
+    )
+
+@router.get("/{map_id}/export")
+def export_map(
+    map_id: int,
+    format: Literal["csv", "ndjson"] = Query("csv"),
+    db: Session = Depends(get_db),
+    current_user: Any = Depends(get_current_user)
+) -> Any:
+    """Stream a map's positions and their assigned boats as CSV or NDJSON"""
+    if MapService.get_map_by_id(db, map_id) is None:
+        raise HTTPException(status_code=404, detail="Map not found")
     
-    return MapWithBoats(
-        map=map_obj,
-        boats=boats
+    query = ExportService.map_positions_query(db, map_id)
+    return StreamingResponse(
+        ExportService.stream(query, format),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="map-{map_id}.{format}"'}
     )
 
 @router.put("/{map_id}", response_model=MapResponse)
@@ -91,3 +259,56 @@ def delete_map(
     MapService.delete_map(db, map_id)
     return {"message": "Map deleted successfully"}
 
+
+@router.get("/{map_id}/events", dependencies=[Depends(skip_compression)])
+async def stream_map_changes(
+    map_id: int,
+    current_user: Any = Depends(get_stream_user)
+) -> Any:
+    """Server-Sent Events feed of position changes on a map (?token= auth)"""
+    async def events():
+        with broadcaster.subscribe(map_id) as subscription:
+            yield ": subscribed\n\n"
+            while True:
+                try:
+                    message = await asyncio.wait_for(subscription.get(), SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"data: {message}\n\n"
+                if message is RESYNC:
+                    return
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.websocket("/{map_id}/ws")
+async def map_changes_socket(
+    websocket: WebSocket,
+    map_id: int,
+    current_user: Any = Depends(get_websocket_user)
+) -> None:
+    """WebSocket feed of position changes on a map (?token= auth)"""
+    with broadcaster.subscribe(map_id) as subscription:
+        await websocket.accept()
+        await websocket.send_json({"type": "subscribed", "map_id": map_id})
+        
+        async def forward():
+            async for message in subscription.messages():
+                await websocket.send_text(message)
+            await websocket.close()
+        
+        async def until_disconnect():
+            while (await websocket.receive())["type"] != "websocket.disconnect":
+                pass
+        
+        tasks = [asyncio.create_task(forward()), asyncio.create_task(until_disconnect())]
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        for task in done:
+            # A send racing the client's disconnect is expected; don't log it
+            task.exception()
@@ -1,34 +1,90 @@
 # backend/app/api/v1/positions.py
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from sqlalchemy.orm import Session
+from ...core.config import settings
 from ...core.database import get_db
-from ...schemas.boat_position import BoatPositionCreate, BoatPositionUpdate, BoatPositionResponse
+from ...core.geometry import Bounds
+from ...core.conditional import etag_matches, make_etag, not_modified, set_etag
+from ...core.serialization import (
+    ALTERNATE_RESPONSES, encoded_response, fast_list_response, negotiate, variant
+)
+from ...schemas.boat_position import (
+    BoatPositionCreate, BoatPositionUpdate, BoatPositionResponse, BoatPositionBulkUpdate
+)
+from ...schemas.composite import positions_columnar
 from ...services.boat import BoatService
-from ..deps import get_current_user
+from ...services.map import MapService
+from ..deps import get_bbox, get_current_user
 
 router = APIRouter()
 
-@router.get("/map/{map_id}", response_model=List[BoatPositionResponse])
+def build_positions_response(
+    db: Session,
+    map_id: int,
+    response: Response,
+    accept: Optional[str],
+    if_none_match: Optional[str],
+    bbox: Optional[Bounds]
+) -> Any:
+    """Position list for ``read_positions_by_map`` (shared with the async route)"""
+    fmt = negotiate(accept)
+    revision = MapService.get_map_revision(db, map_id)
+    if revision is not None:
+        etag = make_etag("positions", map_id, revision, variant(fmt))
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag, vary="Accept")
+        set_etag(response, etag, vary="Accept")
+    
+    positions = BoatService.get_positions_by_map(db, map_id, bbox)
+    if fmt != "json":
+        return encoded_response(positions_columnar(map_id, positions), fmt, response)
+    if settings.FAST_JSON:
+        return fast_list_response(positions, BoatPositionResponse, response)
+    return positions
+
+@router.get(
+    "/map/{map_id}", response_model=List[BoatPositionResponse], responses=ALTERNATE_RESPONSES
+)
 def read_positions_by_map(
     map_id: int,
+    response: Response,
+    accept: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
+    bbox: Optional[Bounds] = Depends(get_bbox),
     db: Session = Depends(get_db),
     current_user: Any = Depends(get_current_user)
 ) -> Any:
-    """Get all boat positions for a specific map"""
-    positions = BoatService.get_positions_by_map(db, map_id)
-    return positions
+    """Get all boat positions for a specific map (ETag tracks the map revision)
+    
+    Pass ``bbox=x0,y0,x1,y1`` to get only positions whose footprint meets
+    that viewport. Send ``Accept: application/vnd.pier11.columnar+json`` (or
+    ``application/msgpack``) for one array per field with palette-indexed
+    colors instead of one object per position.
+    """
+    return build_positions_response(db, map_id, response, accept, if_none_match, bbox)
 
 @router.post("/", response_model=BoatPositionResponse)
 def create_position(
     position_in: BoatPositionCreate,
+    reject_overlaps: bool = Query(False, description="Answer 409 if the footprint overlaps another"),
     db: Session = Depends(get_db),
     current_user: Any = Depends(get_current_user)
 ) -> Any:
     """Create new boat position"""
-    position = BoatService.create_position(db, position_in)
+    position = BoatService.create_position(db, position_in, reject_overlaps=reject_overlaps)
     return position
 
+@router.patch("/bulk", response_model=List[BoatPositionResponse])
+def bulk_update_positions(
+    bulk_update: BoatPositionBulkUpdate,
+    db: Session = Depends(get_db),
+    current_user: Any = Depends(get_current_user)
+) -> Any:
+    """Update many boat positions in one transaction (multi-boat drags, layout saves)"""
+    positions = BoatService.bulk_update_positions(db, bulk_update.positions)
+    return positions
+
 @router.get("/{position_id}", response_model=BoatPositionResponse)
 def read_position(
     position_id: int,
@@ -45,11 +101,14 @@ def read_position(
 def update_position(
     position_id: int,
     position_update: BoatPositionUpdate,
+    reject_overlaps: bool = Query(False, description="Answer 409 if the footprint overlaps another"),
     db: Session = Depends(get_db),
     current_user: Any = Depends(get_current_user)
 ) -> Any:
     """Update boat position"""
-    position = BoatService.update_position(db, position_id, position_update)
+    position = BoatService.update_position(
+        db, position_id, position_update, reject_overlaps=reject_overlaps
+    )
     return position
 
 @router.delete("/{position_id}")
@@ -0,0 +1,56 @@
+# backend/app/cli.py
+"""Command line tools for yard administration.
+
+    python -m app.cli import-boats boats.csv [--batch-size 1000]
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from .core.database import SessionLocal, engine
+from .models import Base
+from .services.boat_import import BoatImportService
+
+def import_boats(args: argparse.Namespace) -> int:
+    """Import boat listings from a CSV or XLSX file"""
+    path = Path(args.file)
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    start = time.perf_counter()
+    try:
+        if path.suffix.lower() == ".xlsx":
+            with path.open("rb") as stream:
+                result = BoatImportService.import_boats(
+                    db, BoatImportService.iter_xlsx_rows(stream), batch_size=args.batch_size
+                )
+        else:
+            with path.open(encoding="utf-8-sig", newline="") as stream:
+                result = BoatImportService.import_boats(
+                    db, BoatImportService.iter_csv_rows(stream), batch_size=args.batch_size
+                )
+    finally:
+        db.close()
+    elapsed = time.perf_counter() - start
+
+    for error in result["errors"]:
+        print(f"row {error['row']}: {error['message']}", file=sys.stderr)
+    summary = {key: result[key] for key in ("rows", "created", "error_count")}
+    summary["rows_per_second"] = round(result["rows"] / elapsed) if elapsed else None
+    print(json.dumps(summary))
+    return 1 if result["error_count"] else 0
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    importer = commands.add_parser("import-boats", help="bulk import boat listings")
+    importer.add_argument("file", help="CSV or XLSX file with a header row")
+    importer.add_argument("--batch-size", type=int, default=1000)
+    importer.set_defaults(handler=import_boats)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
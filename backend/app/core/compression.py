@@ -0,0 +1,222 @@
+"""Response compression middleware (gzip, and brotli when installed).
+
+Bodies below ``minimum_size`` are sent as is. Streaming responses are
+compressed chunk by chunk, flushing after each one, so exports stay
+incremental and bounded in memory. Event streams, already encoded
+bodies and routes that depend on ``skip_compression`` are never touched.
+
+brotli is pinned in requirements.txt; without it "br" is dropped from
+the configured algorithms and clients that accept gzip get gzip.
+"""
+import threading
+import zlib
+from typing import Any, Dict, List, Optional, Sequence
+from fastapi import Request
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from .metrics import register_metrics
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+# Content types that are already compressed or must reach the client unbuffered
+SKIP_CONTENT_TYPES = (
+    "text/event-stream",
+    "image/",
+    "video/",
+    "audio/",
+    "application/zip",
+    "application/gzip",
+    "application/x-gzip",
+)
+
+# Request scope flag set by ``skip_compression``
+SKIP_SCOPE_KEY = "compression.skip"
+
+async def skip_compression(request: Request) -> None:
+    """Route dependency that sends the response uncompressed"""
+    request.scope[SKIP_SCOPE_KEY] = True
+
+class GzipEncoder:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+class BrotliEncoder:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+def available_algorithms(algorithms: Sequence[str]) -> List[str]:
+    """Configured algorithms this process can actually encode"""
+    return [a for a in algorithms if a == "gzip" or (a == "br" and brotli is not None)]
+
+def choose_encoding(accept_encoding: Optional[str], algorithms: Sequence[str]) -> Optional[str]:
+    """First of ``algorithms`` the client accepts (q > 0), or None"""
+    accepted: Dict[str, float] = {}
+    for item in (accept_encoding or "").split(","):
+        coding, *params = [part.strip() for part in item.split(";")]
+        q = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    q = float(param[2:])
+                except ValueError:
+                    q = 0.0
+        if coding:
+            accepted[coding.lower()] = q
+    for algorithm in algorithms:
+        if accepted.get(algorithm, accepted.get("*", 0.0)) > 0:
+            return algorithm
+    return None
+
+class CompressionStats:
+    """Bytes in and out per encoding"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Dict[str, Dict[str, int]] = {}
+
+    def record(self, encoding: str, raw: int, sent: int) -> None:
+        with self._lock:
+            counts = self._counts.setdefault(encoding, {"responses": 0, "bytes_in": 0, "bytes_out": 0})
+            counts["responses"] += 1
+            counts["bytes_in"] += raw
+            counts["bytes_out"] += sent
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {encoding: dict(counts) for encoding, counts in self._counts.items()}
+
+compression_stats = CompressionStats()
+register_metrics("compression", compression_stats.snapshot)
+
+class CompressionMiddleware:
+    """Compress responses with the best encoding the client accepts"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        algorithms: Sequence[str] = ("br", "gzip"),
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        exclude_paths: Sequence[str] = ()
+    ):
+        self.app = app
+        self.algorithms = available_algorithms(algorithms)
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.exclude_paths = tuple(exclude_paths)
+
+    def encoder(self, encoding: str):
+        if encoding == "br":
+            return BrotliEncoder(self.brotli_quality)
+        return GzipEncoder(self.gzip_level)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.exclude_paths):
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding"), self.algorithms)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _Responder(self, scope, send, encoding)
+        await self.app(scope, receive, responder.send)
+
+class _Responder:
+    """Per-request send wrapper; decides on the first body message"""
+
+    def __init__(self, middleware: CompressionMiddleware, scope: Scope, send: Send, encoding: str):
+        self.middleware = middleware
+        self.scope = scope
+        self._send = send
+        self.encoding = encoding
+        self.start: Optional[Message] = None
+        self.encoder = None
+        self.passthrough = False
+        self.raw = self.sent = 0
+
+    def _should_compress(self, message: Message) -> bool:
+        if self.scope.get(SKIP_SCOPE_KEY):
+            return False
+        status = self.start["status"]
+        if status < 200 or status in (204, 304):
+            return False
+        headers = Headers(raw=self.start["headers"])
+        if "content-encoding" in headers:
+            return False
+        if headers.get("content-type", "").startswith(SKIP_CONTENT_TYPES):
+            return False
+        # A complete body is only worth compressing above the threshold;
+        # streamed bodies are compressed whatever their first chunk holds
+        if message.get("more_body", False):
+            return True
+        return len(message.get("body", b"")) >= self.middleware.minimum_size
+
+    def _encoded_start(self) -> Message:
+        headers = MutableHeaders(raw=self.start["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        del headers["Content-Length"]
+        # The encoded body differs byte for byte, so its validator is weak
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+        return self.start
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.encoder is None:
+            if not self._should_compress(message):
+                self.passthrough = True
+                await self._send(self.start)
+                await self._send(message)
+                return
+            self.encoder = self.middleware.encoder(self.encoding)
+            start = self._encoded_start()
+            if not more_body:
+                encoded = self.encoder.compress(body) + self.encoder.finish()
+                MutableHeaders(raw=start["headers"])["Content-Length"] = str(len(encoded))
+                compression_stats.record(self.encoding, len(body), len(encoded))
+                await self._send(start)
+                await self._send({"type": "http.response.body", "body": encoded})
+                return
+            await self._send(start)
+
+        self.raw += len(body)
+        if more_body:
+            encoded = self.encoder.compress(body) + self.encoder.flush()
+        else:
+            encoded = self.encoder.compress(body) + self.encoder.finish()
+            compression_stats.record(self.encoding, self.raw, self.sent + len(encoded))
+        self.sent += len(encoded)
+        await self._send({"type": "http.response.body", "body": encoded, "more_body": more_body})
@@ -0,0 +1,44 @@
+from typing import Any, Optional
+from fastapi import Response
+from .config import settings
+
+# Clients may cache but must revalidate with If-None-Match every time
+CACHE_CONTROL = "private, no-cache"
+
+def make_etag(*parts: Any) -> str:
+    """Strong ETag from a resource's identity and revision (None parts are skipped)
+
+    The API version is included so a deploy that changes the payload
+    shape never answers 304 for a body cached by the previous release.
+    """
+    return '"' + "-".join(str(part) for part in (settings.VERSION, *parts) if part is not None) + '"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Evaluate an If-None-Match header against an ETag (weak comparison)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+def not_modified(etag: str, vary: Optional[str] = None) -> Response:
+    """Empty 304 response carrying the current validators"""
+    response = Response(status_code=304)
+    set_etag(response, etag, vary)
+    return response
+
+def json_response(
+    body: bytes, etag: str, media_type: str = "application/json", vary: Optional[str] = None
+) -> Response:
+    """Serve an already serialized body with its validators"""
+    response = Response(content=body, media_type=media_type)
+    set_etag(response, etag, vary)
+    return response
+
+def set_etag(response: Response, etag: str, vary: Optional[str] = None) -> None:
+    """Attach validators (and the request headers they depend on) to a response"""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    if vary:
+        response.headers["Vary"] = vary
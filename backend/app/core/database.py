@@ -1,15 +1,72 @@
 # backend/app/core/database.py
-from sqlalchemy import create_engine
+import time
+from typing import Any, Dict
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from .config import settings
+from .metrics import PoolMetrics, register_metrics
+from .search import register_sqlite_functions
 
+# Trigram search functions for SQLite (Postgres provides them via pg_trgm)
+event.listen(Engine, "connect", register_sqlite_functions)
+
+def _sized_pool(url: str) -> bool:
+    """Whether the URL gets a queue pool (in-memory SQLite does not)"""
+    return not (url.startswith("sqlite") and (":memory:" in url or url.split("://", 1)[1] in ("", "/")))
+
+def engine_options(url: str, metrics: PoolMetrics, base_pool: type) -> Dict[str, Any]:
+    """Engine keyword arguments for the configured pool policy"""
+    options = {
+        "pool_pre_ping": settings.DATABASE_PRE_PING == "always",
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        "echo": settings.DEBUG,
+    }
+    if _sized_pool(url):
+        options.update(
+            poolclass=metrics.pool_class(base_pool),
+            pool_size=settings.DATABASE_POOL_SIZE,
+            max_overflow=settings.DATABASE_MAX_OVERFLOW,
+            pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        )
+    return options
+
+def ping_idle_connections(engine: Engine, idle_seconds: float) -> None:
+    """Pre-ping only connections that sat idle in the pool for a while.
+
+    Saves the round trip that ``pool_pre_ping`` adds to every checkout
+    while still catching connections dropped during quiet periods.
+    """
+    @event.listens_for(engine, "checkin")
+    def stamp_checkin(dbapi_connection, connection_record):
+        connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def ping_if_idle(dbapi_connection, connection_record, connection_proxy):
+        checked_in_at = connection_record.info.get("checked_in_at")
+        if checked_in_at is None or time.monotonic() - checked_in_at < idle_seconds:
+            return
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("SELECT 1")
+        except Exception:
+            # The pool discards this connection and retries with a fresh one
+            raise exc.DisconnectionError()
+        finally:
+            cursor.close()
+
+pool_metrics = PoolMetrics()
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_recycle=300,
-    echo=settings.DEBUG
+    **engine_options(settings.DATABASE_URL, pool_metrics, QueuePool)
 )
+pool_metrics.attach(engine)
+register_metrics("database_pool", pool_metrics.snapshot)
+if settings.DATABASE_PRE_PING == "idle":
+    ping_idle_connections(engine, settings.DATABASE_PRE_PING_IDLE_SECONDS)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
@@ -22,3 +79,36 @@ def get_db():
     finally:
         db.close()
 
+# Async drivers for each sync URL scheme
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+def async_database_url(url: str) -> str:
+    """Swap the sync driver in a database URL for its async counterpart"""
+    scheme, separator, rest = url.partition("://")
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}{separator}{rest}"
+
+# The async engine is only built in async mode so its drivers stay optional
+async_engine = None
+AsyncSessionLocal = None
+async_pool_metrics = PoolMetrics()
+if settings.DATABASE_ASYNC:
+    async_url = settings.ASYNC_DATABASE_URL or async_database_url(settings.DATABASE_URL)
+    async_engine = create_async_engine(
+        async_url,
+        **engine_options(async_url, async_pool_metrics, AsyncAdaptedQueuePool)
+    )
+    async_pool_metrics.attach(async_engine.sync_engine)
+    register_metrics("async_database_pool", async_pool_metrics.snapshot)
+    if settings.DATABASE_PRE_PING == "idle":
+        ping_idle_connections(async_engine.sync_engine, settings.DATABASE_PRE_PING_IDLE_SECONDS)
+    AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
+async def get_async_db():
+    """Async database dependency for FastAPI"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
@@ -21,6 +21,14 @@ class DuplicateError(BaseCustomException):
     status_code = status.HTTP_409_CONFLICT
     detail = "Resource already exists"
 
+class ConflictError(BaseCustomException):
+    status_code = status.HTTP_409_CONFLICT
+    detail = "Conflicts with the current state"
+
+class ServiceUnavailableError(BaseCustomException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    detail = "Service temporarily unavailable"
+
 class UnauthorizedError(BaseCustomException):
     status_code = status.HTTP_401_UNAUTHORIZED
     detail = "Authentication required"
@@ -0,0 +1,245 @@
+"""Footprints of boat positions on the map canvas.
+
+A position is drawn centred on (x, y) and rotated about that point, so its
+footprint is a ``width`` x ``height`` rectangle turned by ``rotation``
+degrees.
+"""
+import heapq
+import math
+from collections import defaultdict
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+# x0, y0, x1, y1
+Bounds = Tuple[float, float, float, float]
+Point = Tuple[float, float]
+
+# Shapes must interpenetrate by more than this to overlap; touching is fine
+OVERLAP_TOLERANCE = 1e-6
+
+def footprint_bounds(x: float, y: float, width: float, height: float, rotation: float) -> Bounds:
+    """Axis-aligned bounding box of a rotated footprint"""
+    radians = math.radians(rotation)
+    cos, sin = abs(math.cos(radians)), abs(math.sin(radians))
+    half_width = (width * cos + height * sin) / 2
+    half_height = (width * sin + height * cos) / 2
+    return (x - half_width, y - half_height, x + half_width, y + half_height)
+
+def footprint_corners(x: float, y: float, width: float, height: float, rotation: float) -> List[Point]:
+    """Corners of a rotated footprint, in drawing order"""
+    radians = math.radians(rotation)
+    cos, sin = math.cos(radians), math.sin(radians)
+    half_width, half_height = width / 2, height / 2
+    offsets = (
+        (-half_width, -half_height), (half_width, -half_height),
+        (half_width, half_height), (-half_width, half_height),
+    )
+    return [(x + dx * cos - dy * sin, y + dx * sin + dy * cos) for dx, dy in offsets]
+
+def bounds_overlap(a: Bounds, b: Bounds) -> bool:
+    """Whether two axis-aligned boxes interpenetrate"""
+    return (
+        a[0] < b[2] - OVERLAP_TOLERANCE and b[0] < a[2] - OVERLAP_TOLERANCE
+        and a[1] < b[3] - OVERLAP_TOLERANCE and b[1] < a[3] - OVERLAP_TOLERANCE
+    )
+
+def corners_overlap(a: Sequence[Point], b: Sequence[Point]) -> bool:
+    """Separating-axis test for two convex quadrilaterals (rotated rectangles)
+
+    Rectangles only need the two edge normals of each shape as candidate
+    axes; the shapes overlap unless one of those axes separates them.
+    """
+    for corners in (a, b):
+        for i in (0, 1):
+            (x0, y0), (x1, y1) = corners[i], corners[i + 1]
+            # Unnormalised normal; the tolerance is scaled to match
+            ax, ay = y0 - y1, x1 - x0
+            length = math.hypot(ax, ay)
+            if length == 0:
+                return False
+            a_dots = [px * ax + py * ay for px, py in a]
+            b_dots = [px * ax + py * ay for px, py in b]
+            tolerance = OVERLAP_TOLERANCE * length
+            if max(a_dots) <= min(b_dots) + tolerance or max(b_dots) <= min(a_dots) + tolerance:
+                return False
+    return True
+
+class GridIndex:
+    """Uniform grid of buckets over axis-aligned bounds
+
+    Each key is filed under every cell its bounds touch, so a lookup only
+    visits keys in the cells the query covers.
+    """
+
+    def __init__(self, cell_size: float):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[Hashable]] = defaultdict(list)
+
+    def _cells(self, bounds: Bounds) -> Iterable[Tuple[int, int]]:
+        size = self.cell_size
+        for cx in range(math.floor(bounds[0] / size), math.floor(bounds[2] / size) + 1):
+            for cy in range(math.floor(bounds[1] / size), math.floor(bounds[3] / size) + 1):
+                yield cx, cy
+
+    def insert(self, key: Hashable, bounds: Bounds) -> None:
+        for cell in self._cells(bounds):
+            self.cells[cell].append(key)
+
+    def candidates(self, bounds: Bounds) -> Set[Hashable]:
+        """Keys whose cells meet ``bounds`` (a superset of the true hits)"""
+        found: Set[Hashable] = set()
+        for cell in self._cells(bounds):
+            found.update(self.cells.get(cell, ()))
+        return found
+
+# Called with the fraction done; may raise to abort the computation
+Progress = Callable[[float], None]
+
+def overlapping_pairs(
+    footprints: Dict[int, Sequence[float]], progress: Optional[Progress] = None
+) -> List[Tuple[int, int]]:
+    """Pairs of ids whose footprints overlap, each as (lower id, higher id)
+
+    ``footprints`` maps an id to ``(x, y, width, height, rotation)``. Every
+    footprint is only tested against those sharing a grid cell, then by
+    bounds, then by the separating-axis test. The rare footprint far larger
+    than a cell is kept out of the grid and checked by bounds instead.
+    ``progress`` is called every thousand footprints.
+    """
+    if not footprints:
+        return []
+    bounds = {key: footprint_bounds(*shape) for key, shape in footprints.items()}
+    sizes = {key: max(b[2] - b[0], b[3] - b[1]) for key, b in bounds.items()}
+    # Cells about twice the typical footprint keep each one in few cells
+    cell_size = max(2 * sum(sizes.values()) / len(sizes), 1.0)
+    index = GridIndex(cell_size)
+    oversized: List[int] = []
+    corners: Dict[int, List[Point]] = {}
+
+    def shape(key: int) -> List[Point]:
+        if key not in corners:
+            corners[key] = footprint_corners(*footprints[key])
+        return corners[key]
+
+    pairs = set()
+    for done, key in enumerate(sorted(footprints)):
+        if progress is not None and done % 1000 == 0:
+            progress(done / len(footprints))
+        box = bounds[key]
+        is_oversized = sizes[key] > 8 * cell_size
+        others = set(bounds) if is_oversized else index.candidates(box).union(oversized)
+        for other in others:
+            if other == key or (other > key and not is_oversized):
+                continue
+            if bounds_overlap(box, bounds[other]) and corners_overlap(shape(key), shape(other)):
+                pairs.add((min(key, other), max(key, other)))
+        if is_oversized:
+            oversized.append(key)
+        else:
+            index.insert(key, box)
+    return sorted(pairs)
+
+def obstacle_index(footprints: Iterable[Sequence[float]]) -> Tuple[GridIndex, Dict[int, List[Point]], Dict[int, Bounds]]:
+    """Grid index over footprints, with their corners and bounds by key"""
+    bounds: Dict[int, Bounds] = {}
+    corners: Dict[int, List[Point]] = {}
+    for key, shape in enumerate(footprints):
+        bounds[key] = footprint_bounds(*shape)
+        corners[key] = footprint_corners(*shape)
+    sizes = [max(b[2] - b[0], b[3] - b[1]) for b in bounds.values()]
+    index = GridIndex(max(2 * sum(sizes) / len(sizes), 1.0) if sizes else 100.0)
+    for key, box in bounds.items():
+        index.insert(key, box)
+    return index, corners, bounds
+
+def free_placements(
+    area: Bounds,
+    footprints: Iterable[Sequence[float]],
+    width: float,
+    height: float,
+    rotation: float = 0.0,
+    target: Optional[Point] = None,
+    limit: int = 5,
+    step: Optional[float] = None,
+    max_candidates: int = 200_000
+) -> List[Tuple[float, float, float]]:
+    """Free spots for a ``width`` x ``height`` footprint, nearest ``target`` first
+    
+    Candidate centres lie on a lattice of spacing ``step`` (half the shorter
+    side by default) anchored on ``target``; they are visited ring by ring
+    so the search stops as soon as ``limit`` spots are found. A spot must
+    lie inside ``area`` and clear every footprint and every spot already
+    returned. Returns ``(x, y, distance)`` tuples.
+    """
+    if target is None:
+        target = ((area[0] + area[2]) / 2, (area[1] + area[3]) / 2)
+    step = step or max(min(width, height) / 2, 1.0)
+    index, corners, bounds = obstacle_index(footprints)
+    _, _, half_x, half_y = footprint_bounds(0, 0, width, height, rotation)
+    # Lattice points whose footprint fits inside the area
+    lo_i = math.ceil((area[0] + half_x - target[0]) / step)
+    hi_i = math.floor((area[2] - half_x - target[0]) / step)
+    lo_j = math.ceil((area[1] + half_y - target[1]) / step)
+    hi_j = math.floor((area[3] - half_y - target[1]) / step)
+    if lo_i > hi_i or lo_j > hi_j:
+        return []
+    max_ring = max(abs(lo_i), abs(hi_i), abs(lo_j), abs(hi_j))
+
+    found: List[Tuple[float, float, float]] = []
+    placed: List[List[Point]] = []
+    heap: List[Tuple[float, int, int]] = []
+    visited = 0
+
+    def ring(r: int) -> Iterable[Tuple[int, int]]:
+        if r == 0:
+            yield 0, 0
+            return
+        for i in range(-r, r + 1):
+            yield i, -r
+            yield i, r
+        for j in range(-r + 1, r):
+            yield -r, j
+            yield r, j
+
+    def is_free(x: float, y: float) -> bool:
+        shape = footprint_corners(x, y, width, height, rotation)
+        box = (x - half_x, y - half_y, x + half_x, y + half_y)
+        for key in index.candidates(box):
+            if bounds_overlap(box, bounds[key]) and corners_overlap(shape, corners[key]):
+                return False
+        if any(corners_overlap(shape, other) for other in placed):
+            return False
+        placed.append(shape)
+        return True
+
+    def visit() -> bool:
+        """Check the nearest queued point; True once ``limit`` spots are found"""
+        nonlocal visited
+        distance, i, j = heapq.heappop(heap)
+        visited += 1
+        x, y = target[0] + i * step, target[1] + j * step
+        if is_free(x, y):
+            found.append((x, y, distance))
+        return len(found) >= limit or visited >= max_candidates
+
+    for r in range(max_ring + 1):
+        for i, j in ring(r):
+            if lo_i <= i <= hi_i and lo_j <= j <= hi_j:
+                heapq.heappush(heap, (math.hypot(i, j) * step, i, j))
+        # Points on later rings are at least (r + 1) steps away
+        while heap and heap[0][0] < (r + 1) * step:
+            if visit():
+                return found
+    while heap:
+        if visit():
+            break
+    return found
+
+def parse_bbox(value: str) -> Bounds:
+    """Parse an ``x0,y0,x1,y1`` query value (raises ValueError)"""
+    parts = value.split(",")
+    if len(parts) != 4:
+        raise ValueError("bbox must be x0,y0,x1,y1")
+    x0, y0, x1, y1 = (float(part) for part in parts)
+    if not all(math.isfinite(v) for v in (x0, y0, x1, y1)) or x0 > x1 or y0 > y1:
+        raise ValueError("bbox must be finite with x0 <= x1 and y0 <= y1")
+    return (x0, y0, x1, y1)
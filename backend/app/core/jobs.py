@@ -0,0 +1,326 @@
+"""Background jobs for CPU-heavy work, run in a process pool.
+
+Layout searches, overlap scans and large imports would hold a threadpool
+thread and the GIL for seconds inside a request. Instead a route submits
+a job and returns its id; the work runs in a worker process while the
+client polls for status and progress, then fetches the result.
+
+Task functions are module-level (so they pickle) and take a
+``JobContext`` first. ``JobContext.progress`` reports how far the task
+has got and is also where a cancelled job stops: it raises
+``JobCancelled`` once the job has been cancelled. Workers send progress
+back over a queue, and cancellation reaches them through a shared array
+of flags, one slot per job that is queued or running.
+
+Jobs live in the memory of the process that accepted them, so with
+several uvicorn workers a client must poll the worker it submitted to
+(sticky sessions), or run the API with a single worker.
+"""
+import logging
+import multiprocessing
+import threading
+import time
+import uuid
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from .config import settings
+from .exceptions import ServiceUnavailableError
+from .metrics import register_metrics
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED = (SUCCEEDED, FAILED, CANCELLED)
+
+# Seconds between progress messages a worker sends for one job
+PROGRESS_INTERVAL = 0.1
+
+class JobCancelled(Exception):
+    """Raised inside a task whose job was cancelled"""
+
+# Set in each worker process by ``_init_worker``
+_progress_queue = None
+_cancel_flags = None
+
+def _init_worker(progress_queue, cancel_flags) -> None:
+    global _progress_queue, _cancel_flags
+    _progress_queue, _cancel_flags = progress_queue, cancel_flags
+
+class JobContext:
+    """Handed to a task: reports progress and notices cancellation"""
+
+    def __init__(self, job_id: str, slot: int):
+        self.job_id = job_id
+        self.slot = slot
+        self._sent_at = 0.0
+
+    def cancelled(self) -> bool:
+        return _cancel_flags is not None and bool(_cancel_flags[self.slot])
+
+    def progress(self, fraction: float, message: Optional[str] = None) -> None:
+        """Report progress (0-1); raises JobCancelled if the job was cancelled"""
+        if self.cancelled():
+            raise JobCancelled()
+        now = time.monotonic()
+        if _progress_queue is not None and (now - self._sent_at >= PROGRESS_INTERVAL or fraction >= 1):
+            self._sent_at = now
+            _progress_queue.put((self.job_id, min(max(fraction, 0.0), 1.0), message))
+
+def _run(fn: Callable, job_id: str, slot: int, args: tuple, kwargs: dict) -> Tuple[datetime, Any]:
+    """Worker entry point: announce the start, run the task, return when it started and its result"""
+    started_at = datetime.now(timezone.utc)
+    context = JobContext(job_id, slot)
+    context.progress(0.0)
+    return started_at, fn(context, *args, **kwargs)
+
+class Job:
+    """State of one submitted job, as seen by the API"""
+
+    def __init__(self, kind: str, owner_id: Optional[int]):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.owner_id = owner_id
+        self.status = QUEUED
+        self.progress = 0.0
+        self.message: Optional[str] = None
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.created_at = datetime.now(timezone.utc)
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.cancel_requested = False
+        self.slot: Optional[int] = None
+        self.future: Optional[Future] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED
+
+class JobManager:
+    """Runs tasks in a bounded process pool and tracks their jobs
+
+    At most ``max_workers`` tasks run at once and at most ``max_pending``
+    jobs may be queued or running; further submissions are refused.
+    Finished jobs are forgotten ``retention`` seconds after they end.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_pending: int = 16,
+        retention: float = 3600.0,
+        start_method: str = "spawn"
+    ):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.retention = retention
+        self.start_method = start_method
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, Job] = {}
+        self._free_slots = list(range(max_pending))
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._finisher: Optional[ThreadPoolExecutor] = None
+        self._progress_queue = None
+        self._cancel_flags = None
+        self._listener: Optional[threading.Thread] = None
+        self.submitted = self.succeeded = self.failed = self.cancelled = self.rejected = 0
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        # Caller holds the lock. Started on first use so importing the app
+        # never forks or spawns
+        if self._pool is None:
+            context = multiprocessing.get_context(self.start_method)
+            self._progress_queue = context.Queue()
+            self._cancel_flags = context.Array("b", self.max_pending, lock=False)
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(self._progress_queue, self._cancel_flags),
+            )
+            self._listener = threading.Thread(
+                target=self._receive_progress, args=(self._progress_queue,), name="job-progress", daemon=True
+            )
+            self._listener.start()
+            # ``finish`` callbacks write to the database, so they get threads of
+            # their own instead of holding up the executor's management thread
+            self._finisher = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="job-finish"
+            )
+        return self._pool
+
+    def _receive_progress(self, progress_queue) -> None:
+        while True:
+            try:
+                item = progress_queue.get()
+            except (EOFError, OSError):
+                return
+            if item is None:
+                return
+            job_id, fraction, message = item
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is None or job.finished:
+                    continue
+                if job.status == QUEUED:
+                    job.status, job.started_at = RUNNING, datetime.now(timezone.utc)
+                job.progress = fraction
+                if message is not None:
+                    job.message = message
+
+    def _prune(self) -> None:
+        # Caller holds the lock
+        cutoff = time.time() - self.retention
+        for job_id in [
+            job.id for job in self._jobs.values()
+            if job.finished and job.finished_at.timestamp() < cutoff
+        ]:
+            del self._jobs[job_id]
+
+    def submit(
+        self,
+        kind: str,
+        fn: Callable,
+        *args: Any,
+        owner_id: Optional[int] = None,
+        finish: Optional[Callable[[Any], Any]] = None,
+        **kwargs: Any
+    ) -> Job:
+        """Queue ``fn(context, *args, **kwargs)`` in a worker process
+
+        ``finish`` runs in this process on the task's return value, e.g. to
+        write results through the services; what it returns becomes the
+        job's result.
+        """
+        job = Job(kind, owner_id)
+        with self._lock:
+            pool = self._ensure_pool()
+            finisher = self._finisher
+            self._prune()
+            if not self._free_slots:
+                self.rejected += 1
+                raise ServiceUnavailableError("Too many jobs in progress; try again later")
+            job.slot = self._free_slots.pop()
+            self._cancel_flags[job.slot] = 0
+            self._jobs[job.id] = job
+            self.submitted += 1
+        try:
+            job.future = pool.submit(_run, fn, job.id, job.slot, args, kwargs)
+        except RuntimeError as exc:
+            # Broken or shut-down pool: give the slot back and forget the job
+            with self._lock:
+                del self._jobs[job.id]
+                self._free_slots.append(job.slot)
+                self.submitted -= 1
+            logger.exception("Could not queue job %s (%s)", job.id, job.kind)
+            raise ServiceUnavailableError("Job workers are unavailable; try again later") from exc
+        job.future.add_done_callback(lambda future: self._complete(job, future, finish, finisher))
+        return job
+
+    def _complete(
+        self,
+        job: Job,
+        future: Future,
+        finish: Optional[Callable[[Any], Any]],
+        finisher: ThreadPoolExecutor
+    ) -> None:
+        # Runs on the executor's management thread once the task is done
+        if finish is not None and not future.cancelled() and future.exception() is None:
+            finisher.submit(self._finish, job, future, finish)
+        else:
+            self._finish(job, future, None)
+
+    def _finish(self, job: Job, future: Future, finish: Optional[Callable[[Any], Any]]) -> None:
+        status, result, error, started_at = SUCCEEDED, None, None, None
+        try:
+            # Progress messages may still be in flight, so take the start time from the worker
+            started_at, result = future.result()
+            if finish is not None and not job.cancel_requested:
+                result = finish(result)
+            if job.cancel_requested:
+                status, result = CANCELLED, None
+        except (CancelledError, JobCancelled):
+            status = CANCELLED
+        except Exception as exc:
+            logger.exception("Job %s (%s) failed", job.id, job.kind)
+            status, error = FAILED, getattr(exc, "detail", None) or str(exc) or type(exc).__name__
+        with self._lock:
+            job.status, job.result, job.error = status, result, error
+            job.finished_at = datetime.now(timezone.utc)
+            job.started_at = job.started_at or started_at
+            if status == SUCCEEDED:
+                job.progress = 1.0
+                self.succeeded += 1
+            elif status == FAILED:
+                self.failed += 1
+            else:
+                self.cancelled += 1
+            self._free_slots.append(job.slot)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """Cancel a job: queued jobs never start, running ones stop at their next progress call"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.finished:
+                return job
+            job.cancel_requested = True
+            self._cancel_flags[job.slot] = 1
+        # Outside the lock: a successful cancel runs _complete right away
+        job.future.cancel()
+        return job
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Job]:
+        """Block until a job has finished (for tests and scripts)"""
+        job = self.get(job_id)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while job is not None and not job.finished:
+            if deadline is not None and time.monotonic() > deadline:
+                break
+            time.sleep(0.01)
+        return job
+
+    def shutdown(self) -> None:
+        """Cancel queued jobs and stop the workers"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+            finisher, self._finisher = self._finisher, None
+            running = [job for job in self._jobs.values() if not job.finished]
+        for job in running:
+            self.cancel(job.id)
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+            finisher.shutdown(wait=True)
+            self._progress_queue.put(None)
+            self._listener.join(timeout=1.0)
+
+    def stats(self) -> Dict[str, Any]:
+        """Job counters and current load"""
+        with self._lock:
+            statuses: List[str] = [job.status for job in self._jobs.values()]
+        return {
+            "workers": self.max_workers,
+            "queued": statuses.count(QUEUED),
+            "running": statuses.count(RUNNING),
+            "submitted": self.submitted,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "rejected": self.rejected,
+        }
+
+jobs = JobManager(
+    max_workers=settings.JOBS_MAX_WORKERS,
+    max_pending=settings.JOBS_MAX_PENDING,
+    retention=settings.JOBS_RETENTION_SECONDS,
+    start_method=settings.JOBS_START_METHOD,
+)
+register_metrics("jobs", jobs.stats)
@@ -0,0 +1,106 @@
+import threading
+import time
+from typing import Any, Callable, Dict
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+
+# Named metric sources reported by GET /metrics
+_sources: Dict[str, Callable[[], Dict[str, Any]]] = {}
+
+def register_metrics(name: str, source: Callable[[], Dict[str, Any]]) -> None:
+    """Register a callable returning a dict of metrics under a name"""
+    _sources[name] = source
+
+def collect_metrics() -> Dict[str, Any]:
+    """Snapshot every registered metric source"""
+    return {name: source() for name, source in _sources.items()}
+
+class PoolMetrics:
+    """Connection pool counters collected from pool events"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.engine = None
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero all counters"""
+        with self._lock:
+            self.checkouts = 0
+            self.checkins = 0
+            self.connects = 0
+            self.invalidations = 0
+            self.timeouts = 0
+            self.wait_total = 0.0
+            self.wait_max = 0.0
+
+    def attach(self, engine: Engine) -> None:
+        """Listen to the pool events of an engine"""
+        self.engine = engine
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "invalidate", self._on_invalidate)
+        event.listen(engine, "soft_invalidate", self._on_invalidate)
+
+    def pool_class(self, base: type) -> type:
+        """Subclass a pool so time spent waiting for a checkout is recorded"""
+        metrics = self
+
+        class TimedPool(base):
+            def connect(self):
+                start = time.perf_counter()
+                try:
+                    return super().connect()
+                except exc.TimeoutError:
+                    metrics._record(timeouts=1)
+                    raise
+                finally:
+                    metrics._record_wait(time.perf_counter() - start)
+
+        TimedPool.__name__ = TimedPool.__qualname__ = f"Timed{base.__name__}"
+        return TimedPool
+
+    def _record(self, **increments: int) -> None:
+        with self._lock:
+            for name, value in increments.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def _record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        self._record(checkouts=1)
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        self._record(checkins=1)
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        self._record(connects=1)
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception):
+        self._record(invalidations=1)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current counters plus the live pool state"""
+        with self._lock:
+            data = {
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "wait_ms_total": round(self.wait_total * 1000, 3),
+                "wait_ms_avg": round(self.wait_total * 1000 / self.checkouts, 3) if self.checkouts else 0.0,
+                "wait_ms_max": round(self.wait_max * 1000, 3),
+            }
+
+        pool = self.engine.pool if self.engine is not None else None
+        if pool is not None:
+            data["pool"] = type(pool).__name__
+            for name in ("size", "checkedin", "checkedout", "overflow"):
+                if hasattr(pool, name):
+                    data[name] = getattr(pool, name)()
+        return data
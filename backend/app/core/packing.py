@@ -0,0 +1,169 @@
+"""Auto-layout: pack boat footprints into a region of the map.
+
+Boats are packed in shelves (rows) across the region, either lying along
+the rows or standing side by side across them, stepping past positions
+already on the map. Several orientations and orderings are tried, then
+shuffled variants until the time budget runs out; the layout placing the
+most boats in the smallest area wins.
+"""
+import random
+import time
+from typing import Dict, Hashable, List, NamedTuple, Optional, Sequence, Tuple
+from .geometry import Bounds, Progress, bounds_overlap, corners_overlap, footprint_corners, obstacle_index
+
+class PackItem(NamedTuple):
+    key: Hashable
+    length: float
+    beam: float
+
+class Placement(NamedTuple):
+    key: Hashable
+    x: float
+    y: float
+    width: float
+    height: float
+    rotation: float
+
+class PackResult(NamedTuple):
+    placements: List[Placement]
+    unplaced: List[Hashable]
+    attempts: int
+    strategy: str
+
+# (rotation, ordering) tried first, in order; rotation 90 stands boats side by side
+STRATEGIES = (
+    (90.0, "beam"),
+    (90.0, "length"),
+    (0.0, "length"),
+    (0.0, "beam"),
+)
+
+def _order(items: Sequence[PackItem], rotation: float, ordering: str) -> List[PackItem]:
+    # Shelves want the tallest item of each row first
+    row_height = (lambda item: item.length) if rotation == 90 else (lambda item: item.beam)
+    other = (lambda item: item.beam) if ordering == "beam" else (lambda item: item.length)
+    return sorted(items, key=lambda item: (row_height(item), other(item)), reverse=True)
+
+class _Shelf:
+    __slots__ = ("y", "height", "cursor")
+
+    def __init__(self, y: float, height: float, cursor: float):
+        self.y, self.height, self.cursor = y, height, cursor
+
+def _shelf_pack(
+    area: Bounds,
+    items: Sequence[PackItem],
+    rotation: float,
+    spacing: float,
+    obstacles
+) -> Tuple[List[Placement], List[Hashable]]:
+    """First-fit decreasing-height shelves that step past obstacles"""
+    index, corners, bounds = obstacles
+    placements: List[Placement] = []
+    unplaced: List[Hashable] = []
+    x0, y0, x1, y1 = area
+    shelves: List[_Shelf] = []
+    next_y = y0
+
+    def blocker(box: Bounds) -> Optional[float]:
+        """Right edge of the furthest obstacle within ``box``, or None if it is clear"""
+        shape = footprint_corners(
+            (box[0] + box[2]) / 2, (box[1] + box[3]) / 2, box[2] - box[0], box[3] - box[1], 0
+        )
+        edge = None
+        for key in index.candidates(box):
+            if bounds_overlap(box, bounds[key]) and corners_overlap(shape, corners[key]):
+                edge = bounds[key][2] if edge is None else max(edge, bounds[key][2])
+        return edge
+
+    def fit(shelf: _Shelf, w: float, h: float) -> Optional[float]:
+        """Left edge for a w x h item on a shelf, stepping past obstacles"""
+        cursor = shelf.cursor
+        while cursor + w <= x1:
+            # Keep ``spacing`` clear of obstacles on every side
+            edge = blocker((cursor - spacing / 2, shelf.y - spacing / 2,
+                            cursor + w + spacing / 2, shelf.y + h + spacing / 2))
+            if edge is None:
+                return cursor
+            cursor = max(edge + spacing / 2, cursor + 1.0)
+        return None
+
+    for item in items:
+        w, h = (item.beam, item.length) if rotation == 90 else (item.length, item.beam)
+        left = None
+        for shelf in shelves:
+            if h <= shelf.height and shelf.cursor + w <= x1:
+                left = fit(shelf, w, h)
+                if left is not None:
+                    break
+        while left is None and next_y + h <= y1:
+            # Open a shelf below the last; it is as tall as its first boat
+            shelf = _Shelf(next_y, h, x0)
+            shelves.append(shelf)
+            next_y += h + spacing
+            left = fit(shelf, w, h)
+        if left is None:
+            unplaced.append(item.key)
+            continue
+        placements.append(Placement(item.key, left + w / 2, shelf.y + h / 2, item.length, item.beam, rotation))
+        shelf.cursor = left + w + spacing
+    return placements, unplaced
+
+def _score(placements: List[Placement]) -> Tuple[int, float]:
+    """More boats first, then the smaller bounding box"""
+    if not placements:
+        return (0, 0.0)
+    xs = [p.x for p in placements]
+    ys = [p.y for p in placements]
+    return (len(placements), -(max(xs) - min(xs) + 1) * (max(ys) - min(ys) + 1))
+
+def pack(
+    area: Bounds,
+    items: Sequence[PackItem],
+    footprints: Sequence[Sequence[float]] = (),
+    spacing: float = 5.0,
+    time_budget: float = 2.0,
+    seed: int = 0,
+    progress: Optional[Progress] = None
+) -> PackResult:
+    """Place ``items`` inside ``area`` clear of ``footprints`` and of each other
+
+    ``footprints`` are ``(x, y, width, height, rotation)`` of positions
+    already on the map. Placements keep their length as ``width`` and
+    beam as ``height``, turned by 0 or 90 degrees. The deterministic
+    strategies always run; shuffled ones only while ``time_budget``
+    seconds remain and boats are still left over. ``progress`` is called
+    after every attempt with the share of the time budget used.
+    """
+    started = time.perf_counter()
+    deadline = started + time_budget
+    obstacles = obstacle_index(footprints)
+    rng = random.Random(seed)
+    best: Optional[Tuple[Tuple[int, float], List[Placement], List[Hashable], str]] = None
+    attempts = 0
+
+    def attempt(ordered: List[PackItem], rotation: float, name: str) -> None:
+        nonlocal best, attempts
+        attempts += 1
+        placements, unplaced = _shelf_pack(area, ordered, rotation, spacing, obstacles)
+        score = _score(placements)
+        if best is None or score > best[0]:
+            best = (score, placements, unplaced, name)
+        if progress is not None:
+            progress(min((time.perf_counter() - started) / time_budget, 0.99))
+
+    for rotation, ordering in STRATEGIES:
+        attempt(_order(items, rotation, ordering), rotation, f"shelf-{int(rotation)}-{ordering}")
+        if time.perf_counter() > deadline:
+            break
+    # Shuffle runs of similar height to find room for the leftovers
+    while best[2] and time.perf_counter() < deadline:
+        rotation, ordering = STRATEGIES[rng.randrange(len(STRATEGIES))]
+        ordered = _order(items, rotation, ordering)
+        height = (lambda item: item.length) if rotation == 90 else (lambda item: item.beam)
+        jitter: Dict[Hashable, float] = {item.key: height(item) * rng.uniform(0.85, 1.15) for item in ordered}
+        ordered.sort(key=lambda item: jitter[item.key], reverse=True)
+        attempt(ordered, rotation, f"shelf-{int(rotation)}-shuffled")
+
+    _, placements, unplaced, name = best
+    return PackResult(placements, unplaced, attempts, name)
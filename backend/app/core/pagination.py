@@ -0,0 +1,93 @@
+import base64
+import binascii
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from fastapi import Response
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+from .exceptions import ValidationError
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+PREV_CURSOR_HEADER = "X-Prev-Cursor"
+
+# A sort key is a column expression and whether it sorts descending
+SortKey = Tuple[Any, bool]
+
+def encode_cursor(direction: str, values: Sequence[Any]) -> str:
+    """Encode sort key values into an opaque cursor"""
+    payload = json.dumps({"d": direction, "v": list(values)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str, key_count: int) -> Tuple[str, List[Any]]:
+    """Decode a cursor into its direction and sort key values"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        direction, values = data["d"], data["v"]
+    except (ValueError, KeyError, TypeError, binascii.Error):
+        raise ValidationError("Invalid pagination cursor")
+
+    if direction not in ("next", "prev") or not isinstance(values, list) or len(values) != key_count:
+        raise ValidationError("Invalid pagination cursor")
+    return direction, values
+
+def _after(sort_keys: Sequence[SortKey], values: Sequence[Any]):
+    """Predicate selecting rows that sort strictly after the given key values"""
+    clauses = []
+    for i, (column, descending) in enumerate(sort_keys):
+        equal = [sort_keys[j][0] == values[j] for j in range(i)]
+        beyond = column < values[i] if descending else column > values[i]
+        clauses.append(and_(*equal, beyond))
+    return or_(*clauses)
+
+def paginate(
+    query: Query,
+    sort_keys: Sequence[SortKey],
+    limit: int,
+    cursor: Optional[str] = None,
+    skip: int = 0
+) -> Dict[str, Any]:
+    """Keyset-paginate an unordered query.
+
+    Without a cursor the page starts at ``skip`` (offset pagination), so
+    existing clients keep working; either way the returned cursors let the
+    client continue with keyset pagination.
+    """
+    direction = "next"
+    keys = list(sort_keys)
+    if cursor:
+        direction, values = decode_cursor(cursor, len(keys))
+        if direction == "prev":
+            keys = [(column, not descending) for column, descending in keys]
+        query = query.filter(_after(keys, values))
+        skip = 0
+
+    query = query.add_columns(*[column for column, _ in sort_keys]).order_by(
+        *[column.desc() if descending else column.asc() for column, descending in keys]
+    )
+    rows = query.offset(skip).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if direction == "prev":
+        rows.reverse()
+
+    key_count = len(sort_keys)
+    items = [row[0] if len(row) == key_count + 1 else tuple(row[:-key_count]) for row in rows]
+
+    if direction == "next":
+        has_next, has_prev = has_more, bool(cursor) or skip > 0
+    else:
+        has_next, has_prev = True, has_more
+
+    return {
+        "items": items,
+        "next_cursor": encode_cursor("next", rows[-1][-key_count:]) if rows and has_next else None,
+        "prev_cursor": encode_cursor("prev", rows[0][-key_count:]) if rows and has_prev else None,
+    }
+
+def set_cursor_headers(response: Response, page: Dict[str, Any]) -> None:
+    """Expose page cursors on the response"""
+    if page["next_cursor"]:
+        response.headers[NEXT_CURSOR_HEADER] = page["next_cursor"]
+    if page["prev_cursor"]:
+        response.headers[PREV_CURSOR_HEADER] = page["prev_cursor"]
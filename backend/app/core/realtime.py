@@ -0,0 +1,238 @@
+import asyncio
+import json
+import logging
+import select
+import threading
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Set
+from .config import settings
+from .metrics import register_metrics
+
+logger = logging.getLogger(__name__)
+
+# Postgres NOTIFY channel shared by every worker
+CHANNEL = "map_changes"
+
+# Sent to a subscriber that fell too far behind; it must refetch the map
+RESYNC = json.dumps({"type": "resync"})
+
+Deliver = Callable[[str], None]
+Listener = Callable[[int], None]
+
+class MemoryBackend:
+    """Delivers published messages within this process only"""
+
+    def __init__(self):
+        self._deliver: Optional[Deliver] = None
+
+    def start(self, deliver: Deliver) -> None:
+        self._deliver = deliver
+
+    def publish(self, message: str) -> None:
+        if self._deliver is not None:
+            self._deliver(message)
+
+    def stop(self) -> None:
+        self._deliver = None
+
+class PostgresNotifyBackend:
+    """Fans messages out to every worker through Postgres LISTEN/NOTIFY"""
+
+    def __init__(self, dsn: str, channel: str = CHANNEL, poll_seconds: float = 1.0):
+        self.dsn = dsn
+        self.channel = channel
+        self.poll_seconds = poll_seconds
+        self._publish_connection = None
+        self._publish_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _connect(self):
+        import psycopg2
+        connection = psycopg2.connect(self.dsn)
+        connection.autocommit = True
+        return connection
+
+    def start(self, deliver: Deliver) -> None:
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._listen, args=(deliver,), name="map-changes-listener", daemon=True
+        )
+        self._thread.start()
+
+    def _listen(self, deliver: Deliver) -> None:
+        while not self._stopped.is_set():
+            try:
+                connection = self._connect()
+                try:
+                    connection.cursor().execute(f"LISTEN {self.channel}")
+                    while not self._stopped.is_set():
+                        if select.select([connection], [], [], self.poll_seconds)[0]:
+                            connection.poll()
+                            while connection.notifies:
+                                deliver(connection.notifies.pop(0).payload)
+                finally:
+                    connection.close()
+            except Exception:
+                logger.exception("Map change listener failed; reconnecting")
+                self._stopped.wait(self.poll_seconds)
+
+    def publish(self, message: str) -> None:
+        with self._publish_lock:
+            if self._publish_connection is None or self._publish_connection.closed:
+                self._publish_connection = self._connect()
+            try:
+                self._publish_connection.cursor().execute(
+                    "SELECT pg_notify(%s, %s)", (self.channel, message)
+                )
+            except Exception:
+                self._publish_connection.close()
+                raise
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_seconds * 2)
+        with self._publish_lock:
+            if self._publish_connection is not None:
+                self._publish_connection.close()
+
+class Subscription:
+    """Queue of change messages for one connected client"""
+
+    def __init__(self, map_id: int, maxsize: int):
+        self.map_id = map_id
+        self.loop = asyncio.get_running_loop()
+        self.queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize)
+        self.overflowed = False
+
+    def _put(self, message: str) -> None:
+        # Runs on the subscriber's event loop
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC)
+
+    async def get(self) -> str:
+        """Wait for the next message"""
+        return await self.queue.get()
+
+    async def messages(self) -> AsyncIterator[str]:
+        """Yield messages until the subscriber overflows"""
+        while True:
+            message = await self.queue.get()
+            yield message
+            if message is RESYNC:
+                return
+
+class ChangeBroadcaster:
+    """Per-map pub/sub of compact change events
+
+    Services publish after committing, from any thread; the backend hands
+    every message to each process's broadcaster, which forwards it to the
+    event loops of the clients subscribed to that map.
+    """
+
+    def __init__(self, backend: Any = None, queue_size: int = 1000):
+        self.queue_size = queue_size
+        self._subscribers: Dict[int, Set[Subscription]] = {}
+        self._listeners: List[Listener] = []
+        self._lock = threading.Lock()
+        self.published = 0
+        self.delivered = 0
+        self.failed = 0
+        self.backend = None
+        self.set_backend(backend or MemoryBackend())
+
+    def set_backend(self, backend: Any) -> None:
+        """Replace the transport, stopping the previous one"""
+        if self.backend is not None:
+            self.backend.stop()
+        self.backend = backend
+        backend.start(self._deliver)
+
+    def add_listener(self, listener: Listener) -> None:
+        """Call ``listener(map_id)`` for every change, local or remote
+        
+        Local publishes call it synchronously, so this process reads its own
+        writes; backends that echo messages back may call it a second time.
+        """
+        self._listeners.append(listener)
+
+    def _notify(self, map_id: int) -> None:
+        for listener in self._listeners:
+            try:
+                listener(map_id)
+            except Exception:
+                logger.exception("Map change listener failed")
+
+    def publish(self, map_id: int, event: Dict[str, Any]) -> None:
+        """Publish a change event for a map; failures never reach the caller"""
+        self._notify(map_id)
+        message = json.dumps({"map_id": map_id, **event}, default=str)
+        try:
+            self.backend.publish(message)
+            self.published += 1
+        except Exception:
+            self.failed += 1
+            logger.exception("Failed to publish map change")
+
+    def _deliver(self, message: str) -> None:
+        map_id = json.loads(message).get("map_id")
+        if not isinstance(self.backend, MemoryBackend):
+            self._notify(map_id)
+        with self._lock:
+            subscribers = list(self._subscribers.get(map_id, ()))
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._put, message)
+                self.delivered += 1
+            except RuntimeError:
+                # The subscriber's loop has shut down
+                pass
+
+    @contextmanager
+    def subscribe(self, map_id: int) -> Iterator[Subscription]:
+        """Receive change events for a map while the context is open"""
+        subscription = Subscription(map_id, self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(map_id, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(map_id)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._subscribers[map_id]
+
+    def stats(self) -> Dict[str, Any]:
+        """Publish/delivery counters and open subscriptions"""
+        with self._lock:
+            subscribers = sum(len(s) for s in self._subscribers.values())
+            maps = len(self._subscribers)
+        return {
+            "backend": type(self.backend).__name__,
+            "published": self.published,
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "subscribers": subscribers,
+            "maps": maps,
+        }
+
+def configured_backend() -> Any:
+    """Backend selected by REALTIME_BACKEND"""
+    if settings.REALTIME_BACKEND == "postgres":
+        from sqlalchemy.engine import make_url
+        url = make_url(settings.DATABASE_URL).set(drivername="postgresql")
+        return PostgresNotifyBackend(url.render_as_string(hide_password=False))
+    return MemoryBackend()
+
+broadcaster = ChangeBroadcaster(queue_size=settings.REALTIME_QUEUE_SIZE)
+register_metrics("realtime", broadcaster.stats)
@@ -0,0 +1,85 @@
+import re
+import sqlite3
+from functools import lru_cache
+from typing import FrozenSet, List, Tuple
+
+# Trigram index over the concatenated searchable boat listing columns.
+# The expression must match BoatService's search document exactly so the
+# planner can use the index for ILIKE '%term%' lookups.
+SEARCH_DOCUMENT_SQL = (
+    "coalesce(name, '') || ' | ' || coalesce(customer_name, '') || ' | ' || "
+    "coalesce(make_model, '') || ' | ' || coalesce(vehicle_type, '') || ' | ' || "
+    "coalesce(size, '') || ' | ' || coalesce(notes, '')"
+)
+SEARCH_INDEX_NAME = "ix_boat_listings_search_trgm"
+CREATE_SEARCH_INDEX_SQL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    f"CREATE INDEX IF NOT EXISTS {SEARCH_INDEX_NAME} ON boat_listings "
+    f"USING gin (({SEARCH_DOCUMENT_SQL}) gin_trgm_ops)",
+]
+DROP_SEARCH_INDEX_SQL = [f"DROP INDEX IF EXISTS {SEARCH_INDEX_NAME}"]
+
+_WORD_RE = re.compile(r"[^\W_]+")
+
+def _words(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric words like pg_trgm does"""
+    return _WORD_RE.findall(text.lower())
+
+@lru_cache(maxsize=65536)
+def _word_trigrams(word: str) -> FrozenSet[str]:
+    """Padded trigrams of a single word"""
+    padded = f"  {word} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+def _trigrams(words: List[str]) -> FrozenSet[str]:
+    """Padded trigrams for a sequence of words"""
+    if len(words) == 1:
+        return _word_trigrams(words[0])
+    return frozenset().union(*(_word_trigrams(word) for word in words))
+
+def similarity(a: str, b: str) -> float:
+    """Trigram similarity of two strings (pg_trgm ``similarity``)"""
+    first, second = _trigrams(_words(a or "")), _trigrams(_words(b or ""))
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+@lru_cache(maxsize=256)
+def _term_trigrams(term: str) -> Tuple[FrozenSet[str], int]:
+    """Trigrams and word count of a search term"""
+    words = _words(term)
+    return _trigrams(words), len(words)
+
+def word_similarity(term: str, document: str) -> float:
+    """Best trigram similarity between term and any run of words in document.
+
+    In-process counterpart of pg_trgm's ``word_similarity`` used on SQLite;
+    runs of up to as many words as the term are compared.
+    """
+    term_grams, span = _term_trigrams(term or "")
+    doc_words = _words(document or "")
+    if not term_grams or not doc_words:
+        return 0.0
+
+    best = 0.0
+    for size in range(1, span + 1):
+        for start in range(len(doc_words) - size + 1):
+            grams = _trigrams(doc_words[start:start + size])
+            shared = len(term_grams & grams)
+            if not shared:
+                continue
+            score = shared / (len(term_grams) + len(grams) - shared)
+            if score > best:
+                best = score
+                if best == 1.0:
+                    return best
+    return best
+
+def register_sqlite_functions(dbapi_connection, connection_record) -> None:
+    """Expose the trigram functions to SQLite connections (sqlite3 or aiosqlite)"""
+    is_sqlite = isinstance(dbapi_connection, sqlite3.Connection) or (
+        type(dbapi_connection).__module__.startswith("sqlalchemy.dialects.sqlite")
+    )
+    if is_sqlite:
+        dbapi_connection.create_function("similarity", 2, similarity, deterministic=True)
+        dbapi_connection.create_function("word_similarity", 2, word_similarity, deterministic=True)
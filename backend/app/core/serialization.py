@@ -0,0 +1,163 @@
+"""Fast JSON rendering for the large read endpoints.
+
+With ``settings.FAST_JSON`` on, list and snapshot endpoints turn ORM rows
+straight into plain dicts (``row_dict``) and render them with orjson,
+skipping the model instances FastAPI would otherwise validate and dump
+again for every row. The JSON document is the same either way. orjson
+is pinned in requirements.txt; without it bodies fall back to the stdlib
+encoder, which can be slower than leaving FAST_JSON off.
+
+Clients drawing large maps can also ask (via Accept) for the columnar
+representation: one array per field instead of one object per row, as
+JSON or MessagePack. msgpack is pinned in requirements.txt; without it a
+MessagePack Accept is ignored and the client gets JSON.
+"""
+import json
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Type
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+# Representation -> media type; "columnar" and "msgpack" use ``columns``
+MEDIA_TYPES = {
+    "json": "application/json",
+    "columnar": "application/vnd.pier11.columnar+json",
+    "msgpack": "application/msgpack",
+}
+_ACCEPTED = {**{media: fmt for fmt, media in MEDIA_TYPES.items()}, "application/x-msgpack": "msgpack"}
+
+# OpenAPI ``responses`` entry for endpoints that negotiate a representation
+ALTERNATE_RESPONSES = {
+    200: {"content": {MEDIA_TYPES["columnar"]: {}, MEDIA_TYPES["msgpack"]: {}}}
+}
+
+def _default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        # Match pydantic, which writes UTC as "Z"
+        return value.isoformat().replace("+00:00", "Z")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def dumps(content: Any) -> bytes:
+    """Compact JSON bytes, via orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_UTC_Z)
+    return json.dumps(
+        content, default=_default, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+def negotiate(accept: Optional[str]) -> str:
+    """Representation preferred by an Accept header; JSON unless another wins"""
+    best, best_q = "json", 0.0
+    for item in (accept or "").split(","):
+        media_type, *params = [part.strip() for part in item.split(";")]
+        fmt = _ACCEPTED.get(media_type.lower())
+        if fmt is None or (fmt == "msgpack" and msgpack is None):
+            continue
+        q = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    q = float(param[2:])
+                except ValueError:
+                    pass
+        if q > best_q:
+            best, best_q = fmt, q
+    return best
+
+def variant(fmt: str) -> Optional[str]:
+    """ETag/cache-key part for a representation (None for plain JSON)"""
+    return None if fmt == "json" else fmt
+
+def encode(content: Any, fmt: str) -> bytes:
+    """Serialize ``content`` for a negotiated representation"""
+    if fmt == "msgpack":
+        return msgpack.packb(content, default=_default, use_bin_type=True)
+    return dumps(content)
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with ``dumps``"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+@lru_cache(maxsize=None)
+def response_fields(schema: Type[BaseModel]) -> Tuple[Tuple[str, Any], ...]:
+    """(name, default) for each field of a response schema, in output order"""
+    return tuple(
+        (name, None if field.is_required() else field.default)
+        for name, field in schema.model_fields.items()
+    )
+
+def row_dict(obj: Any, schema: Type[BaseModel]) -> Dict[str, Any]:
+    """``schema.model_validate(obj).model_dump()`` without building the model
+
+    Only valid for flat schemas whose fields are plain column values.
+    Loaded ORM attributes are read from the instance ``__dict__``, which
+    skips the attribute instrumentation; anything else (expired columns,
+    computed attributes) goes through ``getattr``.
+    """
+    loaded = getattr(obj, "__dict__", {})
+    return {
+        name: loaded[name] if name in loaded else getattr(obj, name, default)
+        for name, default in response_fields(schema)
+    }
+
+class Palette:
+    """Distinct values numbered in first-seen order"""
+
+    def __init__(self):
+        self.values: List[Any] = []
+        self._indexes: Dict[Any, int] = {}
+
+    def index(self, value: Any) -> int:
+        index = self._indexes.get(value)
+        if index is None:
+            index = self._indexes[value] = len(self.values)
+            self.values.append(value)
+        return index
+
+def columns(
+    rows: Sequence[Any],
+    schema: Type[BaseModel],
+    exclude: Tuple[str, ...] = (),
+    encoders: Optional[Mapping[str, Callable[[Any], Any]]] = None
+) -> Dict[str, Any]:
+    """Rows of a flat schema as ``{"count", "columns": {field: [values]}}``
+
+    ``encoders`` replace a field's values, e.g. with ``Palette.index``.
+    """
+    fields = [(name, default) for name, default in response_fields(schema) if name not in exclude]
+    values: Dict[str, List[Any]] = {name: [] for name, _ in fields}
+    for row in rows:
+        loaded = getattr(row, "__dict__", {})
+        for name, default in fields:
+            values[name].append(loaded[name] if name in loaded else getattr(row, name, default))
+    for name, encoder in (encoders or {}).items():
+        values[name] = [encoder(value) for value in values[name]]
+    return {"count": len(rows), "columns": values}
+
+def encoded_response(content: Any, fmt: str, response: Response) -> Response:
+    """Render a negotiated representation, keeping headers set on ``response``"""
+    return Response(
+        content=encode(content, fmt), media_type=MEDIA_TYPES[fmt], headers=dict(response.headers)
+    )
+
+def fast_list_response(
+    items: Iterable[Any], schema: Type[BaseModel], response: Response
+) -> FastJSONResponse:
+    """Render rows as a JSON list, keeping headers already set on ``response``"""
+    return FastJSONResponse(
+        [row_dict(item, schema) for item in items], headers=dict(response.headers)
+    )
@@ -0,0 +1,66 @@
+"""Boat sizes from the free-text ``BoatListing.size`` column.
+
+Listings are typed by hand, so sizes come as "35 ft", "35'", "35' 6\"",
+"10.5 m", "35 x 12" and the like. ``parse_size`` turns them into a
+length and an optional beam in feet; anything it cannot read is None.
+"""
+import re
+from typing import NamedTuple, Optional
+
+FEET_PER_UNIT = {"ft": 1.0, "in": 1 / 12, "m": 3.28084}
+
+# Beam assumed for a listing that only gives its length
+DEFAULT_BEAM_RATIO = 1 / 3
+
+# Longest believable hull; larger numbers are typos or other units
+MAX_LENGTH_FT = 500.0
+
+_UNITS = {
+    "ft": "ft", "feet": "ft", "foot": "ft", "'": "ft", "′": "ft",
+    "in": "in", "inch": "in", "inches": "in", '"': "in", "''": "in", "″": "in",
+    "m": "m", "meter": "m", "meters": "m", "metre": "m", "metres": "m",
+}
+_UNIT = r"(ft|feet|foot|''|'|′|inches|inch|in|\"|″|meters|meter|metres|metre|m)"
+_DIMENSION = re.compile(
+    rf"^(\d+(?:\.\d+)?)\s*{_UNIT}?\.?\s*(?:(\d+(?:\.\d+)?)\s*(''|\"|″|inches|inch|in)\.?)?$"
+)
+_SEPARATOR = re.compile(r"\s*(?:x|×|by)\s*")
+
+class BoatSize(NamedTuple):
+    length_ft: float
+    beam_ft: Optional[float] = None
+
+def _dimension(text: str) -> Optional[tuple]:
+    """(value, unit or None) for a single dimension"""
+    match = _DIMENSION.match(text.strip())
+    if not match:
+        return None
+    value, unit, inches, _ = match.groups()
+    unit = _UNITS[unit] if unit else None
+    if inches is not None:
+        if unit not in ("ft", None):
+            return None
+        return float(value) + float(inches) / 12, "ft"
+    return float(value), unit
+
+def parse_size(text: Optional[str]) -> Optional[BoatSize]:
+    """Length and beam in feet from a size such as "35 ft" or "10.5m x 3.2m"
+
+    A number without a unit is taken as feet, or as the unit of the other
+    dimension when only one of them names it.
+    """
+    if not text:
+        return None
+    parts = _SEPARATOR.split(text.strip().lower(), maxsplit=1)
+    dimensions = [_dimension(part) for part in parts]
+    if any(d is None for d in dimensions):
+        return None
+    units = [unit for _, unit in dimensions if unit]
+    fallback = units[0] if units else "ft"
+    # The longer dimension is the length, whichever order it was typed in
+    feet = sorted(
+        (round(value * FEET_PER_UNIT[unit or fallback], 2) for value, unit in dimensions), reverse=True
+    )
+    if not 0 < feet[-1] <= feet[0] <= MAX_LENGTH_FT:
+        return None
+    return BoatSize(feet[0], feet[1] if len(feet) > 1 else None)
@@ -0,0 +1,140 @@
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+from .cache import TTLCache
+from .config import settings
+from .metrics import register_metrics
+from .realtime import broadcaster
+
+logger = logging.getLogger(__name__)
+
+class RedisSnapshotStore:
+    """Snapshot bodies shared by every worker through Redis (needs redis)"""
+
+    def __init__(self, url: str, ttl: float):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("SNAPSHOT_CACHE_URL requires the redis package")
+        self._errors = redis.RedisError
+        self.client = redis.Redis.from_url(url)
+        self.ttl = max(1, int(ttl))
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            return self.client.get(key)
+        except self._errors:
+            logger.warning("Shared snapshot cache unavailable", exc_info=True)
+            return None
+
+    def set(self, key: str, value: bytes) -> None:
+        try:
+            self.client.set(key, value, ex=self.ttl)
+        except self._errors:
+            logger.warning("Shared snapshot cache unavailable", exc_info=True)
+
+class SnapshotCache:
+    """Serialized MapWithBoats bodies per map and format, dropped on every map change
+
+    Local entries hold ``(revision, body)`` and are only served when the
+    map's current revision still matches, since invalidations from other
+    workers don't reach this one with the memory realtime backend. A
+    reader takes a ticket before it touches the database; ``invalidate`` moves the map to a new generation, so a body
+    built while a write was committing is never stored. The optional
+    shared store is keyed by revision, so its entries never go stale.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, shared: Any = None):
+        self.local = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.shared = shared
+        self._generations: Dict[int, int] = {}
+        self._formats = {"json"}
+        self._lock = threading.Lock()
+        self.invalidations = 0
+        self.rejected = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.local.enabled
+
+    @staticmethod
+    def shared_key(map_id: int, revision: int, fmt: str = "json") -> str:
+        return f"map-snapshot:{settings.VERSION}:{map_id}:{revision}:{fmt}"
+
+    def get(
+        self, map_id: int, fmt: str = "json", revision: Optional[int] = None
+    ) -> Optional[Tuple[int, bytes]]:
+        """Cached (revision, body) for a map; an entry for another revision is a miss"""
+        cached = self.local.get((map_id, fmt))
+        if cached is not None and revision is not None and cached[0] != revision:
+            self.local.delete((map_id, fmt))
+            return None
+        return cached
+
+    def ticket(self, map_id: int) -> int:
+        """Take before reading the database; pass to ``store``"""
+        with self._lock:
+            return self._generations.get(map_id, 0)
+
+    def get_shared(self, map_id: int, revision: int, fmt: str = "json") -> Optional[bytes]:
+        """Body for an exact revision from the shared store"""
+        if self.shared is None:
+            return None
+        return self.shared.get(self.shared_key(map_id, revision, fmt))
+
+    def store(
+        self,
+        map_id: int,
+        ticket: int,
+        revision: int,
+        body: bytes,
+        fmt: str = "json",
+        share: bool = True
+    ) -> bool:
+        """Cache a body unless the map changed since ``ticket`` was taken"""
+        if share and self.shared is not None:
+            self.shared.set(self.shared_key(map_id, revision, fmt), body)
+        with self._lock:
+            if self._generations.get(map_id, 0) != ticket:
+                self.rejected += 1
+                return False
+            self._formats.add(fmt)
+            self.local.set((map_id, fmt), (revision, body))
+            return True
+
+    def invalidate(self, map_id: int) -> None:
+        """Drop a map's entries and reject builds already in flight"""
+        with self._lock:
+            self._generations[map_id] = self._generations.get(map_id, 0) + 1
+            for fmt in self._formats:
+                self.local.delete((map_id, fmt))
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self._lock:
+            for map_id in self._generations:
+                self._generations[map_id] += 1
+            self.local.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Local hit/miss counters plus invalidations"""
+        return {
+            **self.local.stats(),
+            "invalidations": self.invalidations,
+            "rejected": self.rejected,
+            "shared": type(self.shared).__name__ if self.shared is not None else None,
+        }
+
+map_snapshots = SnapshotCache(
+    maxsize=settings.SNAPSHOT_CACHE_MAX_SIZE,
+    ttl=settings.SNAPSHOT_CACHE_TTL_SECONDS,
+    shared=(
+        RedisSnapshotStore(settings.SNAPSHOT_CACHE_URL, settings.SNAPSHOT_CACHE_TTL_SECONDS)
+        if settings.SNAPSHOT_CACHE_URL else None
+    ),
+)
+register_metrics("map_snapshot_cache", map_snapshots.stats)
+
+# Every published map change, local or from another worker, drops the entry
+broadcaster.add_listener(map_snapshots.invalidate)
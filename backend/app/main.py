@@ -1,11 +1,19 @@
 # backend/app/main.py
-from fastapi import FastAPI
+from typing import Any
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from .core.compression import CompressionMiddleware
 from .core.config import settings
 from .core.database import engine
+from .core.jobs import jobs
+from .core.metrics import collect_metrics
+from .core.pagination import NEXT_CURSOR_HEADER, PREV_CURSOR_HEADER
+from .core.realtime import broadcaster, configured_backend
 from .models import Base
 from .api.v1 import api_router
+from .api.v1.aio import router as async_api_router
+from .api.deps import get_current_admin_user
 
 # Create database tables
 Base.metadata.create_all(bind=engine)
@@ -18,6 +26,17 @@ app = FastAPI(
     redoc_url="/redoc"
 )
 
+# Compress large bodies (innermost, so CORS headers wrap the encoded response)
+if settings.COMPRESSION_ALGORITHMS:
+    app.add_middleware(
+        CompressionMiddleware,
+        algorithms=settings.COMPRESSION_ALGORITHMS,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+        exclude_paths=settings.COMPRESSION_EXCLUDE_PATHS,
+    )
+
 # Set up CORS
 if settings.BACKEND_CORS_ORIGINS:
     app.add_middleware(
@@ -26,6 +45,7 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER, PREV_CURSOR_HEADER, "ETag"],
     )
 
 # Add trusted host middleware for security
@@ -34,9 +54,26 @@ app.add_middleware(
     allowed_hosts=["localhost", "127.0.0.1"]
 )
 
-# Include API router
+# Include API router; in async mode the hot endpoints are registered first
+# so their async handlers take precedence over the sync ones
+if settings.DATABASE_ASYNC:
+    app.include_router(async_api_router, prefix=settings.API_V1_STR)
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+@app.on_event("startup")
+def start_change_feed():
+    """Connect the change feed to its configured transport"""
+    broadcaster.set_backend(configured_backend())
+
+@app.on_event("shutdown")
+def stop_change_feed():
+    broadcaster.backend.stop()
+
+@app.on_event("shutdown")
+def stop_jobs():
+    """Cancel pending jobs and stop the worker processes"""
+    jobs.shutdown()
+
 @app.get("/")
 def root():
     """Health check endpoint"""
@@ -46,6 +83,11 @@ def root():
         "status": "healthy"
     }
 
+@app.get("/metrics")
+def metrics(current_admin: Any = Depends(get_current_admin_user)):
+    """Runtime counters (connection pools, caches, jobs; admin only)"""
+    return collect_metrics()
+
 @app.get("/health")
 def health_check():
     """Detailed health check"""
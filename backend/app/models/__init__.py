@@ -4,5 +4,12 @@ from .user import User
 from .map import Map
 from .boat_listing import BoatListing
 from .boat_position import BoatPosition
+from .position_tombstone import PositionTombstone
+from .position_history import PositionHistory
+from .position_history_checkpoint import PositionHistoryCheckpoint
+from .revision_counter import RevisionCounter
 
-__all__ = ["Base", "User", "Map", "BoatListing", "BoatPosition"]
\ No newline at end of file
+__all__ = [
+    "Base", "User", "Map", "BoatListing", "BoatPosition", "PositionTombstone", "PositionHistory",
+    "PositionHistoryCheckpoint", "RevisionCounter"
+]
\ No newline at end of file
@@ -1,8 +1,10 @@
 # backend/app/models/boat_listing.py
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey
+from typing import Any, Dict, Optional
+from sqlalchemy import Column, Integer, Float, String, Text, Boolean, DateTime, ForeignKey, Index, event, literal_column
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from ..core.database import Base
+from ..core.sizes import parse_size
 
 class BoatListing(Base):
     __tablename__ = "boat_listings"
@@ -12,6 +14,9 @@ class BoatListing(Base):
     name = Column(String(100))
     customer_name = Column(String(100), nullable=False, index=True)
     size = Column(String(50))  # e.g., "35 ft"
+    # Parsed from ``size`` on every write; None when it cannot be read
+    length_ft = Column(Float, index=True)
+    beam_ft = Column(Float)
     make_model = Column(String(100))
     vehicle_type = Column(String(50))  # boat, trailer, jetski, etc.
     section = Column(String(10))  # A, B, C, D, E, F
@@ -26,6 +31,28 @@ class BoatListing(Base):
     # Relationships
     position = relationship("BoatPosition", back_populates="boat_listing", cascade="all, delete-orphan", single_parent=True)
     
+    @staticmethod
+    def size_values(size: Optional[str]) -> Dict[str, Any]:
+        """Parsed size columns for a size string"""
+        parsed = parse_size(size)
+        return {
+            "length_ft": parsed.length_ft if parsed else None,
+            "beam_ft": parsed.beam_ft if parsed else None,
+        }
+    
     def __repr__(self):
         return f"<BoatListing(index={self.index}, name='{self.name}', customer='{self.customer_name}')>"
 
+# Sort key for ordering by length: unknown lengths sort as 0, so keyset
+# cursors never compare NULLs. Queries must use this exact expression to
+# be served by the index.
+LENGTH_SORT_KEY = func.coalesce(BoatListing.length_ft, literal_column("0.0"))
+Index("ix_boat_listings_length_sort", LENGTH_SORT_KEY, BoatListing.index)
+
+@event.listens_for(BoatListing, "before_insert")
+@event.listens_for(BoatListing, "before_update")
+def _sync_size(mapper, connection, target: BoatListing) -> None:
+    # Core bulk INSERTs (imports) skip this hook and pass the columns themselves
+    for name, value in BoatListing.size_values(target.size).items():
+        setattr(target, name, value)
+
@@ -1,8 +1,13 @@
 # backend/app/models/boat_position.py
-from sqlalchemy import Column, Integer, Float, String, Boolean, DateTime, ForeignKey
+from typing import Any, Dict
+from sqlalchemy import Column, Integer, Float, String, Boolean, DateTime, ForeignKey, Index, event
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from ..core.database import Base
+from ..core.geometry import footprint_bounds
+
+# Column defaults of the footprint, also used before an INSERT applies them
+GEOMETRY_DEFAULTS = {"x": 200.0, "y": 200.0, "width": 100.0, "height": 50.0, "rotation": 0.0}
 
 class BoatPosition(Base):
     __tablename__ = "boat_positions"
@@ -12,12 +17,19 @@ class BoatPosition(Base):
     # Map relationship
     map_id = Column(Integer, ForeignKey("maps.id"), nullable=False, index=True)
     
-    # Canvas coordinates and dimensions
-    x = Column(Float, nullable=False, default=200.0)
-    y = Column(Float, nullable=False, default=200.0)
-    width = Column(Float, nullable=False, default=100.0)
-    height = Column(Float, nullable=False, default=50.0)
-    rotation = Column(Float, nullable=False, default=0.0)  # in degrees
+    # Canvas coordinates and dimensions; (x, y) is the centre
+    x = Column(Float, nullable=False, default=GEOMETRY_DEFAULTS["x"])
+    y = Column(Float, nullable=False, default=GEOMETRY_DEFAULTS["y"])
+    width = Column(Float, nullable=False, default=GEOMETRY_DEFAULTS["width"])
+    height = Column(Float, nullable=False, default=GEOMETRY_DEFAULTS["height"])
+    rotation = Column(Float, nullable=False, default=GEOMETRY_DEFAULTS["rotation"])  # in degrees
+    
+    # Axis-aligned bounds of the rotated footprint, kept in sync on every write
+    bbox_x0 = Column(Float)
+    bbox_y0 = Column(Float)
+    bbox_x1 = Column(Float)
+    bbox_y1 = Column(Float)
+    bbox_size = Column(Float)  # larger side of the bounds; limits viewport scans
     
     # Visual properties
     color = Column(String(50), nullable=False, default="blue")
@@ -26,6 +38,7 @@ class BoatPosition(Base):
     
     # Metadata
     is_visible = Column(Boolean, default=True, nullable=False)
+    revision = Column(Integer, default=0, server_default="0", nullable=False)  # map revision of the last change
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
@@ -33,6 +46,43 @@ class BoatPosition(Base):
     map = relationship("Map", back_populates="boat_positions")
     boat_listing = relationship("BoatListing", back_populates="position", uselist=False)
     
+    __table_args__ = (
+        Index("ix_boat_positions_map_revision", "map_id", "revision"),
+        Index("ix_boat_positions_map_bbox", "map_id", "bbox_x0", "bbox_y0"),
+        Index("ix_boat_positions_map_bbox_size", "map_id", "bbox_size"),
+    )
+    
+    @staticmethod
+    def bounds_values(x: float, y: float, width: float, height: float, rotation: float) -> Dict[str, Any]:
+        """Bounds columns for a footprint"""
+        x0, y0, x1, y1 = footprint_bounds(x, y, width, height, rotation)
+        return {
+            "bbox_x0": x0,
+            "bbox_y0": y0,
+            "bbox_x1": x1,
+            "bbox_y1": y1,
+            "bbox_size": max(x1 - x0, y1 - y0),
+        }
+    
+    def geometry(self) -> Dict[str, float]:
+        """Footprint fields, with column defaults for unset ones"""
+        values = {}
+        for name, default in GEOMETRY_DEFAULTS.items():
+            value = getattr(self, name)
+            values[name] = default if value is None else value
+        return values
+    
+    def update_bounds(self) -> None:
+        """Recompute the bounds columns from the footprint"""
+        for name, value in self.bounds_values(**self.geometry()).items():
+            setattr(self, name, value)
+    
     def __repr__(self):
         return f"<BoatPosition(id={self.id}, x={self.x}, y={self.y}, map_id={self.map_id})>"
 
+@event.listens_for(BoatPosition, "before_insert")
+@event.listens_for(BoatPosition, "before_update")
+def _sync_bounds(mapper, connection, target: BoatPosition) -> None:
+    # ORM bulk UPDATEs skip this hook and pass the bounds themselves
+    target.update_bounds()
+
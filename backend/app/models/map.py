@@ -14,6 +14,8 @@ class Map(Base):
     image_width = Column(Integer, nullable=False, default=794)
     image_height = Column(Integer, nullable=False, default=1123)
     is_active = Column(Boolean, default=True, nullable=False)
+    revision = Column(Integer, default=0, server_default="0", nullable=False)  # bumped by every change
+    details_revision = Column(Integer, default=0, server_default="0", nullable=False)  # revision of the last edit to the map itself
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
@@ -0,0 +1,26 @@
+# backend/app/models/position_history.py
+from sqlalchemy import Column, Integer, Float, Boolean, DateTime, Index
+from ..core.database import Base
+
+class PositionHistory(Base):
+    """Append-only record of a boat position after each change"""
+    __tablename__ = "position_history"
+    
+    id = Column(Integer, primary_key=True)
+    # Plain columns: history outlives the positions, boats and maps it mentions
+    map_id = Column(Integer, nullable=False)
+    position_id = Column(Integer, nullable=False)
+    boat_id = Column(Integer)  # boat at the position after the change, if any
+    x = Column(Float, nullable=False)
+    y = Column(Float, nullable=False)
+    rotation = Column(Float, nullable=False)
+    removed = Column(Boolean, default=False, nullable=False)  # the position was deleted
+    ts = Column(DateTime(timezone=True), nullable=False)
+    
+    __table_args__ = (
+        Index("ix_position_history_map_ts", "map_id", "ts"),
+        Index("ix_position_history_boat_ts", "boat_id", "ts"),
+    )
+    
+    def __repr__(self):
+        return f"<PositionHistory(position_id={self.position_id}, boat_id={self.boat_id}, ts={self.ts})>"
@@ -0,0 +1,20 @@
+# backend/app/models/position_history_checkpoint.py
+from sqlalchemy import Column, Integer, DateTime, JSON, UniqueConstraint
+from ..core.database import Base
+
+class PositionHistoryCheckpoint(Base):
+    """A map's positions as of ``ts``, folded from the position history"""
+    __tablename__ = "position_history_checkpoints"
+    
+    id = Column(Integer, primary_key=True)
+    map_id = Column(Integer, nullable=False)
+    ts = Column(DateTime(timezone=True), nullable=False)
+    # [[position_id, boat_id, x, y, rotation], ...] for every position on the map
+    positions = Column(JSON, nullable=False)
+    
+    __table_args__ = (
+        UniqueConstraint("map_id", "ts", name="uq_position_history_checkpoints_map_ts"),
+    )
+    
+    def __repr__(self):
+        return f"<PositionHistoryCheckpoint(map_id={self.map_id}, ts={self.ts})>"
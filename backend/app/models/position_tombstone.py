@@ -0,0 +1,22 @@
+# backend/app/models/position_tombstone.py
+from sqlalchemy import Column, Integer, DateTime, Index
+from sqlalchemy.sql import func
+from ..core.database import Base
+
+class PositionTombstone(Base):
+    """Marker left by a deleted boat position so delta sync can report it"""
+    __tablename__ = "position_tombstones"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    # Plain columns: the map and position may both be gone by the time a client syncs
+    map_id = Column(Integer, nullable=False)
+    position_id = Column(Integer, nullable=False)
+    revision = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    __table_args__ = (
+        Index("ix_position_tombstones_map_revision", "map_id", "revision"),
+    )
+    
+    def __repr__(self):
+        return f"<PositionTombstone(position_id={self.position_id}, map_id={self.map_id}, revision={self.revision})>"
@@ -0,0 +1,13 @@
+# backend/app/models/revision_counter.py
+from sqlalchemy import Column, Integer, String
+from ..core.database import Base
+
+class RevisionCounter(Base):
+    """Named monotonic counter bumped by writes to a collection (e.g. "boats")"""
+    __tablename__ = "revision_counters"
+    
+    name = Column(String(50), primary_key=True)
+    revision = Column(Integer, default=0, server_default="0", nullable=False)
+    
+    def __repr__(self):
+        return f"<RevisionCounter(name='{self.name}', revision={self.revision})>"
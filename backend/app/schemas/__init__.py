@@ -1,13 +1,26 @@
 from .user import UserCreate, UserUpdate, UserResponse, Token
 from .map import MapCreate, MapUpdate, MapResponse
-from .boat_listing import BoatListingCreate, BoatListingUpdate, BoatListingResponse
-from .boat_position import BoatPositionCreate, BoatPositionUpdate, BoatPositionResponse
-from .composite import BoatWithPosition, MapWithBoats
+from .boat_listing import (
+    BoatListingCreate, BoatListingUpdate, BoatListingResponse,
+    BoatImportError, BoatImportResult
+)
+from .boat_position import (
+    BoatPositionCreate, BoatPositionUpdate, BoatPositionResponse,
+    BoatPositionBulkItem, BoatPositionBulkUpdate, PositionOverlap, FreePlacement
+)
+from .layout import LayoutRequest, LayoutPlacement, LayoutResult
+from .job import JobResponse
+from .history import PositionHistoryEntry, HistoricalPosition, MapAtTime, BoatMove, MapDiff
+from .composite import BoatWithPosition, MapWithBoats, MapChanges
 
 __all__ = [
     "UserCreate", "UserUpdate", "UserResponse", "Token",
     "MapCreate", "MapUpdate", "MapResponse", 
     "BoatListingCreate", "BoatListingUpdate", "BoatListingResponse",
+    "BoatImportError", "BoatImportResult",
     "BoatPositionCreate", "BoatPositionUpdate", "BoatPositionResponse",
-    "BoatWithPosition", "MapWithBoats"
+    "BoatPositionBulkItem", "BoatPositionBulkUpdate", "PositionOverlap", "FreePlacement",
+    "LayoutRequest", "LayoutPlacement", "LayoutResult", "JobResponse",
+    "PositionHistoryEntry", "HistoricalPosition", "MapAtTime", "BoatMove", "MapDiff",
+    "BoatWithPosition", "MapWithBoats", "MapChanges"
 ]
\ No newline at end of file
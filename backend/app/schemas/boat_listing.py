@@ -1,8 +1,11 @@
 # backend/app/schemas/boat_listing.py
 from pydantic import BaseModel, Field, validator
-from typing import Optional
+from typing import Any, List, Literal, Optional
 from datetime import datetime
 
+# GET /boats orders: by index, or shortest / longest first
+BoatSort = Literal["index", "length", "-length"]
+
 class BoatListingBase(BaseModel):
     name: Optional[str] = Field(None, max_length=100)
     customer_name: str = Field(..., min_length=1, max_length=100)
@@ -54,9 +57,22 @@ class BoatListingResponse(BoatListingBase):
     index: int
     is_mapped: bool
     position_id: Optional[int] = None
+    length_ft: Optional[float] = None  # parsed from size
+    beam_ft: Optional[float] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
     
     class Config:
         from_attributes = True
 
+
+class BoatImportError(BaseModel):
+    row: int
+    index: Optional[Any] = None
+    message: str
+
+class BoatImportResult(BaseModel):
+    rows: int
+    created: int
+    error_count: int
+    errors: List[BoatImportError] = []
@@ -1,6 +1,6 @@
 # backend/app/schemas/boat_position.py
 from pydantic import BaseModel, Field, validator
-from typing import Optional, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 from datetime import datetime
 
 # Use TYPE_CHECKING to avoid circular imports
@@ -44,6 +44,33 @@ class BoatPositionUpdate(BaseModel):
     stroke_width: Optional[float] = Field(None, gt=0)
     is_visible: Optional[bool] = None
 
+class BoatPositionBulkItem(BoatPositionUpdate):
+    id: int = Field(..., gt=0)
+
+class BoatPositionBulkUpdate(BaseModel):
+    positions: List[BoatPositionBulkItem] = Field(..., min_length=1, max_length=1000)
+    
+    @validator('positions')
+    def validate_unique_ids(cls, v):
+        ids = [item.id for item in v]
+        if len(ids) != len(set(ids)):
+            raise ValueError('Each position may only appear once per bulk update')
+        return v
+
+class PositionOverlap(BaseModel):
+    """Two positions whose footprints overlap"""
+    position_id: int
+    other_position_id: int
+
+class FreePlacement(BaseModel):
+    """A spot where a footprint fits without overlapping any position"""
+    x: float
+    y: float
+    width: float
+    height: float
+    rotation: float
+    distance: float
+
 class BoatPositionResponse(BoatPositionBase):
     id: int
     map_id: int
@@ -1,10 +1,30 @@
 # backend/app/schemas/composite.py
 from pydantic import BaseModel
 from typing import Optional, List
+from ..core.config import settings
+from ..core.serialization import Palette, columns, dumps, encode, row_dict
 from .boat_listing import BoatListingResponse
 from .boat_position import BoatPositionResponse
 from .map import MapResponse
 
+# Position fields sent as indexes into a shared palette in columnar bodies
+PALETTE_FIELDS = ("color", "stroke_color")
+
+def _position_columns(positions, palette: Palette) -> dict:
+    """Columnar positions with map_id left out and colors palette-indexed"""
+    return columns(
+        positions,
+        BoatPositionResponse,
+        exclude=("map_id",),
+        encoders={field: palette.index for field in PALETTE_FIELDS}
+    )
+
+def positions_columnar(map_id: int, positions) -> dict:
+    """Columnar body for GET /positions/map/{id}"""
+    palette = Palette()
+    table = _position_columns(positions, palette)
+    return {"map_id": map_id, "palette": palette.values, "positions": table}
+
 class BoatWithPosition(BaseModel):
     """Boat listing with its position data"""
     boat: Optional[BoatListingResponse] = None
@@ -13,4 +33,74 @@ class BoatWithPosition(BaseModel):
 class MapWithBoats(BaseModel):
     """Map with all its boat positions"""
     map: MapResponse
-    boats: List[BoatWithPosition] = []
\ No newline at end of file
+    boats: List[BoatWithPosition] = []
+    
+    @classmethod
+    def from_snapshot(cls, map_obj) -> "MapWithBoats":
+        """Build from a map loaded by MapService.get_map_snapshot"""
+        boats = [
+            BoatWithPosition(boat=position.boat_listing, position=position)
+            for position in map_obj.boat_positions
+        ]
+        map_obj.boat_count = len(boats)
+        return cls(map=map_obj, boats=boats)
+    
+    @staticmethod
+    def snapshot_dict(map_obj) -> dict:
+        """``from_snapshot(map_obj).model_dump()`` built straight from the ORM rows"""
+        boats = [
+            {
+                "boat": row_dict(position.boat_listing, BoatListingResponse)
+                if position.boat_listing is not None else None,
+                "position": row_dict(position, BoatPositionResponse),
+            }
+            for position in map_obj.boat_positions
+        ]
+        map_obj.boat_count = len(boats)
+        return {"map": row_dict(map_obj, MapResponse), "boats": boats}
+    
+    @staticmethod
+    def snapshot_columnar(map_obj) -> dict:
+        """Columnar snapshot; boats are joined to positions by ``position_id``"""
+        palette = Palette()
+        positions = map_obj.boat_positions
+        boats = [position.boat_listing for position in positions if position.boat_listing is not None]
+        map_obj.boat_count = len(positions)
+        table = _position_columns(positions, palette)
+        return {
+            "map": row_dict(map_obj, MapResponse),
+            "palette": palette.values,
+            "positions": table,
+            "boats": columns(boats, BoatListingResponse),
+        }
+    
+    @classmethod
+    def snapshot_body(cls, map_obj, fmt: str = "json") -> bytes:
+        """Serialized snapshot body in a negotiated representation
+        
+        Plain JSON skips the models when FAST_JSON is on.
+        """
+        if fmt != "json":
+            return encode(cls.snapshot_columnar(map_obj), fmt)
+        if settings.FAST_JSON:
+            return dumps(cls.snapshot_dict(map_obj))
+        return cls.from_snapshot(map_obj).model_dump_json().encode()
+
+class MapChanges(BaseModel):
+    """Positions changed and deleted on a map since a revision"""
+    map_id: int
+    since: int
+    revision: int
+    reset: bool = False  # True when ``positions`` is the full map
+    map: Optional[MapResponse] = None  # Set when the map itself changed after ``since``
+    positions: List[BoatWithPosition] = []
+    deleted: List[int] = []
+    
+    @classmethod
+    def from_changes(cls, changes: dict) -> "MapChanges":
+        """Build from MapService.get_map_changes"""
+        positions = [
+            BoatWithPosition(boat=position.boat_listing, position=position)
+            for position in changes["positions"]
+        ]
+        return cls(**{**changes, "positions": positions})
@@ -0,0 +1,45 @@
+# backend/app/schemas/history.py
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import datetime
+
+class PositionHistoryEntry(BaseModel):
+    map_id: int
+    position_id: int
+    boat_id: Optional[int] = None
+    x: float
+    y: float
+    rotation: float
+    removed: bool
+    ts: datetime
+    
+    class Config:
+        from_attributes = True
+
+class HistoricalPosition(BaseModel):
+    position_id: int
+    boat_id: Optional[int] = None
+    x: float
+    y: float
+    rotation: float
+    
+    class Config:
+        from_attributes = True
+
+class MapAtTime(BaseModel):
+    map_id: int
+    ts: datetime
+    positions: List[HistoricalPosition]
+
+class BoatMove(BaseModel):
+    boat_id: int
+    before: HistoricalPosition
+    after: HistoricalPosition
+
+class MapDiff(BaseModel):
+    map_id: int
+    start: datetime
+    end: datetime
+    added: List[HistoricalPosition]  # boats on the map at end but not at start
+    removed: List[HistoricalPosition]  # boats on the map at start but not at end
+    moved: List[BoatMove]
@@ -0,0 +1,18 @@
+# backend/app/schemas/job.py
+from pydantic import BaseModel
+from typing import Literal, Optional
+from datetime import datetime
+
+class JobResponse(BaseModel):
+    id: str
+    kind: str
+    status: Literal["queued", "running", "succeeded", "failed", "cancelled"]
+    progress: float  # 0-1
+    message: Optional[str] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
@@ -0,0 +1,35 @@
+# backend/app/schemas/layout.py
+from pydantic import BaseModel, Field, validator
+from typing import List, Optional
+
+class LayoutRequest(BaseModel):
+    boat_ids: Optional[List[int]] = Field(None, min_length=1, max_length=2000)
+    section: Optional[str] = Field(None, max_length=10)
+    region: Optional[List[float]] = None  # [x0, y0, x1, y1]; defaults to the whole map
+    spacing: float = Field(default=5.0, ge=0, le=100)
+    pixels_per_foot: Optional[float] = Field(None, gt=0)
+    time_budget: float = Field(default=2.0, gt=0, le=10)
+    dry_run: bool = False
+    
+    @validator('region')
+    def validate_region(cls, v):
+        if v is not None and (len(v) != 4 or v[0] >= v[2] or v[1] >= v[3]):
+            raise ValueError('Region must be [x0, y0, x1, y1] with x0 < x1 and y0 < y1')
+        return v
+
+class LayoutPlacement(BaseModel):
+    boat_id: int
+    position_id: Optional[int] = None  # None on a dry run
+    x: float
+    y: float
+    width: float
+    height: float
+    rotation: float
+
+class LayoutResult(BaseModel):
+    placed: int
+    unplaced: List[int]  # boat ids that did not fit
+    strategy: str
+    attempts: int
+    dry_run: bool
+    placements: List[LayoutPlacement]
@@ -33,6 +33,7 @@ class MapResponse(MapBase):
     image_path: str
     created_at: datetime
     updated_at: Optional[datetime] = None
+    revision: int = 0  # Pass to GET /maps/{id}/changes as ``since``
     boat_count: Optional[int] = 0  # Computed field
     
     class Config:
@@ -2,6 +2,16 @@
 from .auth import AuthService
 from .boat import BoatService
 from .map import MapService
+from .boat_import import BoatImportService
+from .export import ExportService
+from .layout import LayoutService
+from .jobs import JobService
+from .history import HistoryService
+from .aio import AsyncAuthService, AsyncBoatService, AsyncMapService
 
-__all__ = ["AuthService", "BoatService", "MapService"]
+__all__ = [
+    "AuthService", "BoatService", "MapService", "BoatImportService", "ExportService", "LayoutService", "JobService",
+    "HistoryService",
+    "AsyncAuthService", "AsyncBoatService", "AsyncMapService"
+]
 
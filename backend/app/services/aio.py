@@ -0,0 +1,31 @@
+from functools import wraps
+from sqlalchemy.ext.asyncio import AsyncSession
+from .auth import AuthService
+from .boat import BoatService
+from .map import MapService
+
+def _run_sync(method):
+    """Wrap a sync service method so it runs on an AsyncSession"""
+    @wraps(method)
+    async def wrapper(db: AsyncSession, *args, **kwargs):
+        return await db.run_sync(method, *args, **kwargs)
+    return staticmethod(wrapper)
+
+def _async_service(service: type) -> type:
+    """Build the async counterpart of a service class.
+
+    Every public method keeps its signature but takes an AsyncSession and
+    is awaited; the query logic is shared with the sync service through
+    ``AsyncSession.run_sync``, so both modes stay in lockstep.
+    """
+    methods = {
+        name: _run_sync(getattr(service, name))
+        for name, value in vars(service).items()
+        if isinstance(value, staticmethod) and not name.startswith("_")
+    }
+    methods["__doc__"] = f"Async counterpart of {service.__name__}"
+    return type(f"Async{service.__name__}", (), methods)
+
+AsyncAuthService = _async_service(AuthService)
+AsyncBoatService = _async_service(BoatService)
+AsyncMapService = _async_service(MapService)
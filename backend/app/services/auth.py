@@ -5,6 +5,27 @@ from ..models.user import User
 from ..schemas.user import UserCreate, UserUpdate
 from ..core.security import get_password_hash, verify_password
 from ..core.exceptions import NotFoundError, ValidationError
+from ..core.cache import TTLCache
+from ..core.config import settings
+from ..core.metrics import register_metrics
+
+# Authenticated user identities keyed by token subject (email). Entries are
+# evicted on update_user in this process; the TTL bounds staleness across
+# workers.
+user_cache = TTLCache(maxsize=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS)
+register_metrics("user_cache", user_cache.stats)
+
+def _identity(user: User) -> User:
+    """Detached copy of the user fields needed to authorize requests"""
+    return User(
+        id=user.id,
+        email=user.email,
+        full_name=user.full_name,
+        role=user.role,
+        is_active=user.is_active,
+        created_at=user.created_at,
+        updated_at=user.updated_at
+    )
 
 class AuthService:
     """Service layer for authentication and user management"""
@@ -14,6 +35,18 @@ class AuthService:
         """Get user by email address"""
         return db.query(User).filter(User.email == email).first()
     
+    @staticmethod
+    def get_cached_user(db: Session, email: str) -> Optional[User]:
+        """Get a read-only user identity by email, served from the user cache"""
+        user = user_cache.get(email)
+        if user is None:
+            db_user = AuthService.get_user_by_email(db, email)
+            if db_user is None:
+                return None
+            user = _identity(db_user)
+            user_cache.set(email, user)
+        return user
+    
     @staticmethod
     def get_user_by_id(db: Session, user_id: int) -> Optional[User]:
         """Get user by ID"""
@@ -69,10 +102,15 @@ class AuthService:
         if "password" in update_data:
             update_data["hashed_password"] = get_password_hash(update_data.pop("password"))
         
+        previous_email = db_user.email
         for field, value in update_data.items():
             setattr(db_user, field, value)
         
         db.commit()
         db.refresh(db_user)
+        
+        # Role, email or active flag may have changed
+        user_cache.delete(previous_email)
+        user_cache.delete(db_user.email)
         return db_user
 
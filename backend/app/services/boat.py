@@ -1,12 +1,61 @@
 # backend/app/services/boat.py
-from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
-from ..models.boat_listing import BoatListing
-from ..models.boat_position import BoatPosition
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any, Tuple
+from sqlalchemy.orm import Session, Query, joinedload
+from sqlalchemy import Float, cast, func, update
+from ..models.boat_listing import BoatListing, LENGTH_SORT_KEY
+from ..models.boat_position import BoatPosition, GEOMETRY_DEFAULTS
+from ..models.position_tombstone import PositionTombstone
 from ..schemas.boat_listing import BoatListingCreate, BoatListingUpdate
-from ..schemas.boat_position import BoatPositionCreate, BoatPositionUpdate
-from ..core.exceptions import NotFoundError, ValidationError, DuplicateError
+from ..schemas.boat_position import BoatPositionCreate, BoatPositionUpdate, BoatPositionBulkItem
+from ..core.exceptions import ConflictError, NotFoundError, ValidationError, DuplicateError
+from ..core.geometry import (
+    Bounds, corners_overlap, footprint_bounds, footprint_corners, overlapping_pairs
+)
+from ..core.pagination import SortKey, paginate
+from ..core.realtime import broadcaster
+from .revisions import BOATS_COUNTER, bump_counter, bump_map_revision, get_counter
+from .history import history_row, record_history
+
+# Fields sent in change feed events
+POSITION_EVENT_FIELDS = (
+    "id", "map_id", "x", "y", "width", "height", "rotation",
+    "color", "stroke_color", "stroke_width", "is_visible",
+)
+BOAT_EVENT_FIELDS = (
+    "id", "index", "name", "customer_name", "size", "make_model",
+    "vehicle_type", "section", "notes", "is_mapped", "position_id", "length_ft", "beam_ft",
+)
+
+def _fields(obj: Any, names: Tuple[str, ...]) -> Dict[str, Any]:
+    return {name: getattr(obj, name) for name in names}
+
+def _touch(db: Session, position: BoatPosition) -> int:
+    """Stamp a position with the next revision of its map"""
+    position.revision = bump_map_revision(db, position.map_id)
+    return position.revision
+
+def _tombstone(db: Session, position: BoatPosition) -> int:
+    """Record a position deletion at the next revision of its map"""
+    revision = bump_map_revision(db, position.map_id)
+    db.add(PositionTombstone(map_id=position.map_id, position_id=position.id, revision=revision))
+    return revision
+
+def _search_document():
+    """Searchable listing columns joined into one expression (see core.search)"""
+    separator = " | "
+    columns = [
+        BoatListing.name,
+        BoatListing.customer_name,
+        BoatListing.make_model,
+        BoatListing.vehicle_type,
+        BoatListing.size,
+        BoatListing.notes,
+    ]
+    document = func.coalesce(columns[0], "")
+    for column in columns[1:]:
+        document = document + separator + func.coalesce(column, "")
+    return document
 
 class BoatService:
     """Service layer for boat management"""
@@ -23,28 +72,32 @@ class BoatService:
         return db.query(BoatListing).filter(BoatListing.index == index).first()
     
     @staticmethod
-    def get_boats(
+    def _filtered_boats_query(
         db: Session,
-        skip: int = 0,
-        limit: int = 100,
         search: Optional[str] = None,
         mapped_only: Optional[bool] = None,
-        section: Optional[str] = None
-    ) -> List[BoatListing]:
-        """Get boat listings with filters and pagination"""
+        section: Optional[str] = None,
+        min_length: Optional[float] = None,
+        max_length: Optional[float] = None,
+        sort: str = "index"
+    ) -> Tuple[Query, List[SortKey]]:
+        """Build the filtered boat listing query and its sort keys
+        
+        ``sort`` is "index", or "length" / "-length" for shortest or longest
+        first (ties by index in the same direction, so one index serves
+        both); it replaces search relevance as the order.
+        """
         query = db.query(BoatListing)
+        sort_keys = [(BoatListing.index, False)]
         
-        # Search filter
+        # Search filter, served by the trigram index and ranked by relevance
         if search:
-            search_filter = or_(
-                BoatListing.name.ilike(f"%{search}%"),
-                BoatListing.customer_name.ilike(f"%{search}%"),
-                BoatListing.make_model.ilike(f"%{search}%"),
-                BoatListing.vehicle_type.ilike(f"%{search}%"),
-                BoatListing.size.ilike(f"%{search}%"),
-                BoatListing.notes.ilike(f"%{search}%")
-            )
-            query = query.filter(search_filter)
+            document = _search_document()
+            query = query.filter(document.ilike(f"%{search}%"))
+            # word_similarity is a float4 whose text form loses bits on the way
+            # back through a cursor; as float8 the value round-trips exactly
+            relevance = cast(func.word_similarity(search, document), Float(53))
+            sort_keys.insert(0, (relevance, True))
         
         # Mapped filter
         if mapped_only is not None:
@@ -54,7 +107,60 @@ class BoatService:
         if section:
             query = query.filter(BoatListing.section == section.upper())
         
-        return query.order_by(BoatListing.index).offset(skip).limit(limit).all()
+        # Length filters use the parsed column, so boats of unknown size drop out
+        if min_length is not None:
+            query = query.filter(BoatListing.length_ft >= min_length)
+        if max_length is not None:
+            query = query.filter(BoatListing.length_ft <= max_length)
+        
+        if sort in ("length", "-length"):
+            descending = sort == "-length"
+            sort_keys = [(LENGTH_SORT_KEY, descending), (BoatListing.index, descending)]
+        
+        return query, sort_keys
+    
+    @staticmethod
+    def get_boats(
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        search: Optional[str] = None,
+        mapped_only: Optional[bool] = None,
+        section: Optional[str] = None,
+        min_length: Optional[float] = None,
+        max_length: Optional[float] = None,
+        sort: str = "index"
+    ) -> List[BoatListing]:
+        """Get boat listings with filters and pagination"""
+        query, sort_keys = BoatService._filtered_boats_query(
+            db, search, mapped_only, section, min_length, max_length, sort
+        )
+        ordering = [column.desc() if descending else column for column, descending in sort_keys]
+        return query.order_by(*ordering).offset(skip).limit(limit).all()
+    
+    @staticmethod
+    def get_boats_page(
+        db: Session,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        search: Optional[str] = None,
+        mapped_only: Optional[bool] = None,
+        section: Optional[str] = None,
+        min_length: Optional[float] = None,
+        max_length: Optional[float] = None,
+        sort: str = "index"
+    ) -> Dict[str, Any]:
+        """Get a keyset-paginated page of boat listings with next/prev cursors"""
+        query, sort_keys = BoatService._filtered_boats_query(
+            db, search, mapped_only, section, min_length, max_length, sort
+        )
+        return paginate(query, sort_keys, limit, cursor=cursor, skip=skip)
+    
+    @staticmethod
+    def get_boats_revision(db: Session) -> int:
+        """Get the revision of the boat listing collection (bumped by every boat write)"""
+        return get_counter(db, BOATS_COUNTER)
     
     @staticmethod
     def create_boat(db: Session, boat_create: BoatListingCreate) -> BoatListing:
@@ -65,6 +171,7 @@ class BoatService:
         
         db_boat = BoatListing(**boat_create.dict())
         db.add(db_boat)
+        bump_counter(db, BOATS_COUNTER)
         db.commit()
         db.refresh(db_boat)
         return db_boat
@@ -86,8 +193,17 @@ class BoatService:
         for field, value in update_data.items():
             setattr(db_boat, field, value)
         
+        position = db_boat.position
+        if position:
+            map_id, revision = position.map_id, _touch(db, position)
+        bump_counter(db, BOATS_COUNTER)
+        
         db.commit()
         db.refresh(db_boat)
+        if position:
+            broadcaster.publish(map_id, {
+                "type": "boat.updated", "revision": revision, "boat": _fields(db_boat, BOAT_EVENT_FIELDS)
+            })
         return db_boat
     
     @staticmethod
@@ -98,11 +214,21 @@ class BoatService:
             raise NotFoundError("Boat not found")
         
         # Delete associated position first (cascade should handle this)
-        if db_boat.position:
-            db.delete(db_boat.position)
+        position = db_boat.position
+        if position:
+            map_id, position_id, revision = position.map_id, position.id, _tombstone(db, position)
+            record_history(db, [
+                history_row(map_id, position_id, position.geometry(), None, datetime.now(timezone.utc), removed=True)
+            ])
+            db.delete(position)
         
         db.delete(db_boat)
+        bump_counter(db, BOATS_COUNTER)
         db.commit()
+        if position:
+            broadcaster.publish(map_id, {
+                "type": "position.deleted", "revision": revision, "position_id": position_id
+            })
         return True
     
     # Boat Position methods
@@ -112,34 +238,198 @@ class BoatService:
         return db.query(BoatPosition).filter(BoatPosition.id == position_id).first()
     
     @staticmethod
-    def get_positions_by_map(db: Session, map_id: int) -> List[BoatPosition]:
-        """Get all boat positions for a specific map"""
-        return db.query(BoatPosition).filter(BoatPosition.map_id == map_id).all()
+    def get_positions_by_map(db: Session, map_id: int, bbox: Optional[Bounds] = None) -> List[BoatPosition]:
+        """Get all boat positions for a specific map, or those whose footprint meets ``bbox``
+        
+        The viewport query walks the (map_id, bbox_x0, bbox_y0) index. A
+        footprint can start at most ``bbox_size`` (the map's largest) before
+        the viewport, which bounds the range scanned on both axes.
+        """
+        query = db.query(BoatPosition).filter(BoatPosition.map_id == map_id)
+        if bbox is None:
+            return query.all()
+        query = BoatService._meeting_bbox(db, query, map_id, bbox)
+        return [] if query is None else query.order_by(BoatPosition.id).all()
+    
+    @staticmethod
+    def _meeting_bbox(db: Session, query: Query, map_id: int, bbox: Bounds) -> Optional[Query]:
+        # None when the map has no positions
+        x0, y0, x1, y1 = bbox
+        largest = (
+            db.query(func.max(BoatPosition.bbox_size)).filter(BoatPosition.map_id == map_id).scalar()
+        )
+        if largest is None:
+            return None
+        return query.filter(
+            BoatPosition.bbox_x0.between(x0 - largest, x1),
+            BoatPosition.bbox_y0.between(y0 - largest, y1),
+            BoatPosition.bbox_x1 >= x0,
+            BoatPosition.bbox_y1 >= y0,
+        )
+    
+    @staticmethod
+    def get_footprints(db: Session, map_id: int, bbox: Optional[Bounds] = None) -> List[Tuple]:
+        """``(id, x, y, width, height, rotation)`` rows for a map, without loading positions"""
+        query = db.query(
+            BoatPosition.id, *(getattr(BoatPosition, field) for field in GEOMETRY_DEFAULTS)
+        ).filter(BoatPosition.map_id == map_id)
+        if bbox is not None:
+            query = BoatService._meeting_bbox(db, query, map_id, bbox)
+            if query is None:
+                return []
+        return [tuple(row) for row in query]
     
     @staticmethod
-    def create_position(db: Session, position_create: BoatPositionCreate) -> BoatPosition:
-        """Create new boat position"""
+    def get_overlapping_positions(
+        db: Session,
+        map_id: int,
+        geometry: Dict[str, float],
+        exclude_id: Optional[int] = None
+    ) -> List[BoatPosition]:
+        """Positions on a map whose footprint overlaps ``geometry``
+        
+        Candidates come from the bbox index; each is confirmed with the
+        separating-axis test on the rotated rectangles.
+        """
+        corners = footprint_corners(**geometry)
+        candidates = BoatService.get_positions_by_map(db, map_id, footprint_bounds(**geometry))
+        return [
+            position for position in candidates
+            if position.id != exclude_id and corners_overlap(corners, footprint_corners(**position.geometry()))
+        ]
+    
+    @staticmethod
+    def get_map_overlaps(db: Session, map_id: int) -> List[Tuple[int, int]]:
+        """Every pair of overlapping positions on a map, as (lower id, higher id)"""
+        footprints = BoatService.get_footprints(db, map_id)
+        return overlapping_pairs({row[0]: row[1:] for row in footprints})
+    
+    @staticmethod
+    def _check_overlaps(
+        db: Session, map_id: int, geometry: Dict[str, float], exclude_id: Optional[int] = None
+    ) -> None:
+        overlaps = BoatService.get_overlapping_positions(db, map_id, geometry, exclude_id)
+        if overlaps:
+            ids = ", ".join(str(position.id) for position in overlaps)
+            raise ConflictError(f"Position overlaps positions {ids}")
+    
+    @staticmethod
+    def create_position(
+        db: Session, position_create: BoatPositionCreate, reject_overlaps: bool = False
+    ) -> BoatPosition:
+        """Create new boat position, optionally refusing one that overlaps another"""
         db_position = BoatPosition(**position_create.dict())
+        if reject_overlaps:
+            BoatService._check_overlaps(db, db_position.map_id, db_position.geometry())
+        _touch(db, db_position)
         db.add(db_position)
+        db.flush()
+        record_history(db, [
+            history_row(db_position.map_id, db_position.id, db_position.geometry(), None, datetime.now(timezone.utc))
+        ])
         db.commit()
         db.refresh(db_position)
+        broadcaster.publish(db_position.map_id, {
+            "type": "position.created",
+            "revision": db_position.revision,
+            "position": _fields(db_position, POSITION_EVENT_FIELDS)
+        })
         return db_position
     
     @staticmethod
-    def update_position(db: Session, position_id: int, position_update: BoatPositionUpdate) -> BoatPosition:
-        """Update existing boat position"""
+    def update_position(
+        db: Session,
+        position_id: int,
+        position_update: BoatPositionUpdate,
+        reject_overlaps: bool = False
+    ) -> BoatPosition:
+        """Update existing boat position, optionally refusing a move onto another"""
         db_position = BoatService.get_position_by_id(db, position_id)
         if not db_position:
             raise NotFoundError("Position not found")
         
         update_data = position_update.dict(exclude_unset=True)
+        if reject_overlaps:
+            geometry = db_position.geometry()
+            geometry.update({k: v for k, v in update_data.items() if k in geometry and v is not None})
+            BoatService._check_overlaps(db, db_position.map_id, geometry, exclude_id=position_id)
         for field, value in update_data.items():
             setattr(db_position, field, value)
         
+        _touch(db, db_position)
+        boat = db_position.boat_listing
+        record_history(db, [history_row(
+            db_position.map_id, position_id, db_position.geometry(),
+            boat.id if boat else None, datetime.now(timezone.utc)
+        )])
         db.commit()
         db.refresh(db_position)
+        broadcaster.publish(db_position.map_id, {
+            "type": "position.updated",
+            "revision": db_position.revision,
+            "position": _fields(db_position, POSITION_EVENT_FIELDS)
+        })
         return db_position
     
+    @staticmethod
+    def bulk_update_positions(db: Session, items: List[BoatPositionBulkItem]) -> List[BoatPosition]:
+        """Update many boat positions in one transaction"""
+        ids = [item.id for item in items]
+        current = {
+            row.id: row
+            for row in db.query(
+                BoatPosition.id, BoatPosition.map_id, *(getattr(BoatPosition, f) for f in GEOMETRY_DEFAULTS)
+            ).filter(BoatPosition.id.in_(ids))
+        }
+        map_ids = {position_id: row.map_id for position_id, row in current.items()}
+        missing = [position_id for position_id in ids if position_id not in map_ids]
+        if missing:
+            raise NotFoundError(f"Positions not found: {', '.join(map(str, missing))}")
+        
+        # One revision per touched map, bumped in id order to avoid lock cycles
+        revisions = {
+            map_id: bump_map_revision(db, map_id) for map_id in sorted(set(map_ids.values()))
+        }
+        
+        # ORM bulk UPDATE by primary key: one executemany per distinct field set.
+        # It bypasses mapper events, so the bounds are computed here
+        now = datetime.now(timezone.utc)
+        boat_ids = dict(
+            db.query(BoatListing.position_id, BoatListing.id).filter(BoatListing.position_id.in_(ids))
+        )
+        rows = []
+        history = []
+        for item in items:
+            # Every position column is NOT NULL, so an explicit null leaves it as is
+            changes = {k: v for k, v in item.dict(exclude_unset=True).items() if v is not None}
+            geometry = {
+                name: changes.get(name, getattr(current[item.id], name)) for name in GEOMETRY_DEFAULTS
+            }
+            rows.append({
+                **changes,
+                **BoatPosition.bounds_values(**geometry),
+                "id": item.id,
+                "updated_at": now,
+                "revision": revisions[map_ids[item.id]],
+            })
+            history.append(history_row(map_ids[item.id], item.id, geometry, boat_ids.get(item.id), now))
+        db.execute(update(BoatPosition), rows)
+        record_history(db, history)
+        db.commit()
+        
+        positions = {
+            position.id: position
+            for position in db.query(BoatPosition).filter(BoatPosition.id.in_(ids))
+        }
+        for position_id in ids:
+            position = positions[position_id]
+            broadcaster.publish(position.map_id, {
+                "type": "position.updated",
+                "revision": position.revision,
+                "position": _fields(position, POSITION_EVENT_FIELDS)
+            })
+        return [positions[position_id] for position_id in ids]
+    
     @staticmethod
     def delete_position(db: Session, position_id: int) -> bool:
         """Delete boat position"""
@@ -151,9 +441,17 @@ class BoatService:
         if db_position.boat_listing:
             db_position.boat_listing.is_mapped = False
             db_position.boat_listing.position_id = None
+            bump_counter(db, BOATS_COUNTER)
         
+        map_id, revision = db_position.map_id, _tombstone(db, db_position)
+        record_history(db, [
+            history_row(map_id, position_id, db_position.geometry(), None, datetime.now(timezone.utc), removed=True)
+        ])
         db.delete(db_position)
         db.commit()
+        broadcaster.publish(map_id, {
+            "type": "position.deleted", "revision": revision, "position_id": position_id
+        })
         return True
     
     @staticmethod
@@ -172,15 +470,38 @@ class BoatService:
             raise ValidationError("Position already assigned to another boat")
         
         # Unassign boat from previous position if any
-        if db_boat.position:
-            db_boat.position.boat_listing = None
+        now = datetime.now(timezone.utc)
+        history = []
+        previous = db_boat.position
+        if previous:
+            previous_map_id, previous_id = previous.map_id, previous.id
+            previous_revision = _touch(db, previous)
+            history.append(history_row(previous_map_id, previous_id, previous.geometry(), None, now))
+            previous.boat_listing = None
+        map_id, revision = db_position.map_id, _touch(db, db_position)
+        history.append(history_row(map_id, position_id, db_position.geometry(), boat_id, now))
+        record_history(db, history)
         
         # Assign boat to new position
         db_boat.position_id = position_id
         db_boat.is_mapped = True
+        bump_counter(db, BOATS_COUNTER)
         
         db.commit()
         db.refresh(db_boat)
+        if previous:
+            broadcaster.publish(previous_map_id, {
+                "type": "boat.unassigned",
+                "revision": previous_revision,
+                "position_id": previous_id,
+                "boat_id": boat_id
+            })
+        broadcaster.publish(map_id, {
+            "type": "boat.assigned",
+            "revision": revision,
+            "position_id": position_id,
+            "boat": _fields(db_boat, BOAT_EVENT_FIELDS)
+        })
         return db_boat
     
     @staticmethod
@@ -193,18 +514,27 @@ class BoatService:
         if not db_boat.position:
             raise ValidationError("Boat is not currently assigned to any position")
         
+        previous = db_boat.position
+        map_id, previous_id, revision = previous.map_id, previous.id, _touch(db, previous)
+        record_history(db, [history_row(map_id, previous_id, previous.geometry(), None, datetime.now(timezone.utc))])
         db_boat.position_id = None
         db_boat.is_mapped = False
+        bump_counter(db, BOATS_COUNTER)
         
         db.commit()
         db.refresh(db_boat)
+        broadcaster.publish(map_id, {
+            "type": "boat.unassigned", "revision": revision, "position_id": previous_id, "boat_id": boat_id
+        })
         return db_boat
     
     @staticmethod
     def get_boats_with_positions(db: Session, map_id: int) -> List[Dict[str, Any]]:
         """Get all boats with their positions for a specific map"""
-        # Get all positions for the map
-        positions = BoatService.get_positions_by_map(db, map_id)
+        # Load positions together with their listings in a single query
+        positions = db.query(BoatPosition).options(
+            joinedload(BoatPosition.boat_listing)
+        ).filter(BoatPosition.map_id == map_id).all()
         
         result = []
         for position in positions:
@@ -0,0 +1,151 @@
+import csv
+import io
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+from pydantic import ValidationError as PydanticValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+from ..models.boat_listing import BoatListing
+from ..schemas.boat_listing import BoatListingCreate
+from ..core.exceptions import ValidationError
+from .revisions import BOATS_COUNTER, bump_counter
+
+# (row number in the source file, raw column values)
+ImportRow = Tuple[int, Dict[str, Any]]
+
+IMPORT_FIELDS = set(BoatListingCreate.model_fields)
+MAX_REPORTED_ERRORS = 1000
+
+def _normalize_header(header: Any) -> str:
+    """Map a column header such as 'Customer Name' to a field name"""
+    return str(header or "").strip().lower().replace(" ", "_").replace("-", "_")
+
+def _clean(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep known fields and turn blank cells into missing values"""
+    cleaned = {}
+    for field, value in row.items():
+        if field not in IMPORT_FIELDS or value is None:
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+            if not value:
+                continue
+        cleaned[field] = value
+    return cleaned
+
+def _row_index(data: Dict[str, Any]) -> Optional[Any]:
+    """Best-effort index of a row for error reports"""
+    value = data.get("index")
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return value
+
+def _error_message(error: PydanticValidationError) -> str:
+    """Flatten pydantic errors into one line"""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}" for item in error.errors()
+    )
+
+class BoatImportService:
+    """Streaming bulk import of boat listings"""
+
+    @staticmethod
+    def iter_csv_rows(stream: TextIO) -> Iterator[ImportRow]:
+        """Yield rows from a CSV text stream one at a time"""
+        reader = csv.reader(stream)
+        try:
+            headers = [_normalize_header(h) for h in next(reader)]
+        except StopIteration:
+            return
+        for row in reader:
+            if any(cell.strip() for cell in row):
+                yield reader.line_num, dict(zip(headers, row))
+
+    @staticmethod
+    def iter_xlsx_rows(stream: BinaryIO) -> Iterator[ImportRow]:
+        """Yield rows from the first sheet of an XLSX workbook (needs openpyxl)"""
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            raise ValidationError("XLSX import requires the openpyxl package")
+
+        workbook = load_workbook(stream, read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            try:
+                headers = [_normalize_header(h) for h in next(rows)]
+            except StopIteration:
+                return
+            for row_number, row in enumerate(rows, start=2):
+                if any(cell not in (None, "") for cell in row):
+                    yield row_number, dict(zip(headers, row))
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def iter_upload_rows(stream: BinaryIO, filename: Optional[str]) -> Iterator[ImportRow]:
+        """Rows of an uploaded file, read as CSV or XLSX by its extension"""
+        filename = (filename or "").lower()
+        if filename.endswith(".xlsx"):
+            return BoatImportService.iter_xlsx_rows(stream)
+        if filename.endswith(".csv") or not filename:
+            return BoatImportService.iter_csv_rows(
+                io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+            )
+        raise ValidationError("Import file must be .csv or .xlsx")
+    
+    @staticmethod
+    def import_boats(
+        db: Session,
+        rows: Iterable[ImportRow],
+        batch_size: int = 1000,
+        progress: Optional[Callable[[int], None]] = None
+    ) -> Dict[str, Any]:
+        """Validate and insert boat listings in batched transactions
+
+        Rows that fail validation or reuse an index are reported and
+        skipped; every other row is inserted. ``progress`` is called with
+        the number of rows read after every committed batch.
+        """
+        existing_indexes = set(db.scalars(select(BoatListing.index)))
+        batch: List[Dict[str, Any]] = []
+        errors: List[Dict[str, Any]] = []
+        total = created = error_count = 0
+
+        def report(row_number: int, index: Optional[Any], message: str) -> None:
+            nonlocal error_count
+            error_count += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append({"row": row_number, "index": index, "message": message})
+
+        def flush() -> None:
+            nonlocal created
+            if batch:
+                db.execute(insert(BoatListing), batch)
+                bump_counter(db, BOATS_COUNTER)
+                db.commit()
+                created += len(batch)
+                batch.clear()
+                if progress is not None:
+                    progress(total)
+
+        for row_number, raw in rows:
+            total += 1
+            data = _clean(raw)
+            try:
+                boat = BoatListingCreate(**data)
+            except PydanticValidationError as error:
+                report(row_number, _row_index(data), _error_message(error))
+                continue
+
+            if boat.index in existing_indexes:
+                report(row_number, boat.index, f"Boat with index {boat.index} already exists")
+                continue
+
+            existing_indexes.add(boat.index)
+            batch.append({**boat.dict(), **BoatListing.size_values(boat.size)})
+            if len(batch) >= batch_size:
+                flush()
+
+        flush()
+        return {"rows": total, "created": created, "error_count": error_count, "errors": errors}
@@ -0,0 +1,131 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, Iterable, Iterator, Optional
+from sqlalchemy.orm import Session, Query
+from ..models.boat_listing import BoatListing
+from ..models.boat_position import BoatPosition
+from .boat import BoatService
+
+# Export format -> response media type
+EXPORT_FORMATS = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+# Rows fetched per server-side cursor batch and written per response chunk
+EXPORT_BATCH_SIZE = 1000
+
+# Leading columns match the import headers so an export can be re-imported
+BOAT_EXPORT_COLUMNS = [
+    BoatListing.index,
+    BoatListing.name,
+    BoatListing.customer_name,
+    BoatListing.size,
+    BoatListing.make_model,
+    BoatListing.vehicle_type,
+    BoatListing.section,
+    BoatListing.notes,
+    BoatListing.id,
+    BoatListing.is_mapped,
+    BoatListing.position_id,
+    BoatListing.created_at,
+    BoatListing.updated_at,
+]
+
+POSITION_EXPORT_COLUMNS = [
+    BoatPosition.id.label("position_id"),
+    BoatPosition.map_id,
+    BoatPosition.x,
+    BoatPosition.y,
+    BoatPosition.width,
+    BoatPosition.height,
+    BoatPosition.rotation,
+    BoatPosition.color,
+    BoatPosition.stroke_color,
+    BoatPosition.stroke_width,
+    BoatPosition.is_visible,
+    BoatListing.id.label("boat_id"),
+    BoatListing.index,
+    BoatListing.name,
+    BoatListing.customer_name,
+    BoatListing.size,
+    BoatListing.make_model,
+    BoatListing.vehicle_type,
+    BoatListing.section,
+]
+
+def _plain(value: Any) -> Any:
+    """Render values that csv/json cannot write directly"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+class ExportService:
+    """Streaming export of boats and map positions"""
+
+    @staticmethod
+    def boats_query(
+        db: Session,
+        search: Optional[str] = None,
+        mapped_only: Optional[bool] = None,
+        section: Optional[str] = None,
+        min_length: Optional[float] = None,
+        max_length: Optional[float] = None,
+        sort: str = "index"
+    ) -> Query:
+        """Column-only boat listing query using the GET /boats filters"""
+        query, sort_keys = BoatService._filtered_boats_query(
+            db, search, mapped_only, section, min_length, max_length, sort
+        )
+        order = [key.desc() if descending else key.asc() for key, descending in sort_keys]
+        return query.with_entities(*BOAT_EXPORT_COLUMNS).order_by(*order)
+
+    @staticmethod
+    def map_positions_query(db: Session, map_id: int) -> Query:
+        """Column-only query of a map's positions with their assigned boats"""
+        return (
+            db.query(*POSITION_EXPORT_COLUMNS)
+            .outerjoin(BoatListing, BoatListing.position_id == BoatPosition.id)
+            .filter(BoatPosition.map_id == map_id)
+            .order_by(BoatPosition.id)
+        )
+
+    @staticmethod
+    def stream(query: Query, fmt: str, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[str]:
+        """Serialize query rows as CSV or NDJSON, one chunk per batch
+
+        Rows come from a server-side cursor (``yield_per``), so memory use
+        stays bounded by ``batch_size`` however large the table is.
+        """
+        rows = query.yield_per(batch_size)
+        if fmt == "csv":
+            return ExportService._csv_chunks(rows, [c["name"] for c in query.column_descriptions], batch_size)
+        if fmt == "ndjson":
+            return ExportService._ndjson_chunks(rows, batch_size)
+        raise ValueError(f"Unknown export format: {fmt}")
+
+    @staticmethod
+    def _csv_chunks(rows: Iterable, headers: list, batch_size: int) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(headers)
+        pending = 0
+        for row in rows:
+            writer.writerow([_plain(value) for value in row])
+            pending += 1
+            if pending >= batch_size:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+                pending = 0
+        yield buffer.getvalue()
+
+    @staticmethod
+    def _ndjson_chunks(rows: Iterable, batch_size: int) -> Iterator[str]:
+        lines = []
+        for row in rows:
+            lines.append(json.dumps(row._asdict(), default=_plain) + "\n")
+            if len(lines) >= batch_size:
+                yield "".join(lines)
+                lines.clear()
+        if lines:
+            yield "".join(lines)
@@ -0,0 +1,195 @@
+import math
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from ..models.boat_listing import BoatListing
+from ..models.map import Map
+from ..models.position_history import PositionHistory
+from ..models.position_history_checkpoint import PositionHistoryCheckpoint
+from ..core.config import settings
+from ..core.exceptions import NotFoundError, ValidationError
+
+# position_id -> (boat_id, x, y, rotation)
+State = Dict[int, Tuple[Optional[int], float, float, float]]
+
+def utc(ts: datetime) -> datetime:
+    """A timestamp in UTC; naive ones are taken to be UTC already"""
+    return ts.replace(tzinfo=timezone.utc) if ts.tzinfo is None else ts.astimezone(timezone.utc)
+
+def history_row(
+    map_id: int,
+    position_id: int,
+    geometry: Mapping[str, float],
+    boat_id: Optional[int],
+    ts: datetime,
+    removed: bool = False
+) -> Dict[str, Any]:
+    """History values for a position after a change; ``geometry`` holds its x, y and rotation"""
+    return {
+        "map_id": map_id,
+        "position_id": position_id,
+        "boat_id": boat_id,
+        "x": geometry["x"],
+        "y": geometry["y"],
+        "rotation": geometry["rotation"],
+        "removed": removed,
+        "ts": ts,
+    }
+
+def _boundary_before(ts: datetime, interval: float) -> datetime:
+    """The last checkpoint boundary (a multiple of ``interval`` since the epoch) before ``ts``"""
+    return datetime.fromtimestamp((math.ceil(ts.timestamp() / interval) - 1) * interval, timezone.utc)
+
+def _historical(position_id: int, values: Tuple) -> Dict[str, Any]:
+    boat_id, x, y, rotation = values
+    return {"position_id": position_id, "boat_id": boat_id, "x": x, "y": y, "rotation": rotation}
+
+def _boats(state: State) -> Dict[int, Dict[str, Any]]:
+    """Where each boat in a map state sits"""
+    return {
+        values[0]: _historical(position_id, values)
+        for position_id, values in state.items() if values[0] is not None
+    }
+
+def record_history(db: Session, rows: Iterable[Dict[str, Any]]) -> None:
+    """Append history rows inside the current transaction, in one INSERT"""
+    rows = list(rows)
+    if rows:
+        db.execute(insert(PositionHistory), rows)
+
+def _save_checkpoints(db: Session, checkpoints: List[Dict[str, Any]]) -> None:
+    """Write checkpoints in a short-lived session of their own
+
+    They are found by reads, which must never commit or roll back the
+    caller's transaction.
+    """
+    with Session(bind=db.get_bind()) as session:
+        try:
+            session.execute(insert(PositionHistoryCheckpoint), checkpoints)
+            session.commit()
+        except IntegrityError:
+            # A concurrent read wrote the same checkpoints
+            session.rollback()
+
+class HistoryService:
+    """Reading the position history"""
+    
+    @staticmethod
+    def get_boat_history(
+        db: Session, boat_id: int, until: Optional[datetime] = None, limit: int = 100
+    ) -> List[PositionHistory]:
+        """Where a boat sat after each change while it was on a map, newest first"""
+        query = db.query(PositionHistory).filter(PositionHistory.boat_id == boat_id)
+        if until is not None:
+            query = query.filter(PositionHistory.ts <= utc(until))
+        rows = query.order_by(PositionHistory.ts.desc(), PositionHistory.id.desc()).limit(limit).all()
+        # History outlives deleted boats; only a boat with neither is unknown
+        if not rows and db.get(BoatListing, boat_id) is None:
+            raise NotFoundError("Boat not found")
+        return rows
+    
+    @staticmethod
+    def _state_at(db: Session, map_id: int, ts: datetime) -> State:
+        """Positions of a map at ``ts``: the latest checkpoint plus the changes after it
+        
+        Checkpoints are folded lazily at every interval boundary the replay
+        passes, once the boundary is ``HISTORY_CHECKPOINT_SETTLE_SECONDS``
+        old (so transactions still in flight cannot land behind it), and
+        only for intervals with changes. Each replay therefore reads at
+        most one interval of the map's history through the (map_id, ts) index.
+        """
+        checkpoint = (
+            db.query(PositionHistoryCheckpoint)
+            .filter(PositionHistoryCheckpoint.map_id == map_id, PositionHistoryCheckpoint.ts <= ts)
+            .order_by(PositionHistoryCheckpoint.ts.desc())
+            .first()
+        )
+        state: State = {row[0]: tuple(row[1:]) for row in checkpoint.positions} if checkpoint else {}
+        last_checkpoint = utc(checkpoint.ts) if checkpoint else None
+        
+        query = select(
+            PositionHistory.position_id, PositionHistory.boat_id, PositionHistory.x, PositionHistory.y,
+            PositionHistory.rotation, PositionHistory.removed, PositionHistory.ts
+        ).where(PositionHistory.map_id == map_id, PositionHistory.ts <= ts)
+        if last_checkpoint is not None:
+            query = query.where(PositionHistory.ts > last_checkpoint)
+        
+        interval = settings.HISTORY_CHECKPOINT_INTERVAL_SECONDS
+        settled = min(ts, datetime.now(timezone.utc) - timedelta(seconds=settings.HISTORY_CHECKPOINT_SETTLE_SECONDS))
+        new_checkpoints: List[Dict[str, Any]] = []
+        applied: Optional[datetime] = None  # ts of the last change folded into ``state``
+        
+        def save(boundary: datetime) -> None:
+            new_checkpoints.append({
+                "map_id": map_id,
+                "ts": boundary,
+                "positions": [[position_id, *values] for position_id, values in sorted(state.items())],
+            })
+        
+        for row in db.execute(query.order_by(PositionHistory.ts, PositionHistory.id)):
+            row_ts = utc(row.ts)
+            if interval and applied is not None:
+                # Every change so far is at or before the boundary below this one
+                boundary = _boundary_before(row_ts, interval)
+                if applied <= boundary <= settled and (last_checkpoint is None or boundary > last_checkpoint):
+                    save(boundary)
+                    last_checkpoint = boundary
+            if row.removed:
+                state.pop(row.position_id, None)
+            else:
+                state[row.position_id] = (row.boat_id, row.x, row.y, row.rotation)
+            applied = row_ts
+        
+        if interval and applied is not None:
+            boundary = datetime.fromtimestamp(math.floor(settled.timestamp() / interval) * interval, timezone.utc)
+            if applied <= boundary and (last_checkpoint is None or boundary > last_checkpoint):
+                save(boundary)
+        
+        if new_checkpoints:
+            _save_checkpoints(db, new_checkpoints)
+        return state
+    
+    @staticmethod
+    def _check_map(db: Session, map_id: int) -> None:
+        if db.get(Map, map_id) is None:
+            raise NotFoundError("Map not found")
+    
+    @staticmethod
+    def get_map_at(db: Session, map_id: int, ts: datetime) -> Dict[str, Any]:
+        """The positions of a map, and their boats, as they were at ``ts``"""
+        HistoryService._check_map(db, map_id)
+        ts = utc(ts)
+        state = HistoryService._state_at(db, map_id, ts)
+        return {
+            "map_id": map_id,
+            "ts": ts,
+            "positions": [_historical(position_id, values) for position_id, values in sorted(state.items())],
+        }
+    
+    @staticmethod
+    def diff_map(db: Session, map_id: int, start: datetime, end: datetime) -> Dict[str, Any]:
+        """Boats added to, removed from and moved on a map between two times
+        
+        A boat moved if it sits at another position, or its position was
+        dragged or turned.
+        """
+        HistoryService._check_map(db, map_id)
+        start, end = utc(start), utc(end)
+        if start > end:
+            raise ValidationError("start must not be after end")
+        before = _boats(HistoryService._state_at(db, map_id, start))
+        after = _boats(HistoryService._state_at(db, map_id, end))
+        return {
+            "map_id": map_id,
+            "start": start,
+            "end": end,
+            "added": [after[boat_id] for boat_id in sorted(after.keys() - before.keys())],
+            "removed": [before[boat_id] for boat_id in sorted(before.keys() - after.keys())],
+            "moved": [
+                {"boat_id": boat_id, "before": before[boat_id], "after": after[boat_id]}
+                for boat_id in sorted(before.keys() & after.keys())
+                if before[boat_id] != after[boat_id]
+            ],
+        }
@@ -0,0 +1,118 @@
+import io
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy.orm import Session
+from ..core.exceptions import ForbiddenError, NotFoundError
+from ..core.geometry import Bounds, overlapping_pairs
+from ..core.jobs import Job, JobContext, jobs
+from ..core.packing import PackItem, PackResult, pack
+from ..models.user import UserRole
+from .boat import BoatService
+from .boat_import import BoatImportService
+from .layout import LayoutService
+from .map import MapService
+
+# Task functions run in worker processes: module level so they pickle,
+# pure computations where possible so writes stay in the API process
+
+def _pack_task(
+    context: JobContext,
+    area: Bounds,
+    items: List[PackItem],
+    obstacles: List[Tuple],
+    spacing: float,
+    time_budget: float
+) -> PackResult:
+    return pack(area, items, obstacles, spacing=spacing, time_budget=time_budget, progress=context.progress)
+
+def _overlaps_task(context: JobContext, footprints: Dict[int, Sequence[float]]) -> List[Tuple[int, int]]:
+    return overlapping_pairs(footprints, progress=context.progress)
+
+def _import_task(context: JobContext, content: bytes, filename: Optional[str], batch_size: int) -> Dict[str, Any]:
+    # Imports only insert listings (no change feed), so the worker writes them itself
+    from ..core.database import SessionLocal
+    estimate = max(content.count(b"\n"), 1)
+    rows = BoatImportService.iter_upload_rows(io.BytesIO(content), filename)
+    db = SessionLocal()
+    try:
+        return BoatImportService.import_boats(
+            db, rows, batch_size=batch_size,
+            progress=lambda done: context.progress(done / estimate, f"{done} rows read")
+        )
+    finally:
+        db.close()
+
+def _session_scope(fn):
+    """Run ``fn(db)`` on a fresh session (job results arrive after the request ended)"""
+    from ..core.database import SessionLocal
+    db = SessionLocal()
+    try:
+        return fn(db)
+    finally:
+        db.close()
+
+class JobService:
+    """Submitting CPU-heavy work as background jobs"""
+
+    @staticmethod
+    def submit_layout(
+        db: Session,
+        map_id: int,
+        owner_id: Optional[int] = None,
+        boat_ids: Optional[List[int]] = None,
+        section: Optional[str] = None,
+        region: Optional[Bounds] = None,
+        spacing: float = 5.0,
+        pixels_per_foot: Optional[float] = None,
+        time_budget: float = 2.0,
+        dry_run: bool = False
+    ) -> Job:
+        """Auto-layout as a job; the packing runs in a worker, the write here"""
+        area, items, obstacles = LayoutService.plan_layout(
+            db, map_id, boat_ids, section, region, pixels_per_foot
+        )
+        return jobs.submit(
+            "layout", _pack_task, area, items, obstacles, spacing, time_budget,
+            owner_id=owner_id,
+            finish=lambda result: _session_scope(
+                lambda session: LayoutService.apply_layout(session, map_id, result, dry_run)
+            ),
+        )
+
+    @staticmethod
+    def submit_overlaps(db: Session, map_id: int, owner_id: Optional[int] = None) -> Job:
+        """Overlap scan of a whole map as a job"""
+        if MapService.get_map_by_id(db, map_id) is None:
+            raise NotFoundError("Map not found")
+        footprints = {row[0]: row[1:] for row in BoatService.get_footprints(db, map_id)}
+        return jobs.submit(
+            "overlaps", _overlaps_task, footprints,
+            owner_id=owner_id,
+            finish=lambda pairs: [
+                {"position_id": first, "other_position_id": second} for first, second in pairs
+            ],
+        )
+
+    @staticmethod
+    def submit_import(
+        content: bytes, filename: Optional[str], batch_size: int = 1000, owner_id: Optional[int] = None
+    ) -> Job:
+        """Boat listing import as a job"""
+        # Reject unknown file types now rather than in the worker
+        BoatImportService.iter_upload_rows(io.BytesIO(b""), filename)
+        return jobs.submit("import", _import_task, content, filename, batch_size, owner_id=owner_id)
+
+    @staticmethod
+    def get_job(job_id: str, user: Any) -> Job:
+        """A job visible to ``user``: their own, or any job for admins"""
+        job = jobs.get(job_id)
+        if job is None:
+            raise NotFoundError("Job not found")
+        if job.owner_id != user.id and user.role != UserRole.ADMIN:
+            raise ForbiddenError("Not your job")
+        return job
+
+    @staticmethod
+    def cancel_job(job_id: str, user: Any) -> Job:
+        """Cancel a job visible to ``user``"""
+        JobService.get_job(job_id, user)
+        return jobs.cancel(job_id)
@@ -0,0 +1,173 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session
+from ..models.boat_listing import BoatListing
+from ..models.boat_position import BoatPosition, GEOMETRY_DEFAULTS
+from ..core.config import settings
+from ..core.exceptions import NotFoundError, ValidationError
+from ..core.geometry import Bounds
+from ..core.packing import PackItem, PackResult, pack
+from ..core.sizes import DEFAULT_BEAM_RATIO
+from ..core.realtime import broadcaster
+from .boat import BOAT_EVENT_FIELDS, POSITION_EVENT_FIELDS, BoatService, _fields
+from .map import MapService
+from .history import history_row, record_history
+from .revisions import BOATS_COUNTER, bump_counter, bump_map_revision
+
+def _footprint(boat: BoatListing, pixels_per_foot: float) -> PackItem:
+    """Length and beam in map pixels; unreadable sizes get the default footprint"""
+    if boat.length_ft is None:
+        return PackItem(boat.id, GEOMETRY_DEFAULTS["width"], GEOMETRY_DEFAULTS["height"])
+    beam = boat.beam_ft or boat.length_ft * DEFAULT_BEAM_RATIO
+    return PackItem(boat.id, boat.length_ft * pixels_per_foot, beam * pixels_per_foot)
+
+class LayoutService:
+    """Automatic placement of unmapped boats on a map"""
+
+    @staticmethod
+    def _layout_boats(
+        db: Session, boat_ids: Optional[List[int]], section: Optional[str]
+    ) -> List[BoatListing]:
+        if boat_ids:
+            boats = db.query(BoatListing).filter(BoatListing.id.in_(boat_ids)).all()
+            missing = sorted(set(boat_ids) - {boat.id for boat in boats})
+            if missing:
+                raise NotFoundError(f"Boats not found: {', '.join(map(str, missing))}")
+            mapped = sorted(boat.id for boat in boats if boat.is_mapped)
+            if mapped:
+                raise ValidationError(f"Boats already mapped: {', '.join(map(str, mapped))}")
+            return boats
+        if not section:
+            raise ValidationError("Pass boat_ids or a section to lay out")
+        return db.query(BoatListing).filter(
+            BoatListing.section == section.upper(), BoatListing.is_mapped == False
+        ).order_by(BoatListing.index).all()
+
+    @staticmethod
+    def plan_layout(
+        db: Session,
+        map_id: int,
+        boat_ids: Optional[List[int]] = None,
+        section: Optional[str] = None,
+        region: Optional[Bounds] = None,
+        pixels_per_foot: Optional[float] = None
+    ) -> Tuple[Bounds, List[PackItem], List[Tuple]]:
+        """Inputs for ``pack``: the region, the boats to place and the footprints in the way"""
+        db_map = MapService.get_map_by_id(db, map_id)
+        if not db_map:
+            raise NotFoundError("Map not found")
+        region = region or (0, 0, db_map.image_width, db_map.image_height)
+        region = (
+            max(region[0], 0), max(region[1], 0),
+            min(region[2], db_map.image_width), min(region[3], db_map.image_height)
+        )
+        if region[0] >= region[2] or region[1] >= region[3]:
+            raise ValidationError("Region is outside the map")
+
+        boats = LayoutService._layout_boats(db, boat_ids, section)
+        scale = pixels_per_foot or settings.LAYOUT_PIXELS_PER_FOOT
+        items = [_footprint(boat, scale) for boat in boats]
+        obstacles = [row[1:] for row in BoatService.get_footprints(db, map_id, region)]
+        return region, items, obstacles
+
+    @staticmethod
+    def auto_layout(
+        db: Session,
+        map_id: int,
+        boat_ids: Optional[List[int]] = None,
+        section: Optional[str] = None,
+        region: Optional[Bounds] = None,
+        spacing: float = 5.0,
+        pixels_per_foot: Optional[float] = None,
+        time_budget: float = 2.0,
+        dry_run: bool = False
+    ) -> Dict[str, Any]:
+        """Pack unmapped boats into a region of a map and map them there
+
+        Boats are ``boat_ids`` or else every unmapped boat in ``section``;
+        the region defaults to the whole map image. All positions are
+        inserted and assigned in one transaction, under one map revision.
+        With ``dry_run`` nothing is written and placements have no position id.
+        """
+        region, items, obstacles = LayoutService.plan_layout(
+            db, map_id, boat_ids, section, region, pixels_per_foot
+        )
+        result = pack(region, items, obstacles, spacing=spacing, time_budget=time_budget)
+        return LayoutService.apply_layout(db, map_id, result, dry_run)
+
+    @staticmethod
+    def apply_layout(db: Session, map_id: int, result: PackResult, dry_run: bool = False) -> Dict[str, Any]:
+        """Write a packing result as positions assigned to their boats
+        
+        Boats mapped since the layout was planned are moved to ``unplaced``.
+        """
+        placements = result.placements
+        unplaced = list(result.unplaced)
+        if placements and not dry_run:
+            mapped = set(db.scalars(select(BoatListing.id).filter(
+                BoatListing.id.in_([p.key for p in placements]), BoatListing.is_mapped == True
+            )))
+            unplaced += [p.key for p in placements if p.key in mapped]
+            placements = [p for p in placements if p.key not in mapped]
+
+        rows = [
+            {"map_id": map_id, "x": p.x, "y": p.y, "width": p.width, "height": p.height, "rotation": p.rotation}
+            for p in placements
+        ]
+        layout = {
+            "placed": len(rows),
+            "unplaced": unplaced,
+            "strategy": result.strategy,
+            "attempts": result.attempts,
+            "dry_run": dry_run,
+            "placements": [
+                {"boat_id": p.key, "position_id": None, **row} for p, row in zip(placements, rows)
+            ],
+        }
+        if dry_run or not rows:
+            return layout
+
+        revision = bump_map_revision(db, map_id)
+        for row in rows:
+            row.update(BoatPosition.bounds_values(**{f: row[f] for f in GEOMETRY_DEFAULTS}), revision=revision)
+        # Bulk INSERT ... RETURNING in parameter order, then a bulk UPDATE of the boats
+        position_ids = db.scalars(
+            insert(BoatPosition).returning(BoatPosition.id, sort_by_parameter_order=True), rows
+        ).all()
+        for placement, position_id in zip(layout["placements"], position_ids):
+            placement["position_id"] = position_id
+        db.execute(update(BoatListing), [
+            {"id": placement["boat_id"], "position_id": placement["position_id"], "is_mapped": True}
+            for placement in layout["placements"]
+        ])
+        now = datetime.now(timezone.utc)
+        record_history(db, [
+            history_row(map_id, placement["position_id"], placement, placement["boat_id"], now)
+            for placement in layout["placements"]
+        ])
+        bump_counter(db, BOATS_COUNTER)
+        db.commit()
+
+        positions = {
+            position.id: position
+            for position in db.query(BoatPosition).filter(BoatPosition.id.in_(position_ids))
+        }
+        boats = {
+            boat.id: boat
+            for boat in db.query(BoatListing).filter(BoatListing.position_id.in_(position_ids))
+        }
+        for placement in layout["placements"]:
+            position_id = placement["position_id"]
+            broadcaster.publish(map_id, {
+                "type": "position.created",
+                "revision": revision,
+                "position": _fields(positions[position_id], POSITION_EVENT_FIELDS)
+            })
+            broadcaster.publish(map_id, {
+                "type": "boat.assigned",
+                "revision": revision,
+                "position_id": position_id,
+                "boat": _fields(boats[placement["boat_id"]], BOAT_EVENT_FIELDS)
+            })
+        return layout
@@ -1,11 +1,22 @@
 # backend/app/services/map.py
-from typing import Optional, List
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from typing import Optional, List, Dict, Any
+from sqlalchemy.orm import Session, Query, selectinload, joinedload
+from sqlalchemy import and_, func
 from ..models.map import Map
 from ..models.boat_position import BoatPosition
+from ..models.position_tombstone import PositionTombstone
 from ..schemas.map import MapCreate, MapUpdate
 from ..core.exceptions import NotFoundError, ValidationError
+from ..core.geometry import free_placements
+from ..core.pagination import paginate
+from ..core.realtime import broadcaster
+from .boat import BoatService
+from .revisions import bump_map_revision, get_map_revision
+
+# Fields sent in map change feed events
+MAP_EVENT_FIELDS = (
+    "id", "name", "description", "image_path", "image_width", "image_height", "is_active",
+)
 
 class MapService:
     """Service layer for map management"""
@@ -15,6 +26,87 @@ class MapService:
         """Get map by ID"""
         return db.query(Map).filter(Map.id == map_id).first()
     
+    @staticmethod
+    def get_map_snapshot(db: Session, map_id: int) -> Optional[Map]:
+        """Get map with its positions and their boat listings eagerly loaded"""
+        return db.query(Map).options(
+            selectinload(Map.boat_positions).joinedload(BoatPosition.boat_listing)
+        ).filter(Map.id == map_id).first()
+    
+    @staticmethod
+    def get_map_revision(db: Session, map_id: int) -> Optional[int]:
+        """Get a map's current revision without loading it (None if missing)"""
+        return get_map_revision(db, map_id)
+    
+    @staticmethod
+    def get_map_changes(db: Session, map_id: int, since: int) -> Dict[str, Any]:
+        """Positions changed and deleted on a map after revision ``since``
+        
+        The map itself is included when it was edited after ``since``. A
+        ``since`` ahead of the map (e.g. after a database restore) returns
+        the map and every position with ``reset`` set so the client rebuilds
+        its state.
+        """
+        # Read the revision first: anything committed later is re-sent next time
+        current = db.query(Map.revision, Map.details_revision).filter(Map.id == map_id).first()
+        if current is None:
+            raise NotFoundError("Map not found")
+        revision, details_revision = current
+        
+        reset = since > revision
+        map_obj = None
+        if reset or details_revision > since:
+            map_obj = MapService._attach_boat_counts(
+                MapService._maps_with_counts_query(db, active_only=False).filter(Map.id == map_id)
+            )[0]
+        query = db.query(BoatPosition).options(
+            joinedload(BoatPosition.boat_listing)
+        ).filter(BoatPosition.map_id == map_id)
+        if not reset:
+            query = query.filter(BoatPosition.revision > since)
+        positions = query.order_by(BoatPosition.revision, BoatPosition.id).all()
+        
+        deleted = [] if reset else [
+            row.position_id for row in db.query(PositionTombstone.position_id).filter(
+                PositionTombstone.map_id == map_id, PositionTombstone.revision > since
+            ).order_by(PositionTombstone.revision)
+        ]
+        
+        return {
+            "map_id": map_id,
+            "since": since,
+            "revision": revision,
+            "reset": reset,
+            "map": map_obj,
+            "positions": positions,
+            "deleted": deleted,
+        }
+    
+    @staticmethod
+    def _maps_with_counts_query(db: Session, active_only: bool = True) -> Query:
+        """Build the map query with per-map boat counts"""
+        # Count positions for every map in one grouped aggregate
+        counts = db.query(
+            BoatPosition.map_id,
+            func.count(BoatPosition.id).label("boat_count")
+        ).group_by(BoatPosition.map_id).subquery()
+        
+        query = db.query(Map, func.coalesce(counts.c.boat_count, 0)).outerjoin(
+            counts, counts.c.map_id == Map.id
+        )
+        if active_only:
+            query = query.filter(Map.is_active == True)
+        return query
+    
+    @staticmethod
+    def _attach_boat_counts(rows) -> List[Map]:
+        """Set boat_count on each (map, count) row"""
+        maps = []
+        for map_obj, boat_count in rows:
+            map_obj.boat_count = boat_count
+            maps.append(map_obj)
+        return maps
+    
     @staticmethod
     def get_maps(
         db: Session, 
@@ -22,11 +114,24 @@ class MapService:
         limit: int = 100, 
         active_only: bool = True
     ) -> List[Map]:
-        """Get all maps with pagination"""
-        query = db.query(Map)
-        if active_only:
-            query = query.filter(Map.is_active == True)
-        return query.offset(skip).limit(limit).all()
+        """Get all maps with pagination and their boat counts"""
+        query = MapService._maps_with_counts_query(db, active_only)
+        rows = query.order_by(Map.id).offset(skip).limit(limit).all()
+        return MapService._attach_boat_counts(rows)
+    
+    @staticmethod
+    def get_maps_page(
+        db: Session,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        active_only: bool = True
+    ) -> Dict[str, Any]:
+        """Get a keyset-paginated page of maps with next/prev cursors"""
+        query = MapService._maps_with_counts_query(db, active_only)
+        page = paginate(query, [(Map.id, False)], limit, cursor=cursor, skip=skip)
+        page["items"] = MapService._attach_boat_counts(page["items"])
+        return page
     
     @staticmethod
     def create_map(db: Session, map_create: MapCreate) -> Map:
@@ -63,8 +168,15 @@ class MapService:
         for field, value in update_data.items():
             setattr(db_map, field, value)
         
+        revision = bump_map_revision(db, map_id)
+        db_map.details_revision = revision
         db.commit()
         db.refresh(db_map)
+        broadcaster.publish(map_id, {
+            "type": "map.updated",
+            "revision": revision,
+            "map": {name: getattr(db_map, name) for name in MAP_EVENT_FIELDS}
+        })
         return db_map
     
     @staticmethod
@@ -79,14 +191,67 @@ class MapService:
         if position_count > 0:
             # Soft delete - set inactive
             db_map.is_active = False
+            revision = bump_map_revision(db, map_id)
+            db_map.details_revision = revision
             db.commit()
+            broadcaster.publish(map_id, {
+                "type": "map.updated", "revision": revision, "map": {"id": map_id, "is_active": False}
+            })
         else:
             # Hard delete if no positions
             db.delete(db_map)
             db.commit()
+            broadcaster.publish(map_id, {"type": "map.deleted"})
         
         return True
     
+    @staticmethod
+    def find_free_space(
+        db: Session,
+        map_id: int,
+        width: float,
+        height: float,
+        x: Optional[float] = None,
+        y: Optional[float] = None,
+        rotation: float = 0.0,
+        limit: int = 5
+    ) -> List[Dict[str, float]]:
+        """Free placements for a footprint on a map, nearest (x, y) first
+        
+        The target defaults to the centre of the map image. Placements lie
+        inside the image, clear every position and each other. The search
+        starts in a window around the target, loading only the positions
+        there through the bbox index, and doubles it until enough spots
+        are found no further away than the window reaches.
+        """
+        db_map = MapService.get_map_by_id(db, map_id)
+        if not db_map:
+            raise NotFoundError("Map not found")
+        x = db_map.image_width / 2 if x is None else x
+        y = db_map.image_height / 2 if y is None else y
+        if not (0 <= x <= db_map.image_width and 0 <= y <= db_map.image_height):
+            raise ValidationError("Target point is outside the map")
+        
+        map_bounds = (0, 0, db_map.image_width, db_map.image_height)
+        reach = 4 * max(width, height)
+        while True:
+            window = (
+                max(x - reach, 0), max(y - reach, 0),
+                min(x + reach, db_map.image_width), min(y + reach, db_map.image_height)
+            )
+            footprints = [row[1:] for row in BoatService.get_footprints(db, map_id, window)]
+            spots = free_placements(window, footprints, width, height, rotation, target=(x, y), limit=limit)
+            # Any spot outside the window is further away than ``reach``
+            whole_map = window == map_bounds
+            if whole_map or (len(spots) == limit and spots[-1][2] <= reach):
+                break
+            reach *= 2
+        return [
+            {"x": spot_x, "y": spot_y, "width": width, "height": height,
+             "rotation": rotation, "distance": distance}
+            for spot_x, spot_y, distance in spots
+        ]
+    
     @staticmethod
     def get_map_boat_count(db: Session, map_id: int) -> int:
         """Get count of boat positions on map"""
@@ -0,0 +1,48 @@
+from typing import Optional
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+from ..models.map import Map
+from ..models.revision_counter import RevisionCounter
+from ..core.exceptions import NotFoundError
+
+# Counter bumped by every change visible in the boat listing endpoints
+BOATS_COUNTER = "boats"
+
+def bump_map_revision(db: Session, map_id: int) -> int:
+    """Increment a map's revision inside the current transaction
+    
+    The UPDATE locks the map row until commit, so concurrent writers to
+    one map commit in revision order.
+    """
+    revision = db.execute(
+        update(Map)
+        .where(Map.id == map_id)
+        .values(revision=Map.revision + 1)
+        .returning(Map.revision)
+    ).scalar_one_or_none()
+    if revision is None:
+        raise NotFoundError("Map not found")
+    return revision
+
+def get_map_revision(db: Session, map_id: int) -> Optional[int]:
+    """Current revision of a map, or None if it does not exist"""
+    return db.query(Map.revision).filter(Map.id == map_id).scalar()
+
+def bump_counter(db: Session, name: str) -> int:
+    """Increment a named revision counter inside the current transaction"""
+    revision = db.execute(
+        update(RevisionCounter)
+        .where(RevisionCounter.name == name)
+        .values(revision=RevisionCounter.revision + 1)
+        .returning(RevisionCounter.revision)
+    ).scalar_one_or_none()
+    if revision is None:
+        # First write on a database created without the migration seed
+        db.add(RevisionCounter(name=name, revision=1))
+        db.flush()
+        revision = 1
+    return revision
+
+def get_counter(db: Session, name: str) -> int:
+    """Current value of a named revision counter"""
+    return db.query(RevisionCounter.revision).filter(RevisionCounter.name == name).scalar() or 0
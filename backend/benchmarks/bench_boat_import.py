@@ -0,0 +1,34 @@
+"""Throughput of the streaming boat import.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_boat_import
+"""
+import io
+import time
+from app.services.boat_import import BoatImportService
+from .common import make_session
+
+ROW_COUNTS = (10_000, 50_000)
+
+def make_csv(count: int) -> str:
+    """Synthetic CSV export with one bad row in every hundred"""
+    lines = ["index,name,customer_name,size,make_model,vehicle_type,section,notes"]
+    for i in range(1, count + 1):
+        section = "Z" if i % 100 == 0 else "ABCDEF"[i % 6]
+        lines.append(f"{i},Vessel {i},Customer {i},{20 + i % 40} ft,Sea Ray,boat,{section},")
+    return "\n".join(lines) + "\n"
+
+def main() -> None:
+    print(f"{'rows':>8} {'created':>8} {'errors':>7} {'seconds':>8} {'rows/s':>8}")
+    for count in ROW_COUNTS:
+        db = make_session("sqlite:///./bench_import.db")
+        data = make_csv(count)
+        start = time.perf_counter()
+        result = BoatImportService.import_boats(db, BoatImportService.iter_csv_rows(io.StringIO(data)))
+        elapsed = time.perf_counter() - start
+        print(f"{count:>8} {result['created']:>8} {result['error_count']:>7} {elapsed:>8.2f} {count / elapsed:>8.0f}")
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Filtering and sorting boats by length: parsing size text vs the length_ft column.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_boat_length
+"""
+import random
+from sqlalchemy import insert
+from .common import make_session, measure
+from app.core.sizes import parse_size
+from app.models.boat_listing import BoatListing
+from app.services.boat import BoatService
+
+ROW_COUNTS = (10_000, 100_000)
+SIZES = ("{} ft", "{}'", "{}' 6\"", "{} x 11", "{} feet")
+MIN_LENGTH, MAX_LENGTH = 30, 32
+
+def seed(db, count: int, rng: random.Random) -> None:
+    rows = []
+    for i in range(count):
+        size = rng.choice(SIZES).format(rng.randint(14, 60)) if rng.random() > 0.05 else "custom"
+        rows.append({"index": i + 1, "customer_name": f"Customer {i}", "size": size,
+                     "is_mapped": False, **BoatListing.size_values(size)})
+    db.execute(insert(BoatListing), rows)
+    db.commit()
+
+def parse_in_python(db) -> list:
+    """What a length filter costs without the column: load every size and parse it"""
+    matches = []
+    for boat_id, size in db.query(BoatListing.id, BoatListing.size):
+        parsed = parse_size(size)
+        if parsed and MIN_LENGTH <= parsed.length_ft <= MAX_LENGTH:
+            matches.append((parsed.length_ft, boat_id))
+    return sorted(matches, reverse=True)[:100]
+
+def main() -> None:
+    rng = random.Random(3)
+    print(f"{'rows':>7} {'parse ms':>9} {'column ms':>10} {'sorted page ms':>15}")
+    for count in ROW_COUNTS:
+        db = make_session()
+        seed(db, count, rng)
+        parse_ms, _ = measure(db, lambda: parse_in_python(db), repeat=3)
+        column_ms, _ = measure(db, lambda: BoatService.get_boats_page(
+            db, limit=100, min_length=MIN_LENGTH, max_length=MAX_LENGTH, sort="-length"
+        ), repeat=10)
+        page_ms, _ = measure(db, lambda: BoatService.get_boats_page(db, limit=100, sort="-length"), repeat=10)
+        print(f"{count:>7} {parse_ms:>9.1f} {column_ms:>10.1f} {page_ms:>15.1f}")
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Compare per-position PUT semantics with the bulk position update.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_bulk_positions
+"""
+from app.models.map import Map
+from app.models.boat_position import BoatPosition
+from app.schemas.boat_position import BoatPositionUpdate, BoatPositionBulkItem
+from app.services.boat import BoatService
+from .common import make_session, measure
+
+BATCH_SIZES = (1, 10, 100, 500)
+
+def main() -> None:
+    db = make_session()
+    map_obj = Map(name="Bench Yard", image_path="yard.png")
+    db.add(map_obj)
+    db.flush()
+    db.add_all(BoatPosition(map_id=map_obj.id) for _ in range(max(BATCH_SIZES)))
+    db.commit()
+    ids = [row.id for row in db.query(BoatPosition.id)]
+
+    print(f"{'batch':>6} {'one-by-one ms':>14} {'bulk ms':>9} {'bulk us/row':>12}")
+    for size in BATCH_SIZES:
+        batch = ids[:size]
+
+        def one_by_one():
+            for position_id in batch:
+                BoatService.update_position(db, position_id, BoatPositionUpdate(x=10, y=20))
+
+        def bulk():
+            BoatService.bulk_update_positions(db, [BoatPositionBulkItem(id=i, x=10, y=20) for i in batch])
+
+        old_ms, _ = measure(db, one_by_one, repeat=3)
+        new_ms, _ = measure(db, bulk, repeat=3)
+        print(f"{size:>6} {old_ms:>14.2f} {new_ms:>9.2f} {new_ms * 1000 / size:>12.1f}")
+
+if __name__ == "__main__":
+    main()
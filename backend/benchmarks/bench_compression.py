@@ -0,0 +1,34 @@
+"""Bytes saved by response compression on a 1000-boat GET /maps/{id}.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_compression
+"""
+from .common import app_client, make_map_with_boats, make_session, time_requests
+from app.core.compression import available_algorithms
+from app.core.snapshot_cache import map_snapshots
+
+BOAT_COUNT = 1000
+REPEAT = 20
+ACCEPTS = ("application/json", "application/vnd.pier11.columnar+json")
+
+def main() -> None:
+    db = make_session()
+    client = app_client(db)
+    url = f"/api/v1/maps/{make_map_with_boats(db, BOAT_COUNT)}"
+    print(f"{BOAT_COUNT} boats")
+    print(f"{'accept':<38} {'encoding':>8} {'KiB':>7} {'saved':>6} {'ms':>7}")
+    for accept in ACCEPTS:
+        raw = None
+        for encoding in ["identity", *available_algorithms(["gzip", "br"])]:
+            headers = {"Accept": accept, "Accept-Encoding": encoding}
+            client.get(url, headers=headers)  # warm the snapshot cache
+            response = client.get(url, headers=headers)
+            size = int(response.headers.get("content-length", len(response.content)))
+            raw = raw or size
+            elapsed = time_requests(lambda: client.get(url, headers=headers), REPEAT)
+            print(f"{accept:<38} {encoding:>8} {size / 1024:>7.1f} {1 - size / raw:>6.0%} {elapsed:>7.2f}")
+    map_snapshots.clear()
+
+if __name__ == "__main__":
+    main()
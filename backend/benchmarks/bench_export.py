@@ -0,0 +1,38 @@
+"""Peak memory and throughput of the streaming export.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_export
+"""
+import time
+import tracemalloc
+from sqlalchemy import insert
+from app.models.boat_listing import BoatListing
+from app.services.export import ExportService
+from .common import make_session
+
+ROW_COUNTS = (10_000, 100_000)
+
+def main() -> None:
+    print(f"{'rows':>8} {'format':>7} {'MiB out':>8} {'peak MiB':>9} {'rows/s':>8}")
+    for count in ROW_COUNTS:
+        db = make_session("sqlite:///./bench_export.db")
+        db.execute(insert(BoatListing), [
+            {"index": i, "customer_name": f"Customer {i}", "size": "30 ft", "section": "A", "is_mapped": False}
+            for i in range(1, count + 1)
+        ])
+        db.commit()
+        for fmt in ("csv", "ndjson"):
+            written = 0
+            tracemalloc.start()
+            start = time.perf_counter()
+            for chunk in ExportService.stream(ExportService.boats_query(db), fmt):
+                written += len(chunk)
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{count:>8} {fmt:>7} {written / 2**20:>8.1f} {peak / 2**20:>9.2f} {count / elapsed:>8.0f}")
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Free-space search latency on crowded maps.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_free_space
+"""
+import time
+from .common import make_session
+from sqlalchemy import insert
+from app.models.boat_position import BoatPosition
+from app.models.map import Map
+from app.services.map import MapService
+
+POSITION_COUNTS = (1_000, 5_000, 20_000)
+COLUMNS = 100
+GAP_EVERY = 37  # leave every 37th slot of the grid empty
+
+def make_yard(db, count: int) -> int:
+    """Pack rows of boats leaving a few scattered gaps; return the map id"""
+    rows_needed = count // COLUMNS + 1
+    map_obj = Map(name=f"Yard {count}", image_path="yard.png",
+                  image_width=COLUMNS * 60, image_height=rows_needed * 30)
+    db.add(map_obj)
+    db.flush()
+    rows = []
+    for i in range(count + count // GAP_EVERY):
+        if i % GAP_EVERY == 0:
+            continue
+        geometry = dict(x=(i % COLUMNS) * 60.0 + 30, y=(i // COLUMNS) * 30.0 + 15,
+                        width=56.0, height=26.0, rotation=(i % 3) * 2.0)
+        rows.append({"map_id": map_obj.id, **geometry, **BoatPosition.bounds_values(**geometry)})
+    db.execute(insert(BoatPosition), rows)
+    db.commit()
+    return map_obj.id
+
+def best_ms(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+def main() -> None:
+    db = make_session()
+    print(f"{'positions':>9} {'found':>6} {'search ms':>10}")
+    for count in POSITION_COUNTS:
+        map_id = make_yard(db, count)
+
+        def search():
+            return MapService.find_free_space(db, map_id, 50, 20, limit=5)
+
+        found = len(search())
+        print(f"{count:>9} {found:>6} {best_ms(search, repeat=10):>10.1f}")
+
+if __name__ == "__main__":
+    main()
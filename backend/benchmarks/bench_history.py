@@ -0,0 +1,80 @@
+"""Position history: cost of recording moves, rebuilding a map at a time and diffing.
+
+A season of drags on one yard among several: every position moves a few
+times a day. The first read of a map folds its daily checkpoints (cold);
+later reads replay at most a day of changes (warm). Run from the backend directory:
+
+    python -m benchmarks.bench_history
+"""
+import random
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import insert
+from .common import make_session, measure
+from app.models.boat_position import BoatPosition
+from app.models.map import Map
+from app.models.position_history import PositionHistory
+from app.schemas.boat_position import BoatPositionUpdate
+from app.services.boat import BoatService
+from app.services.history import HistoryService
+
+MAPS = 5
+POSITIONS = 500  # per map
+MOVES_PER_DAY = (2, 20)  # per position, across all maps
+DAYS = 90
+START = datetime(2026, 4, 1, tzinfo=timezone.utc)
+
+def seed(db, moves_per_day: int, rng: random.Random) -> int:
+    """Maps with positions and ``DAYS`` of history; returns the first map's id"""
+    map_ids = []
+    for m in range(MAPS):
+        map_obj = Map(name=f"Yard {m}", image_path="yard.png", image_width=3000, image_height=2000)
+        db.add(map_obj)
+        db.flush()
+        map_ids.append(map_obj.id)
+        db.add_all(BoatPosition(map_id=map_obj.id, x=rng.uniform(0, 3000), y=rng.uniform(0, 2000))
+                   for _ in range(POSITIONS))
+    db.commit()
+    positions = db.query(BoatPosition.id, BoatPosition.map_id).all()
+    step = timedelta(days=1) / moves_per_day
+    for day in range(DAYS):
+        rows = []
+        for position_id, map_id in positions:
+            for move in range(moves_per_day):
+                rows.append({
+                    "map_id": map_id, "position_id": position_id, "boat_id": position_id,
+                    "x": rng.uniform(0, 3000), "y": rng.uniform(0, 2000), "rotation": 0.0,
+                    "removed": False, "ts": START + timedelta(days=day) + step * move,
+                })
+        db.execute(insert(PositionHistory), rows)
+    db.commit()
+    return map_ids[0]
+
+def main() -> None:
+    rng = random.Random(11)
+    print(f"{'moves/day':>9} {'history rows':>12} {'cold at ms':>10} {'warm at ms':>10} "
+          f"{'diff ms':>8} {'move ms':>8} {'stmts':>6}")
+    season_end = START + timedelta(days=89, hours=12)
+    for moves_per_day in MOVES_PER_DAY:
+        db = make_session()
+        map_id = seed(db, moves_per_day, rng)
+        rows = db.query(PositionHistory).count()
+
+        def at():
+            return HistoryService.get_map_at(db, map_id, season_end)
+
+        cold_ms, _ = measure(db, at, repeat=1)
+        warm_ms, _ = measure(db, at, repeat=5)
+        diff_ms, _ = measure(db, lambda: HistoryService.diff_map(
+            db, map_id, START + timedelta(days=1, hours=12), season_end
+        ), repeat=5)
+        position_id = db.query(BoatPosition.id).filter(BoatPosition.map_id == map_id).first()[0]
+        move_ms, statements = measure(
+            db, lambda: BoatService.update_position(db, position_id, BoatPositionUpdate(x=rng.uniform(0, 3000))),
+            repeat=20
+        )
+        print(f"{moves_per_day:>9} {rows:>12} {cold_ms:>10.1f} {warm_ms:>10.1f} "
+              f"{diff_ms:>8.1f} {move_ms:>8.2f} {statements:>6}")
+        db.close()
+
+if __name__ == "__main__":
+    main()
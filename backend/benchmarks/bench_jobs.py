@@ -0,0 +1,82 @@
+"""Latency of small requests while a heavy layout search runs.
+
+A layout search holds the GIL for its whole time budget. This compares
+the latency of a light in-process task (a viewport-sized overlap scan)
+while packing runs in a thread of the same process, as a synchronous
+POST /maps/{id}/layout does, and while it runs as a job in a worker
+process. Run from the backend directory:
+
+    python -m benchmarks.bench_jobs
+"""
+import random
+import statistics
+import threading
+import time
+from .common import make_session  # noqa: F401  (sets up the benchmark environment)
+from app.core.geometry import overlapping_pairs
+from app.core.jobs import JobManager
+from app.core.packing import PackItem
+from app.services.jobs import _pack_task
+
+HEAVY_JOBS = (0, 1, 2)
+TIME_BUDGET = 3.0
+AREA = (0, 0, 1500, 1000)
+
+def make_items(rng: random.Random):
+    # More boats than fit, so the search uses its whole budget
+    return [PackItem(i, length, length / 3) for i, length in enumerate(rng.uniform(54, 135) for _ in range(400))]
+
+def light_task(footprints) -> None:
+    overlapping_pairs(footprints)
+
+class _Inline:
+    """Stand-in context for packing in a thread"""
+    def progress(self, fraction, message=None):
+        pass
+
+def sample(footprints, stop_at: float):
+    latencies = []
+    while time.perf_counter() < stop_at:
+        start = time.perf_counter()
+        light_task(footprints)
+        latencies.append((time.perf_counter() - start) * 1000)
+        time.sleep(0.005)
+    return latencies
+
+def main() -> None:
+    rng = random.Random(9)
+    items = make_items(rng)
+    footprints = {i: (rng.uniform(0, 800), rng.uniform(0, 600), 60, 20, rng.choice((0.0, 45.0))) for i in range(200)}
+    manager = JobManager(max_workers=2, max_pending=4)
+    manager.wait(manager.submit("warmup", _pack_task, AREA, items[:5], [], 5.0, 0.01).id)
+
+    print(f"{'heavy':>5} {'where':>8} {'p50 ms':>7} {'p99 ms':>7} {'max ms':>7}")
+    for heavy in HEAVY_JOBS:
+        for where in ("thread", "process"):
+            if heavy == 0 and where == "process":
+                continue
+            if where == "thread":
+                threads = [
+                    threading.Thread(target=_pack_task, args=(_Inline(), AREA, items, [], 5.0, TIME_BUDGET))
+                    for _ in range(heavy)
+                ]
+                for thread in threads:
+                    thread.start()
+            else:
+                submitted = [manager.submit("layout", _pack_task, AREA, items, [], 5.0, TIME_BUDGET)
+                             for _ in range(heavy)]
+            latencies = sample(footprints, time.perf_counter() + TIME_BUDGET * 0.8)
+            if where == "thread":
+                for thread in threads:
+                    thread.join()
+            else:
+                for job in submitted:
+                    manager.wait(job.id)
+            latencies.sort()
+            label = "-" if heavy == 0 else where
+            print(f"{heavy:>5} {label:>8} {statistics.median(latencies):>7.2f} "
+                  f"{latencies[int(len(latencies) * 0.99)]:>7.2f} {latencies[-1]:>7.2f}")
+    manager.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Auto-layout of a winter haul-out: 100-500 unmapped boats into one yard.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_layout
+"""
+import random
+from .common import make_session, measure
+from app.models.boat_listing import BoatListing
+from app.models.map import Map
+from app.models.boat_position import BoatPosition
+from app.services.layout import LayoutService
+
+BOAT_COUNTS = (100, 250, 500)
+SIZES = ("18 ft", "22'", "26 ft", "30 ft", "8.5 m", "35' 6\"", "40 x 13", "45 ft", "custom")
+OBSTACLES = 60  # travel lift bays, racks and boats already placed by hand
+TIME_BUDGET = 2.0
+
+def make_yard(db, count: int, rng: random.Random) -> int:
+    """A 3000x2200 map with some positions already placed and ``count`` unmapped boats in section A"""
+    map_obj = Map(name=f"Yard {count}", image_path="yard.png", image_width=3000, image_height=2200)
+    db.add(map_obj)
+    db.flush()
+    db.add_all(
+        BoatPosition(map_id=map_obj.id, x=rng.uniform(0, 3000), y=rng.uniform(0, 2200),
+                     rotation=rng.choice((0.0, 30.0, 90.0)))
+        for _ in range(OBSTACLES)
+    )
+    offset = db.query(BoatListing).count()
+    db.add_all(
+        BoatListing(index=offset + i + 1, customer_name=f"Customer {i}", size=rng.choice(SIZES), section="A")
+        for i in range(count)
+    )
+    db.commit()
+    return map_obj.id
+
+def main() -> None:
+    rng = random.Random(5)
+    db = make_session()
+    print(f"{'boats':>5} {'placed':>6} {'attempts':>8} {'dry run ms':>10} {'write ms':>9} {'stmts':>6}  strategy")
+    for count in BOAT_COUNTS:
+        map_id = make_yard(db, count, rng)
+
+        def layout(dry_run):
+            return LayoutService.auto_layout(
+                db, map_id, section="A", time_budget=TIME_BUDGET, dry_run=dry_run
+            )
+
+        preview = layout(True)
+        dry_ms, _ = measure(db, lambda: layout(True), repeat=3)
+        write_ms, statements = measure(db, lambda: layout(False), repeat=1)
+        print(f"{count:>5} {preview['placed']:>6} {preview['attempts']:>8} {dry_ms:>10.0f} "
+              f"{write_ms:>9.0f} {statements:>6}  {preview['strategy']}")
+
+if __name__ == "__main__":
+    main()
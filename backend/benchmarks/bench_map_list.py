@@ -0,0 +1,41 @@
+"""Compare per-map COUNT queries against the grouped boat_count aggregate.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_map_list
+"""
+from app.models.map import Map
+from app.models.boat_position import BoatPosition
+from app.services.map import MapService
+from .common import make_session, measure
+
+BOATS_PER_MAP = 50
+
+def seed(db, map_count: int) -> None:
+    """Create maps with a fixed number of positions each"""
+    for i in range(map_count):
+        map_obj = Map(name=f"Map {i}", image_path="map.png")
+        db.add(map_obj)
+        db.flush()
+        db.add_all(BoatPosition(map_id=map_obj.id) for _ in range(BOATS_PER_MAP))
+    db.commit()
+
+def per_map_counts(db):
+    """The previous behaviour: one COUNT(*) per listed map"""
+    maps = db.query(Map).filter(Map.is_active == True).all()
+    for map_obj in maps:
+        map_obj.boat_count = MapService.get_map_boat_count(db, map_obj.id)
+    return maps
+
+def main() -> None:
+    print(f"{'maps':>6} {'per-map ms':>12} {'queries':>8} {'grouped ms':>12} {'queries':>8}")
+    for map_count in (1, 10, 100):
+        db = make_session()
+        seed(db, map_count)
+        old_ms, old_queries = measure(db, lambda: per_map_counts(db))
+        new_ms, new_queries = measure(db, lambda: MapService.get_maps(db))
+        print(f"{map_count:>6} {old_ms:>12.2f} {old_queries:>8} {new_ms:>12.2f} {new_queries:>8}")
+        db.close()
+
+if __name__ == "__main__":
+    main()
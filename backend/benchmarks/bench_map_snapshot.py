@@ -0,0 +1,34 @@
+"""GET /maps/{id} latency with a cold and a warm snapshot cache.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_map_snapshot
+"""
+from .common import app_client, make_map_with_boats, make_session, time_requests
+from app.core.snapshot_cache import map_snapshots
+
+BOAT_COUNTS = (10, 100, 1000)
+REPEAT = 30
+
+def main() -> None:
+    db = make_session()
+    client = app_client(db)
+    print(f"{'boats':>6} {'KiB':>6} {'uncached ms':>12} {'cached ms':>10} {'304 ms':>8}")
+    for count in BOAT_COUNTS:
+        map_id = make_map_with_boats(db, count, name=f"Yard {count}")
+        url = f"/api/v1/maps/{map_id}"
+        response = client.get(url)
+        etag = response.headers["ETag"]
+
+        def uncached():
+            map_snapshots.clear()
+            client.get(url)
+
+        cold = time_requests(uncached, REPEAT)
+        client.get(url)
+        warm = time_requests(lambda: client.get(url), REPEAT)
+        revalidated = time_requests(lambda: client.get(url, headers={"If-None-Match": etag}), REPEAT)
+        print(f"{count:>6} {len(response.content) / 1024:>6.0f} {cold:>12.2f} {warm:>10.2f} {revalidated:>8.2f}")
+
+if __name__ == "__main__":
+    main()
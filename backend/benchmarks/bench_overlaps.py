@@ -0,0 +1,68 @@
+"""Overlap detection: whole-map scan and a single placement check.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_overlaps
+"""
+import random
+import time
+from .common import make_session
+from sqlalchemy import insert
+from app.core.geometry import corners_overlap, footprint_corners, overlapping_pairs
+from app.models.boat_position import BoatPosition
+from app.models.map import Map
+from app.services.boat import BoatService
+
+POSITION_COUNTS = (1_000, 5_000, 20_000)
+BRUTE_FORCE_LIMIT = 5_000  # the O(n^2) scan is too slow beyond this
+
+def make_yard(db, count: int, rng: random.Random) -> int:
+    """Scatter rotated positions over a yard sized for ~1% overlap; return the map id"""
+    side = (count * 12_000) ** 0.5
+    map_obj = Map(name=f"Yard {count}", image_path="yard.png", image_width=int(side), image_height=int(side))
+    db.add(map_obj)
+    db.flush()
+    rows = []
+    for _ in range(count):
+        geometry = dict(
+            x=rng.uniform(0, side), y=rng.uniform(0, side), width=rng.uniform(40, 80),
+            height=rng.uniform(15, 25), rotation=rng.choice((0.0, 15.0, 45.0, 90.0)),
+        )
+        rows.append({"map_id": map_obj.id, **geometry, **BoatPosition.bounds_values(**geometry)})
+    db.execute(insert(BoatPosition), rows)
+    db.commit()
+    return map_obj.id
+
+def best_ms(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+def brute_force(shapes) -> int:
+    corners = {key: footprint_corners(*shape) for key, shape in shapes.items()}
+    keys = sorted(corners)
+    return sum(
+        corners_overlap(corners[a], corners[b])
+        for i, a in enumerate(keys) for b in keys[i + 1:]
+    )
+
+def main() -> None:
+    rng = random.Random(11)
+    db = make_session()
+    print(f"{'positions':>9} {'pairs':>6} {'map ms':>8} {'index ms':>9} {'brute ms':>9} {'check ms':>9}")
+    for count in POSITION_COUNTS:
+        map_id = make_yard(db, count, rng)
+        pairs = BoatService.get_map_overlaps(db, map_id)
+        map_ms = best_ms(lambda: BoatService.get_map_overlaps(db, map_id), repeat=3)
+        shapes = {p.id: tuple(p.geometry().values()) for p in BoatService.get_positions_by_map(db, map_id)}
+        index_ms = best_ms(lambda: overlapping_pairs(shapes), repeat=3)
+        brute = f"{best_ms(lambda: brute_force(shapes), repeat=1):>9.0f}" if count <= BRUTE_FORCE_LIMIT else f"{'-':>9}"
+        probe = dict(x=100.0, y=100.0, width=60.0, height=20.0, rotation=30.0)
+        check_ms = best_ms(lambda: BoatService.get_overlapping_positions(db, map_id, probe), repeat=20)
+        print(f"{count:>9} {len(pairs):>6} {map_ms:>8.1f} {index_ms:>9.1f} {brute} {check_ms:>9.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Serialization cost per boat: response models vs FAST_JSON row dicts.
+
+"model" is what FastAPI does for a response_model endpoint (validate the
+returned rows into the model, dump, json.dumps); "fast" is ``row_dict``
+plus ``dumps``. Rows are loaded once, so only serialization is timed.
+Snapshot sizes and encode times are also shown for each Accept format.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_serialization
+"""
+import asyncio
+from typing import List
+from .common import make_map_with_boats, make_session, time_requests
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from app.core.serialization import MEDIA_TYPES, dumps, msgpack, orjson, row_dict
+from app.models.boat_listing import BoatListing
+from app.schemas.boat_listing import BoatListingResponse
+from app.schemas.composite import MapWithBoats
+from app.services.map import MapService
+
+BOAT_COUNT = 1000
+REPEAT = 30
+
+def main() -> None:
+    db = make_session()
+    map_id = make_map_with_boats(db, BOAT_COUNT)
+    boats = db.query(BoatListing).order_by(BoatListing.index).all()
+    map_obj = MapService.get_map_snapshot(db, map_id)
+    loop = asyncio.new_event_loop()
+    boats_field = create_response_field(name="Response", type_=List[BoatListingResponse])
+
+    def boats_model():
+        content = loop.run_until_complete(
+            serialize_response(field=boats_field, response_content=boats, is_coroutine=False)
+        )
+        return JSONResponse(content).body
+
+    cases = [
+        ("GET /boats", boats_model, lambda: dumps([row_dict(b, BoatListingResponse) for b in boats])),
+        (
+            "GET /maps/{id}",
+            lambda: MapWithBoats.from_snapshot(map_obj).model_dump_json().encode(),
+            lambda: dumps(MapWithBoats.snapshot_dict(map_obj)),
+        ),
+    ]
+    print(f"encoder: {'orjson' if orjson is not None else 'json'}, {BOAT_COUNT} boats")
+    print(f"{'endpoint':<16} {'model ns/boat':>14} {'fast ns/boat':>13} {'speedup':>8}")
+    for name, model, fast in cases:
+        model_ms = time_requests(model, REPEAT)
+        fast_ms = time_requests(fast, REPEAT)
+        per_boat = 1e6 / BOAT_COUNT
+        print(f"{name:<16} {model_ms * per_boat:>14.0f} {fast_ms * per_boat:>13.0f} {model_ms / fast_ms:>7.1f}x")
+    loop.close()
+
+    print(f"\n{'GET /maps/{id} as':<40} {'KiB':>6} {'ns/boat':>8}")
+    for fmt, media_type in MEDIA_TYPES.items():
+        if fmt == "msgpack" and msgpack is None:
+            continue
+        body = MapWithBoats.snapshot_body(map_obj, fmt)
+        elapsed = time_requests(lambda: MapWithBoats.snapshot_body(map_obj, fmt), REPEAT)
+        print(f"{media_type:<40} {len(body) / 1024:>6.0f} {elapsed * 1e6 / BOAT_COUNT:>8.0f}")
+
+if __name__ == "__main__":
+    main()
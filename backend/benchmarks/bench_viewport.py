@@ -0,0 +1,50 @@
+"""Viewport (bbox) position queries vs loading the whole map.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_viewport
+"""
+from .common import make_session, measure
+from sqlalchemy import insert, text
+from app.models.boat_position import BoatPosition
+from app.models.map import Map
+from app.services.boat import BoatService
+
+POSITION_COUNTS = (10_000, 100_000)
+COLUMNS = 200  # positions per row of the yard grid
+VIEWPORT_SIZE = (1200.0, 900.0)  # a zoomed-in window at the centre of the yard
+
+def make_yard(db, count: int) -> int:
+    """Insert a grid of rotated positions on a new map; return its id"""
+    map_obj = Map(name=f"Yard {count}", image_path="yard.png", image_width=COLUMNS * 60, image_height=count // COLUMNS * 40)
+    db.add(map_obj)
+    db.flush()
+    rows = []
+    for i in range(count):
+        geometry = dict(x=(i % COLUMNS) * 60.0, y=(i // COLUMNS) * 40.0, width=50.0, height=20.0, rotation=(i % 8) * 15.0)
+        rows.append({"map_id": map_obj.id, **geometry, **BoatPosition.bounds_values(**geometry)})
+    db.execute(insert(BoatPosition), rows)
+    db.commit()
+    return map_obj.id
+
+def main() -> None:
+    db = make_session()
+    print(f"{'positions':>9} {'full ms':>8} {'viewport ms':>12} {'rows':>6}")
+    for count in POSITION_COUNTS:
+        map_id = make_yard(db, count)
+        centre_x, centre_y = COLUMNS * 60 / 2, count // COLUMNS * 40 / 2
+        width, height = VIEWPORT_SIZE
+        viewport = (centre_x - width / 2, centre_y - height / 2, centre_x + width / 2, centre_y + height / 2)
+        full_ms, _ = measure(db, lambda: BoatService.get_positions_by_map(db, map_id), repeat=5)
+        viewport_ms, _ = measure(db, lambda: BoatService.get_positions_by_map(db, map_id, viewport), repeat=20)
+        rows = len(BoatService.get_positions_by_map(db, map_id, viewport))
+        print(f"{count:>9} {full_ms:>8.1f} {viewport_ms:>12.2f} {rows:>6}")
+
+    plan = db.execute(text(
+        "EXPLAIN QUERY PLAN SELECT id FROM boat_positions WHERE map_id = 1 "
+        "AND bbox_x0 BETWEEN 0 AND 10 AND bbox_y0 BETWEEN 0 AND 10"
+    )).all()
+    print("plan:", "; ".join(row[-1] for row in plan))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+import os
+import time
+from typing import Callable, Tuple
+
+# Benchmarks run against their own database, never the configured one
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.models import Base
+
+def make_session(url: str = "sqlite://") -> Session:
+    """Create a session on a fresh database with all tables"""
+    engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False} if url.startswith("sqlite") else {},
+        poolclass=StaticPool if url == "sqlite://" else None,
+    )
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+def measure(db: Session, fn: Callable[[], object], repeat: int = 20) -> Tuple[float, int]:
+    """Return best wall time in milliseconds and statements issued per call"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    best = float("inf")
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        for _ in range(repeat):
+            db.expire_all()
+            statements.clear()
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return best * 1000, len(statements)
+
+def make_map_with_boats(db: Session, count: int, name: str = "Bench Yard") -> int:
+    """Create a map with ``count`` positions, each holding a boat; return its id"""
+    from app.models.map import Map
+    from app.models.boat_listing import BoatListing
+    from app.models.boat_position import BoatPosition
+
+    map_obj = Map(name=name, image_path="yard.png", image_width=4000, image_height=3000)
+    db.add(map_obj)
+    db.flush()
+    positions = [
+        BoatPosition(map_id=map_obj.id, x=(i % 40) * 100.0, y=(i // 40) * 60.0)
+        for i in range(count)
+    ]
+    db.add_all(positions)
+    db.flush()
+    offset = db.query(BoatListing).count()
+    db.add_all(
+        BoatListing(
+            index=offset + i + 1,
+            name=f"Vessel {i}",
+            customer_name=f"Customer {i}",
+            size=f"{20 + i % 30} ft",
+            make_model="Sea Ray Sundancer",
+            vehicle_type="boat",
+            section="ABCDEF"[i % 6],
+            position_id=position.id,
+            is_mapped=True,
+        )
+        for i, position in enumerate(positions)
+    )
+    db.commit()
+    return map_obj.id
+
+def app_client(db: Session):
+    """TestClient for the full app on a benchmark session, with auth stubbed out"""
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.core.database import get_db
+    from app.api.deps import get_current_user
+
+    def bench_db():
+        yield db
+
+    app.dependency_overrides[get_db] = bench_db
+    app.dependency_overrides[get_current_user] = lambda: None
+    return TestClient(app, base_url="http://localhost")
+
+def time_requests(fn: Callable[[], object], repeat: int) -> float:
+    """Median wall time of ``fn`` in milliseconds"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
@@ -1,14 +1,22 @@
 # backend/conftest.py
+import os
 import pytest
+from contextlib import contextmanager
 from typing import Generator
-from sqlalchemy import create_engine
+
+# Point the app at the test database before it is imported
+os.environ.setdefault("DATABASE_URL", "sqlite:///./test.db")
+os.environ.setdefault("TESTING", "true")
+
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from fastapi.testclient import TestClient
 from app.main import app
 from app.core.database import get_db, Base
 from app.core.config import settings
 from app.models.user import User, UserRole
-from app.services.auth import AuthService
+from app.core.snapshot_cache import map_snapshots
+from app.services.auth import AuthService, user_cache
 from app.schemas.user import UserCreate
 
 # Use in-memory SQLite for testing
@@ -27,17 +35,48 @@ def override_get_db():
 
 app.dependency_overrides[get_db] = override_get_db
 
-@pytest.fixture(scope="session")
-def db() -> Generator:
-    """Create test database"""
-    Base.metadata.create_all(bind=engine)
-    yield TestingSessionLocal()
+@pytest.fixture(autouse=True)
+def reset_database() -> Generator:
+    """Give every test a fresh schema and empty caches"""
     Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    user_cache.clear()
+    map_snapshots.clear()
+    yield
+
+@pytest.fixture
+def db() -> Generator:
+    """Create test database session"""
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+@pytest.fixture
+def count_statements():
+    """Context manager collecting SQL statements issued on a session's engine"""
+    @contextmanager
+    def counter(session):
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        session.expire_all()
+        bind = session.get_bind()
+        event.listen(bind, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(bind, "before_cursor_execute", before_cursor_execute)
+
+    return counter
 
 @pytest.fixture(scope="module")
 def client() -> Generator:
     """Create test client"""
-    with TestClient(app) as c:
+    with TestClient(app, base_url="http://localhost") as c:
         yield c
 
 @pytest.fixture
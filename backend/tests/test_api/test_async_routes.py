@@ -0,0 +1,72 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import NullPool
+from app.api.v1.aio import router as async_api_router
+from app.core.config import settings
+from app.core.database import get_async_db
+
+async_engine = create_async_engine("sqlite+aiosqlite:///./test.db", poolclass=NullPool)
+AsyncTestingSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
+async def override_get_async_db():
+    """Override async database dependency for testing"""
+    async with AsyncTestingSessionLocal() as db:
+        yield db
+
+@pytest.fixture(scope="module")
+def async_client():
+    """Client for an app serving only the async handlers"""
+    app = FastAPI()
+    app.include_router(async_api_router, prefix=settings.API_V1_STR)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    with TestClient(app, base_url="http://localhost") as c:
+        yield c
+
+def test_async_read_boats(client: TestClient, async_client: TestClient, staff_headers):
+    """Test async boat list matches the sync one"""
+    for i in range(3):
+        client.post(
+            "/api/v1/boats/",
+            json={"index": i + 1, "customer_name": f"Customer {i + 1}"},
+            headers=staff_headers
+        )
+
+    response = async_client.get("/api/v1/boats/?limit=2", headers=staff_headers)
+    assert response.status_code == 200
+    assert [b["index"] for b in response.json()] == [1, 2]
+    assert "X-Next-Cursor" in response.headers
+
+def test_async_read_map_and_move_position(client: TestClient, async_client: TestClient, admin_headers):
+    """Test async map snapshot and position update"""
+    map_obj = client.post(
+        "/api/v1/maps/",
+        json={"name": "Async Yard", "image_path": "yard.png"},
+        headers=admin_headers
+    ).json()
+    position = client.post(
+        "/api/v1/positions/", json={"map_id": map_obj["id"]}, headers=admin_headers
+    ).json()
+
+    response = async_client.put(
+        f"/api/v1/positions/{position['id']}", json={"x": 321.0}, headers=admin_headers
+    )
+    assert response.status_code == 200
+    assert response.json()["x"] == 321.0
+
+    response = async_client.get(f"/api/v1/maps/{map_obj['id']}", headers=admin_headers)
+    assert response.status_code == 200
+    assert response.json()["boats"][0]["position"]["x"] == 321.0
+
+    etag = response.headers["ETag"]
+    assert etag == client.get(f"/api/v1/maps/{map_obj['id']}", headers=admin_headers).headers["ETag"]
+    response = async_client.get(
+        f"/api/v1/maps/{map_obj['id']}", headers={**admin_headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+def test_async_requires_auth(async_client: TestClient):
+    """Test async handlers still require a bearer token"""
+    response = async_client.get("/api/v1/maps/")
+    assert response.status_code == 403
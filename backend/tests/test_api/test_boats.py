@@ -55,6 +55,17 @@ def test_get_boats(client: TestClient, staff_headers):
     data = response.json()
     assert len(data) == 5
 
+def test_get_boats_by_length(client: TestClient, staff_headers):
+    """Test filtering and sorting boats by parsed length"""
+    for i, size in enumerate(["35 ft", "6 m", "custom", "26'"], 1):
+        client.post("/api/v1/boats/", json={"index": i, "customer_name": f"Customer {i}", "size": size},
+                    headers=staff_headers)
+
+    response = client.get("/api/v1/boats/?min_length=19&max_length=30&sort=-length", headers=staff_headers)
+    assert response.status_code == 200
+    assert [(b["index"], b["length_ft"]) for b in response.json()] == [(4, 26.0), (2, 19.69)]
+    assert client.get("/api/v1/boats/?sort=size", headers=staff_headers).status_code == 422
+
 def test_search_boats(client: TestClient, staff_headers):
     """Test searching boat listings"""
     # Create test boats
@@ -119,3 +130,104 @@ def test_delete_boat(client: TestClient, staff_headers):
     response = client.get(f"/api/v1/boats/{boat_id}", headers=staff_headers)
     assert response.status_code == 404
 
+
+def test_get_boats_cursor_pagination(client: TestClient, staff_headers):
+    """Test cursor headers on the boat list"""
+    for i in range(5):
+        client.post(
+            "/api/v1/boats/",
+            json={"index": i + 1, "customer_name": f"Customer {i + 1}"},
+            headers=staff_headers
+        )
+
+    response = client.get("/api/v1/boats/?limit=2", headers=staff_headers)
+    assert [b["index"] for b in response.json()] == [1, 2]
+    assert "X-Prev-Cursor" not in response.headers
+
+    cursor = response.headers["X-Next-Cursor"]
+    response = client.get(f"/api/v1/boats/?limit=2&cursor={cursor}", headers=staff_headers)
+    assert [b["index"] for b in response.json()] == [3, 4]
+    assert "X-Prev-Cursor" in response.headers
+
+    # Offset pagination still works
+    response = client.get("/api/v1/boats/?skip=4&limit=2", headers=staff_headers)
+    assert [b["index"] for b in response.json()] == [5]
+
+def test_get_boats_invalid_cursor(client: TestClient, staff_headers):
+    """Test malformed cursors are rejected"""
+    response = client.get("/api/v1/boats/?cursor=not-a-cursor", headers=staff_headers)
+    assert response.status_code == 422
+
+def test_import_boats_csv(client: TestClient, admin_headers):
+    """Test CSV upload creates boats and reports bad rows"""
+    csv_data = "index,customer_name,size\n1,John Doe,30 ft\n1,Jane Doe,20 ft\n"
+    response = client.post(
+        "/api/v1/boats/import",
+        files={"file": ("boats.csv", csv_data, "text/csv")},
+        headers=admin_headers
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["created"], data["error_count"]) == (1, 1)
+    assert data["errors"][0]["row"] == 3
+
+def test_import_boats_rejects_unknown_format(client: TestClient, admin_headers):
+    """Test unsupported upload types are rejected"""
+    response = client.post(
+        "/api/v1/boats/import",
+        files={"file": ("boats.txt", "index\n1\n", "text/plain")},
+        headers=admin_headers
+    )
+    assert response.status_code == 422
+
+def test_export_boats_csv(client: TestClient, staff_headers):
+    """Test GET /boats/export streams a CSV attachment"""
+    for i in (1, 2):
+        client.post("/api/v1/boats/", json={"index": i, "customer_name": f"Owner {i}"}, headers=staff_headers)
+
+    response = client.get("/api/v1/boats/export", headers=staff_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="boats.csv"' in response.headers["content-disposition"]
+    assert response.headers["content-encoding"] in ("br", "gzip")  # streamed, so compressed at any size
+    lines = response.text.splitlines()
+    assert lines[0].startswith("index,name,customer_name")
+    assert [line.split(",")[0] for line in lines[1:]] == ["1", "2"]
+
+    response = client.get("/api/v1/boats/export?format=xml", headers=staff_headers)
+    assert response.status_code == 422
+
+def test_read_boats_not_modified(client: TestClient, staff_headers):
+    """Test the boat list ETag changes with every boat write"""
+    boat = client.post("/api/v1/boats/", json={"index": 1, "customer_name": "Ann"}, headers=staff_headers).json()
+    etag = client.get("/api/v1/boats/", headers=staff_headers).headers["ETag"]
+
+    response = client.get("/api/v1/boats/", headers={**staff_headers, "If-None-Match": etag})
+    assert response.status_code == 304
+
+    client.put(f"/api/v1/boats/{boat['id']}", json={"notes": "Winterized"}, headers=staff_headers)
+    response = client.get("/api/v1/boats/", headers={**staff_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()[0]["notes"] == "Winterized"
+
+def test_boat_history(client: TestClient, admin_headers):
+    """Test a boat's moves are listed newest first"""
+    map_obj = client.post("/api/v1/maps/", json={
+        "name": "History Yard", "image_path": "yard.png", "image_width": 1000, "image_height": 800
+    }, headers=admin_headers).json()
+    position = client.post("/api/v1/positions/", json={"map_id": map_obj["id"], "x": 10, "y": 20},
+                           headers=admin_headers).json()
+    boat = client.post("/api/v1/boats/", json={"index": 1, "customer_name": "Jane Roe"}, headers=admin_headers).json()
+    client.post(f"/api/v1/boats/{boat['id']}/assign/{position['id']}", headers=admin_headers)
+    client.put(f"/api/v1/positions/{position['id']}", json={"x": 40, "rotation": 90}, headers=admin_headers)
+
+    response = client.get(f"/api/v1/boats/{boat['id']}/history", headers=admin_headers)
+    assert response.status_code == 200
+    history = response.json()
+    assert [(h["position_id"], h["x"], h["rotation"]) for h in history] == [
+        (position["id"], 40, 90), (position["id"], 10, 0)
+    ]
+    older = client.get(f"/api/v1/boats/{boat['id']}/history", params={"until": history[1]["ts"]},
+                       headers=admin_headers).json()
+    assert len(older) == 1
+    assert client.get("/api/v1/boats/999/history", headers=admin_headers).status_code == 404
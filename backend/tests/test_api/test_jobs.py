@@ -0,0 +1,88 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.core.jobs import jobs
+
+@pytest.fixture(scope="module", autouse=True)
+def stop_jobs():
+    yield
+    jobs.shutdown()
+
+def _create_map(client: TestClient, admin_headers) -> dict:
+    map_data = {"name": "Job Yard", "image_path": "yard.png", "image_width": 1000, "image_height": 800}
+    return client.post("/api/v1/maps/", json=map_data, headers=admin_headers).json()
+
+def _finish(client: TestClient, response, headers) -> dict:
+    """Wait for a submitted job and return its status"""
+    assert response.status_code == 202
+    job = response.json()
+    assert response.headers["location"] == f"/api/v1/jobs/{job['id']}"
+    jobs.wait(job["id"], timeout=60)
+    return client.get(f"/api/v1/jobs/{job['id']}", headers=headers).json()
+
+def test_overlaps_job(client: TestClient, admin_headers, staff_headers):
+    """Test an overlap scan runs as a job and only its owner or an admin sees it"""
+    map_obj = _create_map(client, admin_headers)
+    first = client.post("/api/v1/positions/", json={"map_id": map_obj["id"], "x": 100, "y": 100},
+                        headers=staff_headers).json()
+    second = client.post("/api/v1/positions/", json={"map_id": map_obj["id"], "x": 110, "y": 100},
+                         headers=staff_headers).json()
+
+    response = client.post(f"/api/v1/jobs/maps/{map_obj['id']}/overlaps", headers=staff_headers)
+    job = _finish(client, response, staff_headers)
+    assert job["kind"] == "overlaps" and job["status"] == "succeeded" and job["progress"] == 1.0
+
+    result = client.get(f"/api/v1/jobs/{job['id']}/result", headers=admin_headers)
+    assert result.status_code == 200
+    assert result.json() == [{"position_id": first["id"], "other_position_id": second["id"]}]
+    # Same answer as the synchronous endpoint
+    assert result.json() == client.get(f"/api/v1/maps/{map_obj['id']}/overlaps", headers=staff_headers).json()
+
+    assert client.get("/api/v1/jobs/missing", headers=staff_headers).status_code == 404
+    assert client.post("/api/v1/jobs/maps/999/overlaps", headers=staff_headers).status_code == 404
+
+def test_layout_job(client: TestClient, admin_headers, staff_headers):
+    """Test auto-layout as a job writes its positions once done"""
+    map_obj = _create_map(client, admin_headers)
+    boat = client.post("/api/v1/boats/", json={
+        "index": 1, "customer_name": "Customer", "size": "30 ft", "section": "C"
+    }, headers=admin_headers).json()
+    url = f"/api/v1/jobs/maps/{map_obj['id']}/layout"
+    assert client.post(url, json={"section": "C"}, headers=staff_headers).status_code == 403
+
+    job = _finish(client, client.post(url, json={"section": "C", "time_budget": 0.2}, headers=admin_headers),
+                  admin_headers)
+    assert job["status"] == "succeeded"
+    # Only the owner or an admin may read a job
+    assert client.get(f"/api/v1/jobs/{job['id']}", headers=staff_headers).status_code == 403
+
+    layout = client.get(f"/api/v1/jobs/{job['id']}/result", headers=admin_headers).json()
+    assert layout["placed"] == 1 and layout["placements"][0]["boat_id"] == boat["id"]
+    snapshot = client.get(f"/api/v1/maps/{map_obj['id']}", headers=admin_headers).json()
+    assert snapshot["boats"][0]["position"]["id"] == layout["placements"][0]["position_id"]
+
+def test_import_job_and_cancel(client: TestClient, admin_headers):
+    """Test an import job, and that a cancelled job has no result"""
+    csv = "Index,Customer Name,Size\n1,Jane Roe,28 ft\n2,John Doe,32 ft\n"
+    response = client.post("/api/v1/jobs/boats/import", files={"file": ("boats.csv", csv, "text/csv")},
+                           headers=admin_headers)
+    job = _finish(client, response, admin_headers)
+    assert job["status"] == "succeeded"
+    assert client.get(f"/api/v1/jobs/{job['id']}/result", headers=admin_headers).json()["created"] == 2
+    assert len(client.get("/api/v1/boats/", headers=admin_headers).json()) == 2
+
+    bad = client.post("/api/v1/jobs/boats/import", files={"file": ("boats.pdf", b"%PDF", "application/pdf")},
+                      headers=admin_headers)
+    assert bad.status_code == 422
+
+    # Boats too big for the region keep the layout search going for its whole budget
+    map_obj = _create_map(client, admin_headers)
+    response = client.post(f"/api/v1/jobs/maps/{map_obj['id']}/layout", json={
+        "boat_ids": [boat["id"] for boat in client.get("/api/v1/boats/", headers=admin_headers).json()],
+        "region": [0, 0, 50, 50], "time_budget": 10
+    }, headers=admin_headers)
+    assert response.status_code == 202
+    url = f"/api/v1/jobs/{response.json()['id']}"
+    assert client.delete(url, headers=admin_headers).status_code == 200
+    job = _finish(client, response, admin_headers)
+    assert job["status"] == "cancelled" and job["finished_at"] is not None
+    assert client.get(f"{url}/result", headers=admin_headers).status_code == 409
@@ -0,0 +1,478 @@
+import json
+from datetime import datetime, timezone
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from app.core.config import settings
+from app.core.snapshot_cache import map_snapshots
+
+def _create_map(client: TestClient, admin_headers, name: str = "Main Yard") -> dict:
+    """Create a map through the API"""
+    map_data = {
+        "name": name,
+        "image_path": "yard.png",
+        "image_width": 1000,
+        "image_height": 800
+    }
+    response = client.post("/api/v1/maps/", json=map_data, headers=admin_headers)
+    assert response.status_code == 200
+    return response.json()
+
+def test_read_map_with_boats(client: TestClient, admin_headers):
+    """Test map snapshot includes positions and assigned boats"""
+    map_obj = _create_map(client, admin_headers)
+
+    position = client.post(
+        "/api/v1/positions/",
+        json={"map_id": map_obj["id"], "x": 50, "y": 60},
+        headers=admin_headers
+    ).json()
+    client.post("/api/v1/positions/", json={"map_id": map_obj["id"]}, headers=admin_headers)
+    boat = client.post(
+        "/api/v1/boats/",
+        json={"index": 1, "customer_name": "John Doe"},
+        headers=admin_headers
+    ).json()
+    client.post(f"/api/v1/boats/{boat['id']}/assign/{position['id']}", headers=admin_headers)
+
+    response = client.get(f"/api/v1/maps/{map_obj['id']}", headers=admin_headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["map"]["boat_count"] == 2
+
+    boats_by_position = {item["position"]["id"]: item["boat"] for item in data["boats"]}
+    assert boats_by_position[position["id"]]["customer_name"] == "John Doe"
+    assert sum(1 for b in boats_by_position.values() if b is None) == 1
+
+def test_read_map_not_found(client: TestClient, staff_headers):
+    """Test reading a missing map returns 404"""
+    response = client.get("/api/v1/maps/999", headers=staff_headers)
+    assert response.status_code == 404
+
+def test_read_maps_cursor_pagination(client: TestClient, admin_headers):
+    """Test cursor headers on the map list"""
+    created = [_create_map(client, admin_headers, name=f"Yard {i}")["id"] for i in range(3)]
+
+    response = client.get("/api/v1/maps/?limit=2", headers=admin_headers)
+    assert [m["id"] for m in response.json()] == created[:2]
+
+    cursor = response.headers["X-Next-Cursor"]
+    response = client.get(f"/api/v1/maps/?limit=2&cursor={cursor}", headers=admin_headers)
+    assert [m["id"] for m in response.json()] == created[2:]
+    assert "X-Next-Cursor" not in response.headers
+
+def test_bulk_update_positions(client: TestClient, admin_headers):
+    """Test PATCH /positions/bulk moves several boats at once"""
+    map_obj = _create_map(client, admin_headers)
+    ids = [
+        client.post("/api/v1/positions/", json={"map_id": map_obj["id"]}, headers=admin_headers).json()["id"]
+        for _ in range(2)
+    ]
+
+    response = client.patch(
+        "/api/v1/positions/bulk",
+        json={"positions": [{"id": ids[0], "x": 10}, {"id": ids[1], "x": 20, "y": 30}]},
+        headers=admin_headers
+    )
+    assert response.status_code == 200
+    assert [(p["x"], p["y"]) for p in response.json()] == [(10, 200), (20, 30)]
+
+    response = client.patch(
+        "/api/v1/positions/bulk",
+        json={"positions": [{"id": ids[0], "x": 1}, {"id": ids[0], "x": 2}]},
+        headers=admin_headers
+    )
+    assert response.status_code == 422
+
+def test_export_map_positions(client: TestClient, admin_headers):
+    """Test GET /maps/{id}/export streams positions with their boats"""
+    map_obj = _create_map(client, admin_headers)
+    position = client.post(
+        "/api/v1/positions/", json={"map_id": map_obj["id"], "x": 5}, headers=admin_headers
+    ).json()
+    client.post("/api/v1/positions/", json={"map_id": map_obj["id"]}, headers=admin_headers)
+    boat = client.post(
+        "/api/v1/boats/", json={"index": 7, "customer_name": "Jane Roe"}, headers=admin_headers
+    ).json()
+    client.post(f"/api/v1/boats/{boat['id']}/assign/{position['id']}", headers=admin_headers)
+
+    response = client.get(f"/api/v1/maps/{map_obj['id']}/export?format=ndjson", headers=admin_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [(r["position_id"], r["x"], r["boat_id"]) for r in rows] == [
+        (position["id"], 5, boat["id"]), (position["id"] + 1, 200, None)
+    ]
+
+    response = client.get("/api/v1/maps/999/export", headers=admin_headers)
+    assert response.status_code == 404
+
+def test_map_change_feed_websocket(client: TestClient, admin_headers):
+    """Test position changes are pushed to WebSocket subscribers of the map"""
+    map_obj = _create_map(client, admin_headers)
+    other = _create_map(client, admin_headers, name="Other Yard")
+    token = admin_headers["Authorization"].split()[1]
+
+    with client.websocket_connect(f"ws://localhost/api/v1/maps/{map_obj['id']}/ws?token={token}") as ws:
+        assert ws.receive_json() == {"type": "subscribed", "map_id": map_obj["id"]}
+
+        client.post("/api/v1/positions/", json={"map_id": other["id"]}, headers=admin_headers)
+        position = client.post(
+            "/api/v1/positions/", json={"map_id": map_obj["id"], "x": 12}, headers=admin_headers
+        ).json()
+        event = ws.receive_json()
+        assert event["type"] == "position.created"
+        assert event["position"]["id"] == position["id"] and event["position"]["x"] == 12
+
+        boat = client.post(
+            "/api/v1/boats/", json={"index": 3, "customer_name": "Ann Lee"}, headers=admin_headers
+        ).json()
+        client.post(f"/api/v1/boats/{boat['id']}/assign/{position['id']}", headers=admin_headers)
+        event = ws.receive_json()
+        assert (event["type"], event["position_id"], event["boat"]["customer_name"]) == (
+            "boat.assigned", position["id"], "Ann Lee"
+        )
+
+        client.delete(f"/api/v1/positions/{position['id']}", headers=admin_headers)
+        assert ws.receive_json() == {
+            "map_id": map_obj["id"], "type": "position.deleted", "revision": 3, "position_id": position["id"]
+        }
+
+def test_map_change_feed_rejects_bad_token(client: TestClient):
+    """Test the change feeds require a valid token"""
+    response = client.get("/api/v1/maps/1/events?token=bogus")
+    assert response.status_code == 401
+
+def test_map_changes_since_revision(client: TestClient, admin_headers):
+    """Test GET /maps/{id}/changes returns only what changed since a revision"""
+    map_obj = _create_map(client, admin_headers)
+    ids = [
+        client.post("/api/v1/positions/", json={"map_id": map_obj["id"]}, headers=admin_headers).json()["id"]
+        for _ in range(3)
+    ]
+    snapshot = client.get(f"/api/v1/maps/{map_obj['id']}", headers=admin_headers).json()
+    since = snapshot["map"]["revision"]
+    assert since == 3
+
+    client.put(f"/api/v1/positions/{ids[0]}", json={"x": 42}, headers=admin_headers)
+    client.delete(f"/api/v1/positions/{ids[1]}", headers=admin_headers)
+
+    response = client.get(f"/api/v1/maps/{map_obj['id']}/changes?since={since}", headers=admin_headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["revision"], data["reset"], data["deleted"]) == (5, False, [ids[1]])
+    assert [(item["position"]["id"], item["position"]["x"]) for item in data["positions"]] == [(ids[0], 42)]
+
+    data = client.get(f"/api/v1/maps/{map_obj['id']}/changes?since=5", headers=admin_headers).json()
+    assert (data["map"], data["positions"], data["deleted"]) == (None, [], [])
+
+    client.put(f"/api/v1/maps/{map_obj['id']}", json={"name": "Renamed"}, headers=admin_headers)
+    data = client.get(f"/api/v1/maps/{map_obj['id']}/changes?since=5", headers=admin_headers).json()
+    assert (data["revision"], data["positions"], data["deleted"]) == (6, [], [])
+    assert (data["map"]["name"], data["map"]["revision"], data["map"]["boat_count"]) == ("Renamed", 6, 2)
+    assert client.get(f"/api/v1/maps/{map_obj['id']}/changes?since=6", headers=admin_headers).json()["map"] is None
+
+    data = client.get(f"/api/v1/maps/{map_obj['id']}/changes?since=99", headers=admin_headers).json()
+    assert data["reset"] and data["map"]["name"] == "Renamed"
+    assert sorted(item["position"]["id"] for item in data["positions"]) == [ids[0], ids[2]]
+
+def test_read_map_not_modified(client: TestClient, admin_headers, db, count_statements):
+    """Test an unchanged map answers 304 without fetching positions or boats"""
+    map_obj = _create_map(client, admin_headers)
+    position = client.post("/api/v1/positions/", json={"map_id": map_obj["id"]}, headers=admin_headers).json()
+    url = f"/api/v1/maps/{map_obj['id']}"
+
+    response = client.get(url, headers=admin_headers)
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"] == "private, no-cache"
+
+    # Cold snapshot cache: only the map revision is read
+    map_snapshots.clear()
+    with count_statements(db) as statements:
+        response = client.get(url, headers={**admin_headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert len(statements) == 1
+    assert "boat_positions" not in statements[0] and "boat_listings" not in statements[0]
+
+    client.put(f"/api/v1/positions/{position['id']}", json={"x": 1}, headers=admin_headers)
+    response = client.get(url, headers={**admin_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+def test_read_positions_not_modified(client: TestClient, admin_headers):
+    """Test the positions list honours If-None-Match"""
+    map_obj = _create_map(client, admin_headers)
+    url = f"/api/v1/positions/map/{map_obj['id']}"
+    etag = client.get(url, headers=admin_headers).headers["ETag"]
+
+    response = client.get(url, headers={**admin_headers, "If-None-Match": f'W/{etag}, "other"'})
+    assert response.status_code == 304
+
+    client.post("/api/v1/positions/", json={"map_id": map_obj["id"]}, headers=admin_headers)
+    response = client.get(url, headers={**admin_headers, "If-None-Match": etag})
+    assert response.status_code == 200 and len(response.json()) == 1
+
+def test_read_positions_in_viewport(client: TestClient, admin_headers):
+    """Test the bbox query parameter"""
+    map_obj = _create_map(client, admin_headers)
+    near, _ = [
+        client.post("/api/v1/positions/", json={"map_id": map_obj["id"], "x": x, "y": 100},
+                    headers=admin_headers).json()
+        for x in (100, 900)
+    ]
+    url = f"/api/v1/positions/map/{map_obj['id']}"
+
+    response = client.get(f"{url}?bbox=0,0,300,300", headers=admin_headers)
+    assert [p["id"] for p in response.json()] == [near["id"]]
+    assert len(client.get(url, headers=admin_headers).json()) == 2
+
+    for bbox in ("1,2,3", "5,0,1,1", "a,b,c,d"):
+        assert client.get(f"{url}?bbox={bbox}", headers=admin_headers).status_code == 422
+
+def test_overlaps(client: TestClient, admin_headers):
+    """Test the overlaps endpoint and rejecting overlapping writes"""
+    map_obj = _create_map(client, admin_headers)
+    first, second = [
+        client.post("/api/v1/positions/", json={"map_id": map_obj["id"], "x": x, "y": 100},
+                    headers=admin_headers).json()
+        for x in (100, 160)
+    ]
+    response = client.get(f"/api/v1/maps/{map_obj['id']}/overlaps", headers=admin_headers)
+    assert response.json() == [{"position_id": first["id"], "other_position_id": second["id"]}]
+
+    response = client.post(
+        "/api/v1/positions/?reject_overlaps=true",
+        json={"map_id": map_obj["id"], "x": 130, "y": 120}, headers=admin_headers
+    )
+    assert response.status_code == 409
+    response = client.put(
+        f"/api/v1/positions/{second['id']}?reject_overlaps=true", json={"y": 300}, headers=admin_headers
+    )
+    assert response.status_code == 200
+    assert client.get(f"/api/v1/maps/{map_obj['id']}/overlaps", headers=admin_headers).json() == []
+    assert client.get("/api/v1/maps/999/overlaps", headers=admin_headers).status_code == 404
+
+def test_free_space(client: TestClient, admin_headers):
+    """Test free-space search around a target point"""
+    map_obj = _create_map(client, admin_headers)
+    client.post("/api/v1/positions/", json={"map_id": map_obj["id"], "x": 500, "y": 400},
+                headers=admin_headers)
+    url = f"/api/v1/maps/{map_obj['id']}/free-space"
+
+    response = client.get(f"{url}?width=100&height=50&x=500&y=400&limit=3", headers=admin_headers)
+    assert response.status_code == 200
+    spots = response.json()
+    assert len(spots) == 3
+    assert spots[0] == {"x": 500, "y": 350, "width": 100, "height": 50, "rotation": 0, "distance": 50}
+
+    # Defaults to the map centre
+    assert len(client.get(f"{url}?width=10&height=10", headers=admin_headers).json()) == 5
+    assert client.get(f"{url}?width=100&height=50&x=5000&y=0", headers=admin_headers).status_code == 422
+    assert client.get(f"{url}?width=0&height=50", headers=admin_headers).status_code == 422
+    assert client.get("/api/v1/maps/999/free-space?width=1&height=1", headers=admin_headers).status_code == 404
+
+def test_layout_map(client: TestClient, admin_headers, staff_headers):
+    """Test auto-layout previews, saves and is admin only"""
+    map_obj = _create_map(client, admin_headers)
+    boats = [
+        client.post("/api/v1/boats/", json={
+            "index": i, "customer_name": f"Customer {i}", "size": "30 ft", "section": "B"
+        }, headers=admin_headers).json()
+        for i in (1, 2, 3)
+    ]
+    url = f"/api/v1/maps/{map_obj['id']}/layout"
+
+    preview = client.post(url, json={"section": "B", "dry_run": True}, headers=admin_headers).json()
+    assert preview["placed"] == 3 and preview["placements"][0]["position_id"] is None
+    assert client.post(url, json={"section": "B"}, headers=staff_headers).status_code == 403
+    assert client.post(url, json={"section": "B", "region": [5, 5, 1, 1]}, headers=admin_headers).status_code == 422
+
+    response = client.post(url, json={"boat_ids": [boats[0]["id"]], "region": [0, 0, 500, 500]},
+                           headers=admin_headers)
+    assert response.status_code == 200
+    placement = response.json()["placements"][0]
+    assert placement["boat_id"] == boats[0]["id"] and placement["x"] < 500
+    snapshot = client.get(f"/api/v1/maps/{map_obj['id']}", headers=admin_headers).json()
+    assert snapshot["boats"][0]["boat"]["id"] == boats[0]["id"]
+    assert snapshot["boats"][0]["position"]["id"] == placement["position_id"]
+
+def test_read_map_served_from_snapshot_cache(client: TestClient, admin_headers, db, count_statements):
+    """Test repeat map reads only check the map revision until the map changes"""
+    map_obj = _create_map(client, admin_headers)
+    position = client.post("/api/v1/positions/", json={"map_id": map_obj["id"]}, headers=admin_headers).json()
+    url = f"/api/v1/maps/{map_obj['id']}"
+    first = client.get(url, headers=admin_headers)
+
+    with count_statements(db) as statements:
+        second = client.get(url, headers=admin_headers)
+        not_modified = client.get(url, headers={**admin_headers, "If-None-Match": first.headers["ETag"]})
+    assert len(statements) == 2
+    assert all("boat_positions" not in sql and "boat_listings" not in sql for sql in statements)
+    assert second.json() == first.json()
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert not_modified.status_code == 304
+
+    client.put(f"/api/v1/positions/{position['id']}", json={"x": 77}, headers=admin_headers)
+    client.put(f"/api/v1/maps/{map_obj['id']}", json={"name": "Renamed"}, headers=admin_headers)
+    data = client.get(url, headers=admin_headers).json()
+    assert data["boats"][0]["position"]["x"] == 77
+    assert data["map"]["name"] == "Renamed"
+
+def test_read_map_ignores_stale_snapshot(client: TestClient, admin_headers, db):
+    """Test a cached snapshot is not served once another worker changed the map"""
+    map_obj = _create_map(client, admin_headers)
+    url = f"/api/v1/maps/{map_obj['id']}"
+    first = client.get(url, headers=admin_headers)
+
+    # A write on another worker bumps the revision without reaching this cache
+    db.execute(
+        text("UPDATE maps SET name = 'Elsewhere', revision = revision + 1 WHERE id = :id"),
+        {"id": map_obj["id"]},
+    )
+    db.commit()
+    response = client.get(url, headers={**admin_headers, "If-None-Match": first.headers["ETag"]})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != first.headers["ETag"]
+    assert response.json()["map"]["name"] == "Elsewhere"
+
+def test_fast_json_matches_model_responses(client: TestClient, admin_headers, monkeypatch):
+    """Test FAST_JSON bodies are the same documents the response models produce"""
+    map_obj = _create_map(client, admin_headers)
+    position = client.post(
+        "/api/v1/positions/", json={"map_id": map_obj["id"], "x": 12.5}, headers=admin_headers
+    ).json()
+    client.post("/api/v1/positions/", json={"map_id": map_obj["id"]}, headers=admin_headers)
+    boat = client.post(
+        "/api/v1/boats/", json={"index": 1, "customer_name": "John Doe"}, headers=admin_headers
+    ).json()
+    client.post(f"/api/v1/boats/{boat['id']}/assign/{position['id']}", headers=admin_headers)
+    client.post("/api/v1/boats/", json={"index": 2, "customer_name": "Jane Doe"}, headers=admin_headers)
+    urls = [
+        "/api/v1/boats/?limit=1",
+        "/api/v1/maps/",
+        f"/api/v1/maps/{map_obj['id']}",
+        f"/api/v1/positions/map/{map_obj['id']}",
+    ]
+
+    def fetch():
+        map_snapshots.clear()
+        return [client.get(url, headers=admin_headers) for url in urls]
+
+    expected = fetch()
+    monkeypatch.setattr(settings, "FAST_JSON", True)
+    for before, after in zip(expected, fetch()):
+        assert after.status_code == 200
+        assert after.json() == before.json()
+        for header in ("ETag", "X-Next-Cursor"):
+            assert after.headers.get(header) == before.headers.get(header)
+    assert "X-Next-Cursor" in expected[0].headers
+
+COLUMNAR = "application/vnd.pier11.columnar+json"
+
+def _rows(table: dict, palette: list = None) -> list:
+    """Rebuild row objects from a columnar table"""
+    columns = table["columns"]
+    rows = [dict(zip(columns, values)) for values in zip(*columns.values())]
+    for row in rows:
+        for field in ("color", "stroke_color"):
+            if palette is not None and field in row:
+                row[field] = palette[row[field]]
+    assert len(rows) == table["count"]
+    return rows
+
+def test_columnar_map_payloads(client: TestClient, admin_headers):
+    """Test the columnar representation carries the same rows as plain JSON"""
+    map_obj = _create_map(client, admin_headers)
+    position = client.post(
+        "/api/v1/positions/", json={"map_id": map_obj["id"], "color": "red"}, headers=admin_headers
+    ).json()
+    client.post("/api/v1/positions/", json={"map_id": map_obj["id"]}, headers=admin_headers)
+    boat = client.post(
+        "/api/v1/boats/", json={"index": 1, "customer_name": "John Doe"}, headers=admin_headers
+    ).json()
+    client.post(f"/api/v1/boats/{boat['id']}/assign/{position['id']}", headers=admin_headers)
+
+    url = f"/api/v1/positions/map/{map_obj['id']}"
+    plain = client.get(url, headers=admin_headers)
+    columnar = client.get(url, headers={**admin_headers, "Accept": COLUMNAR})
+    assert columnar.headers["content-type"] == COLUMNAR
+    assert columnar.headers["Vary"] == "Accept"
+    assert columnar.headers["ETag"] != plain.headers["ETag"]
+    data = columnar.json()
+    assert sorted(data["palette"]) == ["black", "blue", "red"]
+    assert _rows(data["positions"], data["palette"]) == [
+        {k: v for k, v in p.items() if k != "map_id"} for p in plain.json()
+    ]
+    assert len(columnar.content) < len(plain.content)
+
+    response = client.get(
+        url, headers={**admin_headers, "Accept": COLUMNAR, "If-None-Match": columnar.headers["ETag"]}
+    )
+    assert response.status_code == 304
+
+    url = f"/api/v1/maps/{map_obj['id']}"
+    plain = client.get(url, headers=admin_headers).json()
+    for _ in range(2):  # cold, then from the snapshot cache
+        snapshot = client.get(url, headers={**admin_headers, "Accept": COLUMNAR}).json()
+        assert snapshot["map"] == plain["map"]
+        positions = _rows(snapshot["positions"], snapshot["palette"])
+        assert positions == [
+            {k: v for k, v in item["position"].items() if k != "map_id"} for item in plain["boats"]
+        ]
+        assert _rows(snapshot["boats"]) == [item["boat"] for item in plain["boats"] if item["boat"]]
+    assert client.get(url, headers=admin_headers).json() == plain
+
+def test_msgpack_map_snapshot(client: TestClient, admin_headers):
+    """Test MessagePack carries the columnar snapshot"""
+    msgpack = pytest.importorskip("msgpack")
+    map_obj = _create_map(client, admin_headers)
+    client.post("/api/v1/positions/", json={"map_id": map_obj["id"]}, headers=admin_headers)
+    url = f"/api/v1/maps/{map_obj['id']}"
+
+    response = client.get(url, headers={**admin_headers, "Accept": "application/msgpack"})
+    assert response.headers["content-type"] == "application/msgpack"
+    assert msgpack.unpackb(response.content) == client.get(
+        url, headers={**admin_headers, "Accept": COLUMNAR}
+    ).json()
+
+def test_read_map_at(client: TestClient, admin_headers):
+    """Test reading a map as it was at an earlier time"""
+    map_obj = _create_map(client, admin_headers)
+    position = client.post("/api/v1/positions/", json={"map_id": map_obj["id"], "x": 50, "y": 60},
+                           headers=admin_headers).json()
+    placed = datetime.now(timezone.utc)
+    client.put(f"/api/v1/positions/{position['id']}", json={"x": 80}, headers=admin_headers)
+    url = f"/api/v1/maps/{map_obj['id']}/at"
+
+    response = client.get(url, params={"ts": placed.isoformat()}, headers=admin_headers)
+    assert response.status_code == 200
+    assert response.json()["positions"] == [
+        {"position_id": position["id"], "boat_id": None, "x": 50, "y": 60, "rotation": 0}
+    ]
+    now = client.get(url, params={"ts": datetime.now(timezone.utc).isoformat()}, headers=admin_headers).json()
+    assert now["positions"][0]["x"] == 80
+    assert client.get(url, headers=admin_headers).status_code == 422
+    assert client.get("/api/v1/maps/999/at", params={"ts": placed.isoformat()}, headers=admin_headers).status_code == 404
+
+def test_read_map_diff(client: TestClient, admin_headers):
+    """Test diffing a map between two times"""
+    map_obj = _create_map(client, admin_headers)
+    position = client.post("/api/v1/positions/", json={"map_id": map_obj["id"], "x": 50, "y": 60},
+                           headers=admin_headers).json()
+    boat = client.post("/api/v1/boats/", json={"index": 1, "customer_name": "John Doe"}, headers=admin_headers).json()
+    client.post(f"/api/v1/boats/{boat['id']}/assign/{position['id']}", headers=admin_headers)
+    start = datetime.now(timezone.utc)
+    client.put(f"/api/v1/positions/{position['id']}", json={"y": 90}, headers=admin_headers)
+    url = f"/api/v1/maps/{map_obj['id']}/diff"
+
+    response = client.get(url, params={"start": start.isoformat()}, headers=admin_headers)
+    assert response.status_code == 200
+    diff = response.json()
+    assert diff["added"] == [] and diff["removed"] == []
+    assert diff["moved"][0]["boat_id"] == boat["id"]
+    assert (diff["moved"][0]["before"]["y"], diff["moved"][0]["after"]["y"]) == (60, 90)
+
+    end = start.replace(year=start.year - 1)
+    assert client.get(url, params={"start": start.isoformat(), "end": end.isoformat()},
+                      headers=admin_headers).status_code == 422
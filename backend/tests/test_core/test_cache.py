@@ -0,0 +1,29 @@
+import time
+from app.core.cache import TTLCache
+
+def test_ttl_cache_lru_eviction():
+    """Test the least recently used entry is evicted when full"""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+
+def test_ttl_cache_expiry():
+    """Test entries expire after the TTL"""
+    cache = TTLCache(maxsize=2, ttl=0.01)
+    cache.set("a", 1)
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+
+def test_ttl_cache_disabled():
+    """Test a zero TTL stores nothing"""
+    cache = TTLCache(maxsize=2, ttl=0)
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
@@ -0,0 +1,96 @@
+import asyncio
+import gzip
+import zlib
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+from app.core.compression import CompressionMiddleware, choose_encoding, skip_compression
+
+BODY = "boat " * 1000
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+    @app.get("/large")
+    def large():
+        return PlainTextResponse(BODY, headers={"ETag": '"v1"'})
+
+    @app.get("/small")
+    def small():
+        return PlainTextResponse("tiny")
+
+    @app.get("/raw", dependencies=[Depends(skip_compression)])
+    def raw():
+        return PlainTextResponse(BODY)
+
+    @app.get("/events")
+    def events():
+        return StreamingResponse(iter(["data: 1\n\n"] * 50), media_type="text/event-stream")
+
+    return app
+
+def test_choose_encoding():
+    """Test the server's preference order among accepted encodings"""
+    assert choose_encoding("gzip, deflate, br", ["br", "gzip"]) == "br"
+    assert choose_encoding("gzip, br;q=0", ["br", "gzip"]) == "gzip"
+    assert choose_encoding("*", ["gzip"]) == "gzip"
+    assert choose_encoding("identity", ["br", "gzip"]) is None
+    assert choose_encoding(None, ["gzip"]) is None
+
+def test_large_bodies_are_compressed():
+    """Test bodies over the threshold are encoded, with a weak ETag"""
+    client = TestClient(_app())
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert response.headers["ETag"] == 'W/"v1"'
+    assert response.text == BODY
+    assert int(response.headers["Content-Length"]) < len(BODY) / 10
+
+def test_brotli():
+    """Test br is preferred when installed"""
+    pytest.importorskip("brotli")
+    client = TestClient(_app())
+    response = client.get("/large", headers={"Accept-Encoding": "gzip, br"})
+
+    assert response.headers["Content-Encoding"] == "br"
+    assert response.text == BODY
+
+@pytest.mark.parametrize("path", ["/small", "/raw", "/events"])
+def test_uncompressed_responses(path):
+    """Test small bodies, opted-out routes and event streams are sent as is"""
+    client = TestClient(_app())
+    response = client.get(path, headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert "Content-Encoding" not in response.headers
+
+def test_streaming_is_flushed_per_chunk():
+    """Test each streamed chunk can be decoded as soon as it arrives"""
+    chunks = [f"{i},boat,{'x' * 50}\n".encode() for i in range(5)]
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(b"content-type", b"text/csv")]})
+        for chunk in chunks:
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "path": "/export", "headers": [(b"accept-encoding", b"gzip")]}
+    asyncio.run(CompressionMiddleware(app, minimum_size=10_000)(scope, None, send))
+
+    start, *bodies = messages
+    assert (b"content-encoding", b"gzip") in start["headers"]
+    assert not any(name == b"content-length" for name, _ in start["headers"])
+    decoder = zlib.decompressobj(zlib.MAX_WBITS | 16)
+    for chunk, message in zip(chunks, bodies):
+        assert decoder.decompress(message["body"]) == chunk
+    assert gzip.decompress(b"".join(m["body"] for m in bodies)) == b"".join(chunks)
@@ -0,0 +1,69 @@
+import random
+from app.core.geometry import (
+    corners_overlap, footprint_bounds, footprint_corners, free_placements, overlapping_pairs,
+    parse_bbox
+)
+
+def test_footprint_bounds_rotation():
+    """Test bounds grow with rotation and swap axes at 90 degrees"""
+    assert footprint_bounds(0, 0, 100, 20, 0) == (-50, -10, 50, 10)
+    x0, y0, x1, y1 = footprint_bounds(0, 0, 100, 20, 90)
+    assert round(x1, 6) == 10 and round(y1, 6) == 50
+
+def test_corners_overlap_rotated_rectangles():
+    """Test the separating-axis test against rotated near misses"""
+    base = footprint_corners(0, 0, 100, 20, 0)
+    assert corners_overlap(base, footprint_corners(40, 0, 100, 20, 0))
+    # Touching edges do not count
+    assert not corners_overlap(base, footprint_corners(100, 0, 100, 20, 0))
+    # Boxes overlap but a 45 degree boat clears the corner
+    near_miss = footprint_corners(66, 26, 40, 10, 45)
+    box = footprint_bounds(66, 26, 40, 10, 45)
+    assert box[0] < 50 and box[1] < 10
+    assert not corners_overlap(base, near_miss)
+    assert corners_overlap(base, footprint_corners(0, 0, 200, 5, 90))
+
+def test_overlapping_pairs_matches_brute_force():
+    """Test the grid index finds exactly the pairs a full scan does"""
+    rng = random.Random(7)
+    shapes = {
+        i: (rng.uniform(0, 2000), rng.uniform(0, 2000), rng.uniform(20, 120),
+            rng.uniform(10, 40), rng.uniform(0, 360))
+        for i in range(1, 400)
+    }
+    shapes[400] = (1000, 1000, 1500, 30, 30)  # far larger than the others
+    expected = sorted(
+        (a, b) for a in shapes for b in shapes
+        if a < b and corners_overlap(footprint_corners(*shapes[a]), footprint_corners(*shapes[b]))
+    )
+    assert overlapping_pairs(shapes) == expected
+    assert overlapping_pairs({}) == []
+
+def test_parse_bbox():
+    """Test bbox parsing rejects malformed and inverted boxes"""
+    assert parse_bbox("0,1.5,10,20") == (0, 1.5, 10, 20)
+    for value in ("1,2,3", "5,0,1,1", "a,b,c,d", "0,0,inf,1"):
+        try:
+            parse_bbox(value)
+        except ValueError:
+            continue
+        raise AssertionError(value)
+
+def test_free_placements_nearest_first():
+    """Test free spots avoid footprints, the area edge and each other"""
+    area = (0, 0, 1000, 1000)
+    occupied = [(500, 500, 100, 50, 0), (500, 560, 100, 50, 0)]
+    spots = free_placements(area, occupied, 100, 50, target=(500, 500), limit=4)
+
+    assert len(spots) == 4
+    assert [d for _, _, d in spots] == sorted(d for _, _, d in spots)
+    shapes = [footprint_corners(x, y, 100, 50, 0) for x, y, _ in spots]
+    for i, shape in enumerate(shapes):
+        assert not any(corners_overlap(shape, footprint_corners(*o)) for o in occupied)
+        assert not any(corners_overlap(shape, other) for other in shapes[i + 1:])
+    # The target is taken; the nearest spot sits just above the upper boat
+    assert spots[0] == (500, 450, 50)
+
+    assert free_placements(area, [], 2000, 50) == []
+    corner = free_placements(area, [], 100, 50, target=(0, 0), limit=1)
+    assert corner == [(50, 25, corner[0][2])]
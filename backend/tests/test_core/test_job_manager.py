@@ -0,0 +1,120 @@
+import threading
+import time
+import pytest
+from app.core.exceptions import ServiceUnavailableError
+from app.core import jobs as jobs_module
+from app.core.jobs import CANCELLED, FAILED, SUCCEEDED, JobManager
+
+def _count(context, steps: int) -> int:
+    for step in range(steps):
+        context.progress(step / steps, f"step {step}")
+    return steps
+
+def _spin(context, seconds: float) -> None:
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        context.progress(0.5)
+        time.sleep(0.01)
+
+def _fail(context) -> None:
+    raise ValueError("bad input")
+
+@pytest.fixture(scope="module")
+def manager():
+    manager = JobManager(max_workers=1, max_pending=2, retention=60)
+    yield manager
+    manager.shutdown()
+
+def test_job_runs_in_worker_and_reports_result(manager):
+    """Test a job reports progress, finishes and passes through finish"""
+    job = manager.submit("count", _count, 50, owner_id=7, finish=lambda steps: {"steps": steps})
+    assert job.status in ("queued", "running")
+
+    manager.wait(job.id, timeout=30)
+    assert job.status == SUCCEEDED
+    assert job.result == {"steps": 50}
+    assert job.progress == 1.0 and job.owner_id == 7
+    assert job.started_at is not None and job.finished_at >= job.started_at
+
+def test_failed_job_keeps_the_error(manager):
+    """Test an exception in the task fails the job"""
+    job = manager.wait(manager.submit("fail", _fail).id, timeout=30)
+    assert job.status == FAILED
+    assert job.error == "bad input" and job.result is None
+
+def test_cancel_running_and_queued_jobs(manager):
+    """Test cancelled jobs stop and free their slots"""
+    running = manager.submit("spin", _spin, 30)
+    queued = manager.submit("spin", _spin, 30)
+    with pytest.raises(ServiceUnavailableError):
+        manager.submit("spin", _spin, 30)
+
+    deadline = time.monotonic() + 30
+    while running.status != "running" and time.monotonic() < deadline:
+        time.sleep(0.01)
+    manager.cancel(queued.id)
+    manager.cancel(running.id)
+    manager.wait(running.id, timeout=10)
+    manager.wait(queued.id, timeout=10)
+    assert running.status == CANCELLED and queued.status == CANCELLED
+    assert running.finished_at is not None
+
+    # Both slots are free again
+    job = manager.wait(manager.submit("count", _count, 5).id, timeout=30)
+    assert job.status == SUCCEEDED
+    assert manager.stats()["rejected"] == 1
+
+def test_concurrent_first_submissions_share_one_pool(monkeypatch):
+    """Test racing first submissions start a single pool"""
+    pools = []
+
+    class CountingPool(jobs_module.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            pools.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(jobs_module, "ProcessPoolExecutor", CountingPool)
+    manager = JobManager(max_workers=1, max_pending=4, retention=60)
+    barrier = threading.Barrier(4)
+    submitted = []
+
+    def submit():
+        barrier.wait()
+        submitted.append(manager.submit("count", _count, 1))
+
+    threads = [threading.Thread(target=submit) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    try:
+        assert len(pools) == 1
+        assert all(manager.wait(job.id, timeout=30).status == SUCCEEDED for job in submitted)
+    finally:
+        manager.shutdown()
+
+def test_failed_submit_releases_its_slot():
+    """Test a pool that refuses work leaves no queued job or taken slot behind"""
+    manager = JobManager(max_workers=1, max_pending=1, retention=60)
+    with manager._lock:
+        pool = manager._ensure_pool()
+    pool.shutdown(wait=True)
+    try:
+        with pytest.raises(ServiceUnavailableError):
+            manager.submit("count", _count, 1)
+        assert manager._free_slots == [0]
+        assert manager.stats()["submitted"] == 0 and manager.stats()["queued"] == 0
+    finally:
+        manager.shutdown()
+
+def test_finish_runs_off_the_executor_thread(manager):
+    """Test finish callbacks don't run on the pool's management thread"""
+    threads = []
+
+    def finish(steps):
+        threads.append(threading.current_thread().name)
+        return steps
+
+    job = manager.wait(manager.submit("count", _count, 1, finish=finish).id, timeout=30)
+    assert job.status == SUCCEEDED
+    assert threads[0].startswith("job-finish")
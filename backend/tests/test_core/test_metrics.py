@@ -0,0 +1,68 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+from app.core.database import engine_options, ping_idle_connections
+from app.core.metrics import PoolMetrics
+
+def _engine(metrics: PoolMetrics):
+    """File-backed SQLite engine using the configured pool options"""
+    url = "sqlite:///./test.db"
+    engine = create_engine(url, **engine_options(url, metrics, QueuePool))
+    metrics.attach(engine)
+    return engine
+
+def test_pool_metrics_count_checkouts():
+    """Test checkouts, new connections and wait time are recorded"""
+    metrics = PoolMetrics()
+    engine = _engine(metrics)
+
+    for _ in range(3):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+    snapshot = metrics.snapshot()
+    assert snapshot["pool"] == "TimedQueuePool"
+    assert snapshot["checkouts"] == 3
+    assert snapshot["checkins"] == 3
+    assert snapshot["connects"] == 1
+    assert snapshot["checkedout"] == 0
+    assert snapshot["wait_ms_total"] >= 0.0
+    engine.dispose()
+
+def test_idle_pre_ping_replaces_dead_connection():
+    """Test idle pre-ping invalidates a broken pooled connection"""
+    metrics = PoolMetrics()
+    engine = _engine(metrics)
+    ping_idle_connections(engine, idle_seconds=0)
+
+    # Return a connection to the pool, then break it behind the pool's back
+    pooled = engine.raw_connection()
+    dbapi_connection = pooled.dbapi_connection
+    pooled.close()
+    dbapi_connection.close()
+
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT 1")).scalar() == 1
+
+    snapshot = metrics.snapshot()
+    assert snapshot["invalidations"] == 1
+    assert snapshot["connects"] == 2
+    engine.dispose()
+
+def test_metrics_endpoint(client: TestClient, admin_headers, staff_headers):
+    """Test /metrics reports the database pool to admins only"""
+    assert client.get("/metrics").status_code in (401, 403)
+    assert client.get("/metrics", headers=staff_headers).status_code == 403
+
+    response = client.get("/metrics", headers=admin_headers)
+    assert response.status_code == 200
+    assert "checkouts" in response.json()["database_pool"]
+
+def test_metrics_endpoint_reports_user_cache(client: TestClient, admin_headers, staff_headers):
+    """Test /metrics reports user cache counters"""
+    client.get("/api/v1/maps/", headers=staff_headers)
+    client.get("/api/v1/maps/", headers=staff_headers)
+
+    stats = client.get("/metrics", headers=admin_headers).json()["user_cache"]
+    assert stats["hits"] >= 1
+    assert stats["misses"] >= 1
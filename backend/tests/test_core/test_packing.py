@@ -0,0 +1,30 @@
+import random
+from app.core.geometry import footprint_bounds, overlapping_pairs
+from app.core.packing import PackItem, pack
+
+def _items(count: int, seed: int = 1) -> list:
+    rng = random.Random(seed)
+    return [PackItem(i, length, length / 3) for i, length in enumerate(rng.uniform(60, 140) for _ in range(count))]
+
+def test_pack_places_boats_clear_of_each_other_and_obstacles():
+    """Test a roomy region takes every boat without overlaps"""
+    area = (100, 100, 2100, 1600)
+    obstacles = [(600, 600, 100, 40, 30), (1500, 300, 200, 60, 0)]
+    result = pack(area, _items(300), obstacles, spacing=5, time_budget=1)
+
+    assert result.unplaced == []
+    assert len(result.placements) == 300
+    shapes = {p.key: (p.x, p.y, p.width, p.height, p.rotation) for p in result.placements}
+    shapes.update({-1 - i: shape for i, shape in enumerate(obstacles)})
+    assert overlapping_pairs(shapes) == []
+    for shape in shapes.values():
+        x0, y0, x1, y1 = footprint_bounds(*shape)
+        assert area[0] - 1e-6 <= x0 and area[1] - 1e-6 <= y0 and x1 <= area[2] + 1e-6 and y1 <= area[3] + 1e-6
+
+def test_pack_reports_boats_that_do_not_fit():
+    """Test leftovers are reported within the time budget"""
+    result = pack((0, 0, 600, 400), _items(100), spacing=5, time_budget=0.2)
+
+    assert result.placements and result.unplaced
+    assert len(result.placements) + len(result.unplaced) == 100
+    assert result.attempts >= 4
@@ -0,0 +1,50 @@
+import asyncio
+import json
+import threading
+from app.core.realtime import RESYNC, ChangeBroadcaster
+
+def test_broadcaster_delivers_per_map():
+    """Test subscribers only receive events for their map, from any thread"""
+    async def scenario():
+        broadcaster = ChangeBroadcaster()
+        with broadcaster.subscribe(1) as first, broadcaster.subscribe(2) as second:
+            publisher = threading.Thread(
+                target=broadcaster.publish, args=(1, {"type": "position.deleted", "position_id": 5})
+            )
+            publisher.start()
+            publisher.join()
+
+            message = json.loads(await asyncio.wait_for(first.get(), 1))
+            assert message == {"map_id": 1, "type": "position.deleted", "position_id": 5}
+            assert second.queue.empty()
+            assert broadcaster.stats()["subscribers"] == 2
+        assert broadcaster.stats()["subscribers"] == 0
+
+    asyncio.run(scenario())
+
+def test_slow_subscriber_is_told_to_resync():
+    """Test an overflowing queue is replaced by a single resync message"""
+    async def scenario():
+        broadcaster = ChangeBroadcaster(queue_size=2)
+        with broadcaster.subscribe(1) as subscription:
+            for i in range(3):
+                broadcaster.publish(1, {"type": "position.deleted", "position_id": i})
+            await asyncio.sleep(0)
+
+            assert [message async for message in subscription.messages()] == [RESYNC]
+
+    asyncio.run(scenario())
+
+def test_publish_failure_does_not_raise():
+    """Test a broken backend never fails the write that published"""
+    class BrokenBackend:
+        def start(self, deliver):
+            pass
+        def publish(self, message):
+            raise ConnectionError("down")
+        def stop(self):
+            pass
+
+    broadcaster = ChangeBroadcaster(BrokenBackend())
+    broadcaster.publish(1, {"type": "position.deleted", "position_id": 1})
+    assert broadcaster.stats()["failed"] == 1
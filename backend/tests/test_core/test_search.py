@@ -0,0 +1,20 @@
+from app.core.search import similarity, word_similarity
+
+def test_similarity_identical_and_disjoint():
+    """Test trigram similarity bounds"""
+    assert similarity("Sea Ray", "sea ray") == 1.0
+    assert similarity("Sea Ray", "Whaler") == 0.0
+    assert similarity("", "Whaler") == 0.0
+
+def test_word_similarity_prefers_whole_words():
+    """Test exact word matches outrank partial ones"""
+    exact = word_similarity("ray", "Ann Lee | Sea Ray")
+    partial = word_similarity("ray", "Raymond Jones")
+
+    assert exact == 1.0
+    assert 0.0 < partial < exact
+
+def test_word_similarity_multi_word_term():
+    """Test multi-word terms match runs of consecutive words"""
+    assert word_similarity("boston whaler", "John | Boston Whaler | 22 ft") == 1.0
+    assert word_similarity("boston whaler", "Boston | Grady White") < 1.0
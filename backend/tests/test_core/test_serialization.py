@@ -0,0 +1,57 @@
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from app.core.serialization import Palette, columns, dumps, negotiate, row_dict
+from app.schemas.boat_position import BoatPositionResponse
+from app.schemas.map import MapResponse
+
+def test_dumps_matches_pydantic_datetimes():
+    """Test datetimes render the way the response models write them"""
+    naive = datetime(2024, 5, 1, 12, 30, 0, 250000)
+    aware = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+
+    assert json.loads(dumps({"at": naive, "utc": aware})) == {
+        "at": "2024-05-01T12:30:00.250000",
+        "utc": "2024-05-01T12:30:00Z",
+    }
+
+def test_row_dict_matches_model_dump():
+    """Test row_dict follows the schema's fields, order and defaults"""
+    row = SimpleNamespace(
+        id=3, name="Yard", description=None, image_path="yard.png", image_width=800,
+        image_height=600, is_active=True, revision=4, created_at=datetime(2024, 1, 1),
+        updated_at=None, extra="not in the schema",
+    )
+    data = row_dict(row, MapResponse)
+
+    assert data == MapResponse.model_validate(row).model_dump()
+    assert list(data) == list(MapResponse.model_fields)
+    assert data["boat_count"] == 0
+
+def test_negotiate_accept_header():
+    """Test the preferred supported representation wins, defaulting to JSON"""
+    assert negotiate(None) == "json"
+    assert negotiate("*/*") == "json"
+    assert negotiate("application/vnd.pier11.columnar+json") == "columnar"
+    assert negotiate("application/json, application/vnd.pier11.columnar+json") == "json"
+    assert negotiate("application/json;q=0.5, application/vnd.pier11.columnar+json") == "columnar"
+    assert negotiate("text/html, application/x-msgpack;q=0.9") in ("msgpack", "json")
+
+def test_columns_with_palette():
+    """Test rows become one array per field with palette-indexed colors"""
+    rows = [
+        SimpleNamespace(id=i, map_id=1, x=i * 10.0, y=0.0, width=100.0, height=50.0, rotation=0.0,
+                        color=color, stroke_color="black", stroke_width=1.0, is_visible=True,
+                        created_at=datetime(2024, 1, 1), updated_at=None)
+        for i, color in enumerate(["red", "blue", "red"])
+    ]
+    palette = Palette()
+    table = columns(rows, BoatPositionResponse, exclude=("map_id",),
+                    encoders={"color": palette.index, "stroke_color": palette.index})
+
+    assert table["count"] == 3
+    assert "map_id" not in table["columns"]
+    assert table["columns"]["x"] == [0.0, 10.0, 20.0]
+    assert table["columns"]["color"] == [0, 1, 0]
+    assert table["columns"]["stroke_color"] == [2, 2, 2]
+    assert palette.values == ["red", "blue", "black"]
@@ -0,0 +1,25 @@
+import pytest
+from app.core.sizes import BoatSize, parse_size
+
+@pytest.mark.parametrize("text, expected", [
+    ("35 ft", BoatSize(35.0)),
+    ("35'", BoatSize(35.0)),
+    ("35' 6\"", BoatSize(35.5)),
+    ("35ft 6in", BoatSize(35.5)),
+    ("26.5 ft.", BoatSize(26.5)),
+    ("35", BoatSize(35.0)),
+    ("420 in", BoatSize(35.0)),
+    ("10.5 m", BoatSize(34.45)),
+    ("35 x 12", BoatSize(35.0, 12.0)),
+    ("12' x 35'", BoatSize(35.0, 12.0)),
+    ("10m x 3.5m", BoatSize(32.81, 11.48)),
+    ("35 X 12 ft", BoatSize(35.0, 12.0)),
+])
+def test_parse_size(text, expected):
+    """Test common ways sizes are typed into listings"""
+    assert parse_size(text) == expected
+
+@pytest.mark.parametrize("text", [None, "", "abc", "35 ft long", "0", "9999", "35 x 0"])
+def test_parse_size_unreadable(text):
+    """Test unreadable or implausible sizes give None"""
+    assert parse_size(text) is None
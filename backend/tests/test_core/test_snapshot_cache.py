@@ -0,0 +1,47 @@
+from app.core.realtime import ChangeBroadcaster
+from app.core.snapshot_cache import SnapshotCache
+
+class DictStore:
+    """Local stand-in for the shared Redis store"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value):
+        self.data[key] = value
+
+def test_build_racing_a_write_is_not_cached():
+    """Test a body built before an invalidation is rejected"""
+    cache = SnapshotCache(maxsize=4, ttl=60)
+    ticket = cache.ticket(1)
+    cache.invalidate(1)
+
+    assert cache.store(1, ticket, 3, b"stale") is False
+    assert cache.get(1) is None
+
+    assert cache.store(1, cache.ticket(1), 4, b"fresh") is True
+    assert cache.get(1) == (4, b"fresh")
+
+def test_shared_store_is_keyed_by_revision():
+    """Test shared entries are looked up per revision"""
+    cache = SnapshotCache(maxsize=4, ttl=60, shared=DictStore())
+    cache.store(1, cache.ticket(1), 7, b"body")
+    cache.invalidate(1)
+
+    assert cache.get(1) is None
+    assert cache.get_shared(1, 7) == b"body"
+    assert cache.get_shared(1, 8) is None
+
+def test_published_changes_invalidate():
+    """Test broadcaster listeners drop cached snapshots"""
+    cache = SnapshotCache(maxsize=4, ttl=60)
+    broadcaster = ChangeBroadcaster()
+    broadcaster.add_listener(cache.invalidate)
+    cache.store(2, cache.ticket(2), 1, b"body")
+
+    broadcaster.publish(2, {"type": "position.deleted", "position_id": 9})
+    assert cache.get(2) is None
+    assert cache.stats()["invalidations"] == 1
@@ -65,3 +65,18 @@ def test_boat_position_relationship(db: Session):
     assert boat.position.id == position.id
     assert boat.is_mapped == True
 
+
+def test_boat_listing_parses_size(db: Session):
+    """Test length and beam follow the size text on every write"""
+    boat = BoatListing(index=1, customer_name="John Doe", size="10 m x 3 m")
+    db.add(boat)
+    db.commit()
+    assert (boat.length_ft, boat.beam_ft) == (32.81, 9.84)
+
+    boat.size = "custom"
+    db.commit()
+    assert boat.length_ft is None and boat.beam_ft is None
+
+    boat.size = "35' 6\""
+    db.commit()
+    assert (boat.length_ft, boat.beam_ft) == (35.5, None)
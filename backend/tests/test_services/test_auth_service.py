@@ -0,0 +1,33 @@
+from sqlalchemy.orm import Session
+from app.models.user import User, UserRole
+from app.schemas.user import UserUpdate
+from app.services.auth import AuthService, user_cache
+
+def test_get_cached_user_hits_cache(db: Session, staff_user: User):
+    """Test repeated lookups are served from the cache"""
+    hits_before = user_cache.hits
+
+    first = AuthService.get_cached_user(db, staff_user.email)
+    second = AuthService.get_cached_user(db, staff_user.email)
+
+    assert first is second
+    assert first.role == UserRole.STAFF
+    assert user_cache.hits == hits_before + 1
+
+def test_get_cached_user_missing(db: Session):
+    """Test unknown emails are not cached"""
+    assert AuthService.get_cached_user(db, "nobody@pier11marina.com") is None
+    assert user_cache.get("nobody@pier11marina.com") is None
+
+def test_update_user_invalidates_cache(db: Session, staff_user: User):
+    """Test role, active flag and email changes evict cached identities"""
+    AuthService.get_cached_user(db, staff_user.email)
+
+    AuthService.update_user(db, staff_user.id, UserUpdate(role=UserRole.ADMIN, is_active=False))
+    cached = AuthService.get_cached_user(db, staff_user.email)
+    assert cached.role == UserRole.ADMIN
+    assert cached.is_active is False
+
+    AuthService.update_user(db, staff_user.id, UserUpdate(email="moved@pier11marina.com"))
+    assert AuthService.get_cached_user(db, "staff@pier11marina.com") is None
+    assert AuthService.get_cached_user(db, "moved@pier11marina.com") is not None
@@ -0,0 +1,47 @@
+import io
+from sqlalchemy.orm import Session
+from app.models.boat_listing import BoatListing
+from app.schemas.boat_listing import BoatListingCreate
+from app.services.boat import BoatService
+from app.services.boat_import import BoatImportService
+
+CSV_DATA = """Index,Name,Customer Name,Size,Make Model,Section,Notes
+1,Sea Breeze,John Smith,30 ft,Sea Ray,a,
+2,,Jane Doe,22 ft,Boston Whaler,B,Winter storage
+
+3,No Customer,,18 ft,,C,
+2,Duplicate,Bob Stone,25 ft,,D,
+4,Bad Section,Ann Lee,20 ft,,Z,
+5,Existing,Tom Hart,40 ft,,E,
+6,Last,Eve Moss,35 ft,Grady White,F,
+"""
+
+def _rows(text: str):
+    return BoatImportService.iter_csv_rows(io.StringIO(text))
+
+def test_import_boats_reports_row_errors(db: Session):
+    """Test valid rows are inserted and invalid ones reported by row"""
+    BoatService.create_boat(db, BoatListingCreate(index=5, customer_name="Already Here"))
+
+    result = BoatImportService.import_boats(db, _rows(CSV_DATA), batch_size=2)
+
+    assert result["rows"] == 7
+    assert result["created"] == 3
+    assert result["error_count"] == 4
+    assert [(e["row"], e["index"]) for e in result["errors"]] == [
+        (5, 3), (6, 2), (7, 4), (8, 5)
+    ]
+    assert "customer_name" in result["errors"][0]["message"]
+
+    boats = {b.index: b for b in db.query(BoatListing).all()}
+    assert sorted(boats) == [1, 2, 5, 6]
+    assert boats[1].section == "A"
+    assert boats[2].name is None
+    assert boats[6].is_mapped is False
+    # Bulk inserts fill the parsed size columns too
+    assert boats[1].length_ft == 30.0 and boats[6].length_ft == 35.0
+
+def test_import_boats_empty_file(db: Session):
+    """Test an empty upload imports nothing"""
+    result = BoatImportService.import_boats(db, _rows(""))
+    assert result == {"rows": 0, "created": 0, "error_count": 0, "errors": []}
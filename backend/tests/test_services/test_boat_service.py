@@ -98,3 +98,84 @@ def test_assign_boat_to_occupied_position(db: Session):
     with pytest.raises(ValidationError):
         BoatService.assign_boat_to_position(db, boat2.id, position.id)
 
+
+def test_get_boats_search_ranked_by_relevance(db: Session):
+    """Test search results are ordered by relevance before index"""
+    BoatService.create_boat(db, BoatListingCreate(index=1, customer_name="Raymond Jones"))
+    BoatService.create_boat(db, BoatListingCreate(index=2, customer_name="Ann Lee", make_model="Sea Ray"))
+    BoatService.create_boat(db, BoatListingCreate(index=3, customer_name="Bob Stone"))
+
+    results = BoatService.get_boats(db, search="ray")
+
+    assert [boat.index for boat in results] == [2, 1]
+
+def test_get_boats_page_keyset_walk(db: Session):
+    """Test walking boat pages forward and back with cursors"""
+    for i in range(1, 8):
+        BoatService.create_boat(db, BoatListingCreate(index=i * 10, customer_name=f"Customer {i}"))
+
+    first = BoatService.get_boats_page(db, limit=3)
+    assert [b.index for b in first["items"]] == [10, 20, 30]
+    assert first["prev_cursor"] is None
+
+    second = BoatService.get_boats_page(db, limit=3, cursor=first["next_cursor"])
+    assert [b.index for b in second["items"]] == [40, 50, 60]
+
+    third = BoatService.get_boats_page(db, limit=3, cursor=second["next_cursor"])
+    assert [b.index for b in third["items"]] == [70]
+    assert third["next_cursor"] is None
+
+    back = BoatService.get_boats_page(db, limit=3, cursor=third["prev_cursor"])
+    assert [b.index for b in back["items"]] == [40, 50, 60]
+
+    start = BoatService.get_boats_page(db, limit=3, cursor=back["prev_cursor"])
+    assert [b.index for b in start["items"]] == [10, 20, 30]
+    assert start["prev_cursor"] is None
+
+def test_get_boats_page_keyset_with_search(db: Session):
+    """Test cursors follow relevance ordering when searching"""
+    BoatService.create_boat(db, BoatListingCreate(index=1, customer_name="Raymond Jones"))
+    BoatService.create_boat(db, BoatListingCreate(index=2, customer_name="Ann Lee", make_model="Sea Ray"))
+    BoatService.create_boat(db, BoatListingCreate(index=3, customer_name="Ray Stone"))
+
+    first = BoatService.get_boats_page(db, limit=2, search="ray")
+    second = BoatService.get_boats_page(db, limit=2, search="ray", cursor=first["next_cursor"])
+
+    assert [b.index for b in first["items"]] == [2, 3]
+    assert [b.index for b in second["items"]] == [1]
+
+def test_get_boats_page_search_walk_is_complete(db: Session):
+    """Test paging through tied and distinct relevance scores returns each boat once"""
+    names = ["Ray", "Ray Lee", "Raymond", "Ray", "Murray", "Ray Lee", "Rayna", "Ray"]
+    for i, name in enumerate(names, 1):
+        BoatService.create_boat(db, BoatListingCreate(index=i, customer_name=name))
+
+    seen = []
+    page = BoatService.get_boats_page(db, limit=3, search="ray")
+    while True:
+        seen += [b.index for b in page["items"]]
+        if not page["next_cursor"]:
+            break
+        page = BoatService.get_boats_page(db, limit=3, search="ray", cursor=page["next_cursor"])
+
+    assert sorted(seen) == list(range(1, len(names) + 1))
+    assert seen == [b.index for b in BoatService.get_boats(db, search="ray", limit=100)]
+
+def test_get_boats_page_by_length(db: Session):
+    """Test length filters and walking pages sorted by length"""
+    sizes = ["30 ft", "8 m", "custom", "22'", "30 ft", None, "40 x 13"]
+    for i, size in enumerate(sizes, 1):
+        BoatService.create_boat(db, BoatListingCreate(index=i, customer_name=f"Customer {i}", size=size))
+
+    in_range = BoatService.get_boats(db, min_length=25, max_length=35, sort="length")
+    assert [b.index for b in in_range] == [2, 1, 5]
+
+    longest = []
+    page = BoatService.get_boats_page(db, limit=3, sort="-length")
+    while True:
+        longest += [b.index for b in page["items"]]
+        if not page["next_cursor"]:
+            break
+        page = BoatService.get_boats_page(db, limit=3, sort="-length", cursor=page["next_cursor"])
+    # Unknown lengths sort as 0: last when longest first
+    assert longest == [7, 5, 1, 2, 4, 6, 3]
@@ -0,0 +1,38 @@
+import csv
+import io
+import json
+from sqlalchemy.orm import Session
+from app.schemas.boat_listing import BoatListingCreate
+from app.services.boat import BoatService
+from app.services.boat_import import BoatImportService
+from app.services.export import ExportService
+
+def _create_boats(db: Session, count: int):
+    for i in range(1, count + 1):
+        BoatService.create_boat(db, BoatListingCreate(
+            index=i, customer_name=f"Customer {i}", size="30 ft", section="AB"[i % 2]
+        ))
+
+def test_export_streams_in_batches(db: Session):
+    """Test rows are written one chunk per yield_per batch"""
+    _create_boats(db, 5)
+
+    chunks = list(ExportService.stream(ExportService.boats_query(db), "ndjson", batch_size=2))
+
+    assert [chunk.count("\n") for chunk in chunks] == [2, 2, 1]
+    rows = [json.loads(line) for line in "".join(chunks).splitlines()]
+    assert [row["index"] for row in rows] == [1, 2, 3, 4, 5]
+    assert rows[0]["customer_name"] == "Customer 1"
+
+def test_export_csv_round_trips_through_import(db: Session):
+    """Test a CSV export can be imported again"""
+    _create_boats(db, 3)
+    data = "".join(ExportService.stream(ExportService.boats_query(db, section="a"), "csv"))
+
+    rows = list(csv.DictReader(io.StringIO(data)))
+    assert [row["index"] for row in rows] == ["2"]
+
+    BoatService.delete_boat(db, BoatService.get_boat_by_index(db, 2).id)
+    result = BoatImportService.import_boats(db, BoatImportService.iter_csv_rows(io.StringIO(data)))
+    assert result["created"] == 1
+    assert BoatService.get_boat_by_index(db, 2).customer_name == "Customer 2"
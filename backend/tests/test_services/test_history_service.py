@@ -0,0 +1,136 @@
+from datetime import datetime, timedelta, timezone
+import pytest
+from sqlalchemy.orm import Session
+from app.core.exceptions import NotFoundError
+from app.models.map import Map
+from app.models.position_history import PositionHistory
+from app.models.position_history_checkpoint import PositionHistoryCheckpoint
+from app.core.config import settings
+from app.schemas.boat_listing import BoatListingCreate
+from app.schemas.boat_position import BoatPositionBulkItem, BoatPositionCreate, BoatPositionUpdate
+from app.services.boat import BoatService
+from app.services.history import HistoryService, history_row, record_history
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+def _layout(state: dict) -> list:
+    return [(p["position_id"], p["boat_id"], p["x"], p["y"]) for p in state["positions"]]
+
+def test_map_at_replays_position_changes(db: Session):
+    """Test every position write is recorded and the map can be rebuilt at any time"""
+    map_obj = Map(name="Yard", image_path="yard.png")
+    db.add(map_obj)
+    db.commit()
+    boat = BoatService.create_boat(db, BoatListingCreate(index=1, customer_name="John Doe"))
+
+    before = _now()
+    first = BoatService.create_position(db, BoatPositionCreate(map_id=map_obj.id, x=10, y=10))
+    second = BoatService.create_position(db, BoatPositionCreate(map_id=map_obj.id, x=50, y=50))
+    BoatService.assign_boat_to_position(db, boat.id, first.id)
+    created = _now()
+    BoatService.update_position(db, first.id, BoatPositionUpdate(x=20))
+    BoatService.bulk_update_positions(db, [BoatPositionBulkItem(id=first.id, y=30)])
+    moved = _now()
+    BoatService.assign_boat_to_position(db, boat.id, second.id)
+    BoatService.delete_position(db, first.id)
+    end = _now()
+
+    assert _layout(HistoryService.get_map_at(db, map_obj.id, before)) == []
+    assert _layout(HistoryService.get_map_at(db, map_obj.id, created)) == [
+        (first.id, boat.id, 10, 10), (second.id, None, 50, 50)
+    ]
+    assert _layout(HistoryService.get_map_at(db, map_obj.id, moved)) == [
+        (first.id, boat.id, 20, 30), (second.id, None, 50, 50)
+    ]
+    assert _layout(HistoryService.get_map_at(db, map_obj.id, end)) == [(second.id, boat.id, 50, 50)]
+    # Naive timestamps are taken as UTC
+    naive = HistoryService.get_map_at(db, map_obj.id, moved.replace(tzinfo=None))
+    assert _layout(naive) == _layout(HistoryService.get_map_at(db, map_obj.id, moved))
+    with pytest.raises(NotFoundError):
+        HistoryService.get_map_at(db, 999, end)
+
+    history = HistoryService.get_boat_history(db, boat.id)
+    assert [(h.position_id, h.x, h.y) for h in history] == [
+        (second.id, 50, 50), (first.id, 20, 30), (first.id, 20, 10), (first.id, 10, 10)
+    ]
+    assert [h.position_id for h in HistoryService.get_boat_history(db, boat.id, until=moved, limit=2)] == [
+        first.id, first.id
+    ]
+    # One row per position change; assigning away also records the old position
+    assert db.query(PositionHistory).count() == 8
+
+def test_boat_history_of_unknown_boat(db: Session):
+    """Test an unknown boat without history is not found"""
+    with pytest.raises(NotFoundError):
+        HistoryService.get_boat_history(db, 999)
+    boat = BoatService.create_boat(db, BoatListingCreate(index=1, customer_name="Jane Roe"))
+    assert HistoryService.get_boat_history(db, boat.id, until=_now() - timedelta(days=1)) == []
+
+def test_checkpoints_and_diff(db: Session, monkeypatch):
+    """Test replays fold hourly checkpoints and diffs report boat changes"""
+    monkeypatch.setattr(settings, "HISTORY_CHECKPOINT_INTERVAL_SECONDS", 3600.0)
+    map_obj = Map(name="Yard", image_path="yard.png")
+    db.add(map_obj)
+    db.commit()
+    base = datetime(2026, 5, 1, tzinfo=timezone.utc)
+
+    def at(minutes):
+        return base + timedelta(minutes=minutes)
+
+    def spot(x, y):
+        return {"x": x, "y": y, "rotation": 0.0}
+
+    record_history(db, [
+        history_row(map_obj.id, 1, spot(10, 10), 1, at(10)),
+        history_row(map_obj.id, 2, spot(50, 50), 2, at(20)),
+        history_row(map_obj.id, 1, spot(20, 10), 1, at(90)),
+        history_row(map_obj.id, 2, spot(50, 50), None, at(130), removed=True),
+        history_row(map_obj.id, 3, spot(70, 70), 2, at(140)),
+        history_row(map_obj.id, 4, spot(90, 90), 3, at(185)),
+    ])
+    db.commit()
+
+    assert _layout(HistoryService.get_map_at(db, map_obj.id, at(300))) == [
+        (1, 1, 20, 10), (3, 2, 70, 70), (4, 3, 90, 90)
+    ]
+    checkpoints = db.query(PositionHistoryCheckpoint).order_by(PositionHistoryCheckpoint.ts).all()
+    assert [c.ts.replace(tzinfo=timezone.utc) for c in checkpoints] == [at(60), at(120), at(180), at(300)]
+    assert checkpoints[1].positions == [[1, 1, 20, 10, 0], [2, 2, 50, 50, 0]]
+
+    # Later reads start from a checkpoint and give the same answers
+    assert _layout(HistoryService.get_map_at(db, map_obj.id, at(135))) == [(1, 1, 20, 10)]
+    assert _layout(HistoryService.get_map_at(db, map_obj.id, at(60))) == [(1, 1, 10, 10), (2, 2, 50, 50)]
+    assert db.query(PositionHistoryCheckpoint).count() == 4
+
+    diff = HistoryService.diff_map(db, map_obj.id, at(30), at(240))
+    assert [b["boat_id"] for b in diff["added"]] == [3]
+    assert diff["removed"] == []
+    assert [(m["boat_id"], m["before"]["position_id"], m["after"]["position_id"]) for m in diff["moved"]] == [
+        (1, 1, 1), (2, 2, 3)
+    ]
+    diff = HistoryService.diff_map(db, map_obj.id, at(30), at(135))
+    assert [(b["boat_id"], b["position_id"]) for b in diff["removed"]] == [(2, 2)]
+    assert [m["after"]["x"] for m in diff["moved"]] == [20]
+    assert HistoryService.diff_map(db, map_obj.id, at(200), at(300))["moved"] == []
+
+def test_checkpoints_leave_the_callers_session_alone(db: Session, monkeypatch):
+    """Test a replay writing checkpoints neither commits nor discards the caller's changes"""
+    monkeypatch.setattr(settings, "HISTORY_CHECKPOINT_INTERVAL_SECONDS", 3600.0)
+    map_obj = Map(name="Yard", image_path="yard.png")
+    db.add(map_obj)
+    db.commit()
+    base = datetime(2026, 5, 1, tzinfo=timezone.utc)
+    record_history(db, [
+        history_row(map_obj.id, 1, {"x": 10, "y": 10, "rotation": 0.0}, 1, base + timedelta(minutes=10)),
+    ])
+    db.commit()
+
+    map_obj.name = "Draft"
+    HistoryService.get_map_at(db, map_obj.id, base + timedelta(hours=3))
+
+    assert map_obj in db.dirty and map_obj.name == "Draft"
+    assert db.query(PositionHistoryCheckpoint).count() == 1
+    db.rollback()
+    assert map_obj.name == "Yard"
+
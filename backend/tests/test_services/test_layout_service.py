@@ -0,0 +1,62 @@
+import pytest
+from sqlalchemy.orm import Session
+from app.services.boat import BoatService
+from app.services.layout import LayoutService
+from app.models.boat_listing import BoatListing
+from app.schemas.boat_position import BoatPositionCreate
+from app.models.map import Map
+from app.core.exceptions import ValidationError
+
+def _create_yard(db: Session, boat_count: int) -> Map:
+    """Create a map and unmapped boats in section A"""
+    map_obj = Map(name="Yard", image_path="yard.png", image_width=2000, image_height=1500)
+    db.add(map_obj)
+    db.add_all(
+        BoatListing(index=i + 1, customer_name=f"Customer {i + 1}", size=f"{20 + i % 20} ft", section="A")
+        for i in range(boat_count)
+    )
+    db.commit()
+    return map_obj
+
+def test_auto_layout_maps_section(db: Session, count_statements):
+    """Test a section is laid out and mapped in one transaction"""
+    map_obj = _create_yard(db, 40)
+    BoatService.create_position(db, BoatPositionCreate(map_id=map_obj.id, x=100, y=100))
+    revision = map_obj.revision
+
+    with count_statements(db) as statements:
+        layout = LayoutService.auto_layout(db, map_obj.id, section="a")
+    # SQLite can't order a batched RETURNING, so only there positions insert row by row
+    assert len([sql for sql in statements if not sql.startswith("INSERT INTO boat_positions")]) < 20
+
+    assert layout["placed"] == 40 and layout["unplaced"] == []
+    assert BoatService.get_map_overlaps(db, map_obj.id) == []
+    db.refresh(map_obj)
+    assert map_obj.revision == revision + 1
+    for placement in layout["placements"]:
+        boat = BoatService.get_boat_by_id(db, placement["boat_id"])
+        assert boat.is_mapped and boat.position_id == placement["position_id"]
+        assert (boat.position.x, boat.position.y) == (placement["x"], placement["y"])
+    # A 39 ft boat at the default 3 px/ft with a third of its length as beam
+    widest = max(layout["placements"], key=lambda p: p["width"])
+    assert (widest["width"], widest["height"]) == (117, 39)
+
+    assert LayoutService.auto_layout(db, map_obj.id, section="A")["placed"] == 0
+
+def test_auto_layout_dry_run_and_errors(db: Session):
+    """Test dry runs write nothing and mapped boats are refused"""
+    map_obj = _create_yard(db, 3)
+    boat_ids = [boat.id for boat in db.query(BoatListing)]
+
+    layout = LayoutService.auto_layout(db, map_obj.id, boat_ids=boat_ids, dry_run=True)
+    assert layout["placed"] == 3
+    assert all(p["position_id"] is None for p in layout["placements"])
+    assert BoatService.get_positions_by_map(db, map_obj.id) == []
+
+    LayoutService.auto_layout(db, map_obj.id, boat_ids=boat_ids[:1])
+    with pytest.raises(ValidationError):
+        LayoutService.auto_layout(db, map_obj.id, boat_ids=boat_ids)
+    with pytest.raises(ValidationError):
+        LayoutService.auto_layout(db, map_obj.id)
+    with pytest.raises(ValidationError):
+        LayoutService.auto_layout(db, map_obj.id, section="A", region=(3000, 3000, 4000, 4000))
@@ -0,0 +1,85 @@
+from sqlalchemy.orm import Session
+from app.services.map import MapService
+from app.models.map import Map
+from app.models.boat_listing import BoatListing
+from app.models.boat_position import BoatPosition
+
+def _create_map_with_boats(db: Session, boat_count: int, index_offset: int = 0) -> Map:
+    """Create a map with the given number of mapped boats"""
+    map_obj = Map(name=f"Map {index_offset}", image_path="test.jpg")
+    db.add(map_obj)
+    db.commit()
+
+    for i in range(boat_count):
+        position = BoatPosition(map_id=map_obj.id, x=10 * i, y=10 * i)
+        db.add(position)
+        db.flush()
+        db.add(BoatListing(
+            index=index_offset + i + 1,
+            customer_name=f"Customer {i + 1}",
+            position_id=position.id,
+            is_mapped=True
+        ))
+    db.commit()
+    return map_obj
+
+def _count_snapshot_statements(db: Session, map_id: int, count_statements) -> int:
+    """Count SQL statements issued while loading and walking a map snapshot"""
+    with count_statements(db) as statements:
+        map_obj = MapService.get_map_snapshot(db, map_id)
+        for position in map_obj.boat_positions:
+            if position.boat_listing:
+                position.boat_listing.customer_name
+    return len(statements)
+
+def test_get_map_snapshot(db: Session):
+    """Test snapshot returns positions with their boats"""
+    map_obj = _create_map_with_boats(db, 3)
+
+    snapshot = MapService.get_map_snapshot(db, map_obj.id)
+
+    assert snapshot.id == map_obj.id
+    assert len(snapshot.boat_positions) == 3
+    assert all(p.boat_listing is not None for p in snapshot.boat_positions)
+
+def test_get_map_snapshot_not_found(db: Session):
+    """Test snapshot of missing map returns None"""
+    assert MapService.get_map_snapshot(db, 999) is None
+
+def test_map_snapshot_statement_count_is_constant(db: Session, count_statements):
+    """Test snapshot query count does not grow with the number of boats"""
+    small_map = _create_map_with_boats(db, 1)
+    large_map = _create_map_with_boats(db, 50, index_offset=100)
+
+    small_count = _count_snapshot_statements(db, small_map.id, count_statements)
+    large_count = _count_snapshot_statements(db, large_map.id, count_statements)
+
+    assert small_count == large_count
+    assert large_count <= 2
+
+def test_get_maps_includes_boat_counts(db: Session):
+    """Test map list carries per-map boat counts"""
+    busy_map = _create_map_with_boats(db, 4)
+    empty_map = _create_map_with_boats(db, 0, index_offset=100)
+
+    counts = {m.id: m.boat_count for m in MapService.get_maps(db)}
+
+    assert counts[busy_map.id] == 4
+    assert counts[empty_map.id] == 0
+
+def test_get_maps_statement_count_is_constant(db: Session, count_statements):
+    """Test map list costs one query regardless of the number of maps"""
+    _create_map_with_boats(db, 2)
+
+    with count_statements(db) as few:
+        MapService.get_maps(db)
+
+    for i in range(1, 10):
+        _create_map_with_boats(db, 2, index_offset=i * 100)
+
+    with count_statements(db) as many:
+        maps = MapService.get_maps(db)
+        [m.boat_count for m in maps]
+
+    assert len(maps) == 10
+    assert len(few) == len(many) == 1
@@ -0,0 +1,151 @@
+import pytest
+from sqlalchemy.orm import Session
+from app.services.boat import BoatService
+from app.schemas.boat_position import BoatPositionCreate, BoatPositionBulkItem, BoatPositionUpdate
+from app.schemas.boat_listing import BoatListingCreate
+from app.models.map import Map
+from app.models.position_tombstone import PositionTombstone
+from app.core.exceptions import ConflictError, NotFoundError
+
+def _create_positions(db: Session, count: int) -> list:
+    """Create a map with the given number of positions"""
+    map_obj = Map(name="Test Map", image_path="test.jpg")
+    db.add(map_obj)
+    db.commit()
+    return [
+        BoatService.create_position(db, BoatPositionCreate(map_id=map_obj.id, x=i, y=i))
+        for i in range(count)
+    ]
+
+def test_bulk_update_positions(db: Session):
+    """Test bulk update applies each payload and keeps request order"""
+    positions = _create_positions(db, 3)
+    items = [
+        BoatPositionBulkItem(id=positions[2].id, x=300, rotation=90),
+        BoatPositionBulkItem(id=positions[0].id, y=150),
+    ]
+
+    updated = BoatService.bulk_update_positions(db, items)
+
+    assert [p.id for p in updated] == [positions[2].id, positions[0].id]
+    assert (updated[0].x, updated[0].rotation) == (300, 90)
+    assert (updated[1].x, updated[1].y) == (0, 150)
+    assert updated[0].updated_at is not None
+    assert BoatService.get_position_by_id(db, positions[1].id).x == 1
+
+def test_bulk_update_ignores_nulls(db: Session):
+    """Test explicit nulls in a bulk item leave those fields unchanged"""
+    positions = _create_positions(db, 2)
+    items = [
+        BoatPositionBulkItem(id=positions[0].id, x=None, y=40),
+        BoatPositionBulkItem(id=positions[1].id, color=None),
+    ]
+
+    updated = BoatService.bulk_update_positions(db, items)
+
+    assert (updated[0].x, updated[0].y) == (0, 40)
+    assert (updated[1].x, updated[1].color) == (1, "blue")
+
+def test_bulk_update_missing_position(db: Session):
+    """Test bulk update is rejected as a whole when a position is missing"""
+    positions = _create_positions(db, 1)
+    items = [BoatPositionBulkItem(id=positions[0].id, x=50), BoatPositionBulkItem(id=999, x=60)]
+
+    with pytest.raises(NotFoundError):
+        BoatService.bulk_update_positions(db, items)
+
+    db.expire_all()
+    assert BoatService.get_position_by_id(db, positions[0].id).x == 0
+
+def test_bulk_update_statement_count_is_constant(db: Session, count_statements):
+    """Test bulk update issues the same statements for small and large batches"""
+    ids = [p.id for p in _create_positions(db, 60)]
+
+    with count_statements(db) as small:
+        BoatService.bulk_update_positions(db, [BoatPositionBulkItem(id=i, x=5) for i in ids[:5]])
+
+    with count_statements(db) as large:
+        BoatService.bulk_update_positions(db, [BoatPositionBulkItem(id=i, x=7) for i in ids])
+
+    assert len(small) == len(large)
+
+def test_position_changes_bump_map_revision(db: Session):
+    """Test every position change stamps the next map revision"""
+    positions = _create_positions(db, 2)
+    assert [p.revision for p in positions] == [1, 2]
+
+    BoatService.bulk_update_positions(db, [
+        BoatPositionBulkItem(id=positions[0].id, x=5), BoatPositionBulkItem(id=positions[1].id, y=5)
+    ])
+    db.refresh(positions[0])
+    assert positions[0].map.revision == 3
+    assert positions[0].revision == 3
+
+    boat = BoatService.create_boat(db, BoatListingCreate(index=1, customer_name="Jo"))
+    BoatService.assign_boat_to_position(db, boat.id, positions[0].id)
+    BoatService.assign_boat_to_position(db, boat.id, positions[1].id)
+    db.refresh(positions[0])
+    assert (positions[0].revision, positions[1].revision) == (5, 6)
+
+    map_id, deleted_id = positions[0].map_id, positions[0].id
+    BoatService.delete_position(db, deleted_id)
+    tombstone = db.query(PositionTombstone).one()
+    assert (tombstone.map_id, tombstone.position_id, tombstone.revision) == (map_id, deleted_id, 7)
+
+def test_create_position_on_missing_map(db: Session):
+    """Test positions cannot be created on a map that does not exist"""
+    with pytest.raises(NotFoundError):
+        BoatService.create_position(db, BoatPositionCreate(map_id=999))
+
+def test_positions_in_viewport(db: Session):
+    """Test bbox queries match footprints, not just centres"""
+    map_obj = Map(name="Test Map", image_path="test.jpg")
+    db.add(map_obj)
+    db.commit()
+
+    def create(**fields):
+        return BoatService.create_position(db, BoatPositionCreate(map_id=map_obj.id, **fields))
+
+    inside = create(x=500, y=500)
+    edge = create(x=360, y=500, width=100, height=20)  # reaches x=410
+    rotated = create(x=500, y=380, width=200, height=20, rotation=90)  # reaches y=480
+    far = create(x=2000, y=2000)
+    viewport = (400, 450, 600, 600)
+
+    found = BoatService.get_positions_by_map(db, map_obj.id, viewport)
+    assert [p.id for p in found] == [inside.id, edge.id, rotated.id]
+
+    BoatService.update_position(db, rotated.id, BoatPositionUpdate(rotation=0))
+    BoatService.bulk_update_positions(db, [BoatPositionBulkItem(id=far.id, x=450, y=580)])
+    found = BoatService.get_positions_by_map(db, map_obj.id, viewport)
+    assert [p.id for p in found] == [inside.id, edge.id, far.id]
+
+    assert BoatService.get_positions_by_map(db, map_obj.id, (0, 0, 10, 10)) == []
+    assert len(BoatService.get_positions_by_map(db, map_obj.id)) == 4
+
+def test_overlap_detection(db: Session):
+    """Test overlap queries and the reject_overlaps option"""
+    map_obj = Map(name="Test Map", image_path="test.jpg")
+    db.add(map_obj)
+    db.commit()
+
+    def create(**fields):
+        return BoatService.create_position(db, BoatPositionCreate(map_id=map_obj.id, **fields))
+
+    first = create(x=100, y=100)
+    second = create(x=150, y=110)
+    apart = create(x=400, y=100)
+    assert BoatService.get_map_overlaps(db, map_obj.id) == [(first.id, second.id)]
+
+    with pytest.raises(ConflictError):
+        BoatService.create_position(
+            db, BoatPositionCreate(map_id=map_obj.id, x=420, y=100), reject_overlaps=True
+        )
+    with pytest.raises(ConflictError):
+        BoatService.update_position(db, apart.id, BoatPositionUpdate(x=180), reject_overlaps=True)
+    assert BoatService.get_position_by_id(db, apart.id).x == 400
+
+    # Moving a position never conflicts with itself
+    BoatService.update_position(db, apart.id, BoatPositionUpdate(x=410), reject_overlaps=True)
+    BoatService.update_position(db, second.id, BoatPositionUpdate(y=300), reject_overlaps=True)
+    assert BoatService.get_map_overlaps(db, map_obj.id) == []
@@ -1,7 +1,9 @@
 // frontend/src/hooks/useMaps.ts (Updated with additional mutations)
+import { useEffect } from 'react';
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { MapService } from '../services/maps';
-import { MapCreate, MapUpdate } from '../types/map';
+import { apiClient } from '../services/api';
+import { MapChangeEvent, MapCreate, MapUpdate, MapWithBoats } from '../types/map';
 
 export const useMaps = () => {
   return useQuery({
@@ -28,6 +30,57 @@ export const useMapWithBoats = (id: number) => {
   });
 };
 
+// Apply a change feed event to a cached snapshot; null means refetch
+const applyMapChange = (data: MapWithBoats, event: MapChangeEvent): MapWithBoats | null => {
+  switch (event.type) {
+    case 'position.updated':
+      return {
+        ...data,
+        boats: data.boats.map((item) =>
+          item.position.id === event.position.id
+            ? { ...item, position: { ...item.position, ...event.position } }
+            : item
+        ),
+      };
+    case 'position.deleted':
+      return { ...data, boats: data.boats.filter((item) => item.position.id !== event.position_id) };
+    case 'boat.unassigned':
+      return {
+        ...data,
+        boats: data.boats.map((item) =>
+          item.position.id === event.position_id ? { ...item, boat: undefined } : item
+        ),
+      };
+    default:
+      return null;
+  }
+};
+
+// Keep a map snapshot current from the server's WebSocket change feed
+export const useMapChanges = (id: number) => {
+  const queryClient = useQueryClient();
+
+  useEffect(() => {
+    if (!id) return;
+    const socket = new WebSocket(apiClient.webSocketUrl(`/maps/${id}/ws`));
+
+    socket.onmessage = (message) => {
+      const event: MapChangeEvent = JSON.parse(message.data);
+      if (event.type === 'subscribed') return;
+
+      const current = queryClient.getQueryData<MapWithBoats>(['mapWithBoats', id]);
+      const next = current ? applyMapChange(current, event) : null;
+      if (next) {
+        queryClient.setQueryData(['mapWithBoats', id], next);
+      } else {
+        queryClient.invalidateQueries({ queryKey: ['mapWithBoats', id] });
+      }
+    };
+
+    return () => socket.close();
+  }, [id, queryClient]);
+};
+
 export const useCreateMap = () => {
   const queryClient = useQueryClient();
   
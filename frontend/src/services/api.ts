@@ -24,11 +24,15 @@ class ApiClient {
     localStorage.removeItem('access_token');
   }
 
-  private getHeaders(): HeadersInit {
+  private getHeaders(accept?: string): HeadersInit {
     const headers: HeadersInit = {
       'Content-Type': 'application/json',
     };
 
+    if (accept) {
+      headers['Accept'] = accept;
+    }
+
     if (this.token) {
       headers['Authorization'] = `Bearer ${this.token}`;
     }
@@ -48,7 +52,8 @@ class ApiClient {
     return response.json();
   }
 
-  async get<T>(endpoint: string, params?: Record<string, any>): Promise<T> {
+  // ``accept`` requests an alternative representation, e.g. COLUMNAR_JSON
+  async get<T>(endpoint: string, params?: Record<string, any>, accept?: string): Promise<T> {
     const url = new URL(`${this.baseURL}${endpoint}`);
     if (params) {
       Object.entries(params).forEach(([key, value]) => {
@@ -60,7 +65,7 @@ class ApiClient {
 
     const response = await fetch(url.toString(), {
       method: 'GET',
-      headers: this.getHeaders(),
+      headers: this.getHeaders(accept),
     });
 
     return this.handleResponse<T>(response);
@@ -86,6 +91,16 @@ class ApiClient {
     return this.handleResponse<T>(response);
   }
 
+  async patch<T>(endpoint: string, data?: any): Promise<T> {
+    const response = await fetch(`${this.baseURL}${endpoint}`, {
+      method: 'PATCH',
+      headers: this.getHeaders(),
+      body: data ? JSON.stringify(data) : undefined,
+    });
+
+    return this.handleResponse<T>(response);
+  }
+
   async delete<T>(endpoint: string): Promise<T> {
     const response = await fetch(`${this.baseURL}${endpoint}`, {
       method: 'DELETE',
@@ -95,6 +110,17 @@ class ApiClient {
     return this.handleResponse<T>(response);
   }
 
+  // WebSocket URL for an endpoint; browsers cannot set headers on sockets,
+  // so the token travels as a query parameter
+  webSocketUrl(endpoint: string): string {
+    const url = new URL(`${this.baseURL}${endpoint}`);
+    url.protocol = url.protocol === 'https:' ? 'wss:' : 'ws:';
+    if (this.token) {
+      url.searchParams.set('token', this.token);
+    }
+    return url.toString();
+  }
+
   // Form data for login endpoint
   async postForm<T>(endpoint: string, data: FormData): Promise<T> {
     const headers: HeadersInit = {};
@@ -4,7 +4,8 @@ import {
   BoatListing,
   BoatListingCreate,
   BoatListingUpdate,
-  BoatSearchParams
+  BoatSearchParams,
+  PositionHistoryEntry
 } from '../types/boat';
 
 export class BoatService {
@@ -16,6 +17,11 @@ export class BoatService {
     return apiClient.get<BoatListing>(`/boats/${id}`);
   }
 
+  // Newest first; pass the last entry's ts as until for older changes
+  static async getBoatHistory(id: number, until?: string, limit?: number): Promise<PositionHistoryEntry[]> {
+    return apiClient.get<PositionHistoryEntry[]>(`/boats/${id}/history`, { until, limit });
+  }
+
   static async getBoatByIndex(index: number): Promise<BoatListing> {
     return apiClient.get<BoatListing>(`/boats/index/${index}`);
   }
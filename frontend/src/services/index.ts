@@ -3,4 +3,5 @@ export { MapService } from './maps';
 export { BoatService } from './boats';
 export { PositionService } from './positions';
 export { AuthService } from './auth';
+export { JobService } from './jobs';
 export { apiClient } from './api';
\ No newline at end of file
@@ -0,0 +1,35 @@
+// frontend/src/services/jobs.ts
+import { apiClient } from './api';
+import { Job } from '../types/job';
+import { LayoutRequest } from '../types/map';
+
+// Heavy work runs as a background job: submit, poll getJob, then fetch the result
+export class JobService {
+  static async submitLayout(mapId: number, request: LayoutRequest): Promise<Job> {
+    return apiClient.post<Job>(`/jobs/maps/${mapId}/layout`, request);
+  }
+
+  static async submitOverlaps(mapId: number): Promise<Job> {
+    return apiClient.post<Job>(`/jobs/maps/${mapId}/overlaps`);
+  }
+
+  static async submitImport(file: File, batchSize?: number): Promise<Job> {
+    const data = new FormData();
+    data.append('file', file);
+    const query = batchSize ? `?batch_size=${batchSize}` : '';
+    return apiClient.postForm<Job>(`/jobs/boats/import${query}`, data);
+  }
+
+  static async getJob(id: string): Promise<Job> {
+    return apiClient.get<Job>(`/jobs/${id}`);
+  }
+
+  // Shaped like the matching synchronous endpoint's response
+  static async getJobResult<T>(id: string): Promise<T> {
+    return apiClient.get<T>(`/jobs/${id}/result`);
+  }
+
+  static async cancelJob(id: string): Promise<Job> {
+    return apiClient.delete<Job>(`/jobs/${id}`);
+  }
+}
@@ -1,7 +1,11 @@
 // frontend/src/services/maps.ts
 import { apiClient } from './api';
-import { Map, MapCreate, MapUpdate, MapWithBoats } from '../types/map';
+import {
+  ColumnarMapWithBoats, Map, MapChanges, MapCreate, MapUpdate, MapWithBoats, PositionOverlap,
+  FreePlacement, FreeSpaceParams, LayoutRequest, LayoutResult, MapAtTime, MapDiff
+} from '../types/map';
 import { PaginationParams } from '../types/api';
+import { COLUMNAR_JSON } from '../utils/columnar';
 
 export interface MapSearchParams extends PaginationParams {
   active_only?: boolean;
@@ -20,6 +24,41 @@ export class MapService {
     return apiClient.get<MapWithBoats>(`/maps/${id}`);
   }
 
+  // Same snapshot as one array per field; decode with columnRows
+  static async getMapWithBoatsColumnar(id: number): Promise<ColumnarMapWithBoats> {
+    return apiClient.get<ColumnarMapWithBoats>(`/maps/${id}`, undefined, COLUMNAR_JSON);
+  }
+
+  // Positions changed or deleted since a revision (map.revision from getMapWithBoats)
+  static async getMapChanges(id: number, since: number): Promise<MapChanges> {
+    return apiClient.get<MapChanges>(`/maps/${id}/changes`, { since });
+  }
+
+  // Pairs of positions whose footprints overlap
+  static async getMapOverlaps(id: number): Promise<PositionOverlap[]> {
+    return apiClient.get<PositionOverlap[]>(`/maps/${id}/overlaps`);
+  }
+
+  // Nearest spots where a width x height boat fits (target defaults to the map centre)
+  static async getFreeSpace(id: number, params: FreeSpaceParams): Promise<FreePlacement[]> {
+    return apiClient.get<FreePlacement[]>(`/maps/${id}/free-space`, params);
+  }
+
+  // The map's positions as they were at an ISO timestamp
+  static async getMapAt(id: number, ts: string): Promise<MapAtTime> {
+    return apiClient.get<MapAtTime>(`/maps/${id}/at`, { ts });
+  }
+
+  // Boats added, removed and moved between two ISO timestamps; end defaults to now
+  static async getMapDiff(id: number, start: string, end?: string): Promise<MapDiff> {
+    return apiClient.get<MapDiff>(`/maps/${id}/diff`, { start, end });
+  }
+
+  // Pack unmapped boats into the map (admin); dry_run previews without saving
+  static async layoutMap(id: number, request: LayoutRequest): Promise<LayoutResult> {
+    return apiClient.post<LayoutResult>(`/maps/${id}/layout`, request);
+  }
+
   static async createMap(mapData: MapCreate): Promise<Map> {
     return apiClient.post<Map>('/maps', mapData);
   }
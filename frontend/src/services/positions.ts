@@ -3,12 +3,26 @@ import { apiClient } from './api';
 import {
   BoatPosition,
   BoatPositionCreate,
-  BoatPositionUpdate
+  BoatPositionUpdate,
+  BoatPositionBulkUpdateItem
 } from '../types/boat';
+import { ColumnarPositions } from '../types/map';
+import { COLUMNAR_JSON } from '../utils/columnar';
 
 export class PositionService {
-  static async getPositionsByMap(mapId: number): Promise<BoatPosition[]> {
-    return apiClient.get<BoatPosition[]>(`/positions/map/${mapId}`);
+  // Pass the visible [x0, y0, x1, y1] to load only boats in the viewport
+  static async getPositionsByMap(
+    mapId: number,
+    bbox?: [number, number, number, number]
+  ): Promise<BoatPosition[]> {
+    return apiClient.get<BoatPosition[]>(
+      `/positions/map/${mapId}`,
+      bbox ? { bbox: bbox.join(',') } : undefined
+    );
+  }
+
+  static async getPositionsByMapColumnar(mapId: number): Promise<ColumnarPositions> {
+    return apiClient.get<ColumnarPositions>(`/positions/map/${mapId}`, undefined, COLUMNAR_JSON);
   }
 
   static async getPosition(id: number): Promise<BoatPosition> {
@@ -23,6 +37,10 @@ export class PositionService {
     return apiClient.put<BoatPosition>(`/positions/${id}`, positionData);
   }
 
+  static async bulkUpdatePositions(positions: BoatPositionBulkUpdateItem[]): Promise<BoatPosition[]> {
+    return apiClient.patch<BoatPosition[]>('/positions/bulk', { positions });
+  }
+
   static async deletePosition(id: number): Promise<{ message: string }> {
     return apiClient.delete(`/positions/${id}`);
   }
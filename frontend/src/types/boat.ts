@@ -11,6 +11,8 @@ export interface BoatListing {
   notes?: string;
   is_mapped: boolean;
   position_id?: number;
+  length_ft?: number; // parsed from size
+  beam_ft?: number;
   created_at: string;
   updated_at?: string;
 }
@@ -78,6 +80,10 @@ export interface BoatPositionUpdate {
   is_visible?: boolean;
 }
 
+export interface BoatPositionBulkUpdateItem extends BoatPositionUpdate {
+  id: number;
+}
+
 export interface BoatWithPosition {
   boat?: BoatListing;
   position: BoatPosition;
@@ -86,5 +92,18 @@ export interface BoatWithPosition {
 export interface BoatSearchParams extends SearchParams {
   mapped_only?: boolean;
   section?: string;
+  min_length?: number; // feet
+  max_length?: number;
+  sort?: 'index' | 'length' | '-length';
 }
 
+export interface PositionHistoryEntry {
+  map_id: number;
+  position_id: number;
+  boat_id?: number;
+  x: number;
+  y: number;
+  rotation: number;
+  removed: boolean;
+  ts: string;
+}
@@ -0,0 +1,14 @@
+// frontend/src/types/job.ts
+export type JobStatus = 'queued' | 'running' | 'succeeded' | 'failed' | 'cancelled';
+
+export interface Job {
+  id: string;
+  kind: 'layout' | 'overlaps' | 'import';
+  status: JobStatus;
+  progress: number; // 0-1
+  message?: string;
+  error?: string;
+  created_at: string;
+  started_at?: string;
+  finished_at?: string;
+}
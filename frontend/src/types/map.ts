@@ -1,4 +1,6 @@
 // frontend/src/types/map.ts
+import { BoatListing, BoatPosition, BoatWithPosition } from './boat';
+
 export interface Map {
   id: number;
   name: string;
@@ -9,6 +11,7 @@ export interface Map {
   is_active: boolean;
   created_at: string;
   updated_at?: string;
+  revision?: number;
   boat_count?: number;
 }
 
@@ -35,3 +38,129 @@ export interface MapWithBoats {
   boats: BoatWithPosition[];
 }
 
+// Columnar bodies (Accept: application/vnd.pier11.columnar+json):
+// one array per field; color and stroke_color index into ``palette``
+export interface ColumnarTable<T> {
+  count: number;
+  columns: { [K in keyof T]: T[K][] };
+}
+
+export type ColumnarPosition = Omit<BoatPosition, 'map_id' | 'color' | 'stroke_color'> & {
+  color: number;
+  stroke_color: number;
+};
+
+export interface ColumnarPositions {
+  map_id: number;
+  palette: string[];
+  positions: ColumnarTable<ColumnarPosition>;
+}
+
+export interface ColumnarMapWithBoats {
+  map: Map;
+  palette: string[];
+  positions: ColumnarTable<ColumnarPosition>;
+  boats: ColumnarTable<BoatListing>;
+}
+
+export interface HistoricalPosition {
+  position_id: number;
+  boat_id?: number;
+  x: number;
+  y: number;
+  rotation: number;
+}
+
+export interface MapAtTime {
+  map_id: number;
+  ts: string;
+  positions: HistoricalPosition[];
+}
+
+export interface BoatMove {
+  boat_id: number;
+  before: HistoricalPosition;
+  after: HistoricalPosition;
+}
+
+export interface MapDiff {
+  map_id: number;
+  start: string;
+  end: string;
+  added: HistoricalPosition[];
+  removed: HistoricalPosition[];
+  moved: BoatMove[];
+}
+
+export interface PositionOverlap {
+  position_id: number;
+  other_position_id: number;
+}
+
+export interface FreeSpaceParams {
+  width: number;
+  height: number;
+  x?: number;
+  y?: number;
+  rotation?: number;
+  limit?: number;
+}
+
+export interface FreePlacement {
+  x: number;
+  y: number;
+  width: number;
+  height: number;
+  rotation: number;
+  distance: number;
+}
+
+export interface LayoutRequest {
+  boat_ids?: number[];
+  section?: string;
+  region?: [number, number, number, number];
+  spacing?: number;
+  pixels_per_foot?: number;
+  time_budget?: number;
+  dry_run?: boolean;
+}
+
+export interface LayoutPlacement {
+  boat_id: number;
+  position_id: number | null;
+  x: number;
+  y: number;
+  width: number;
+  height: number;
+  rotation: number;
+}
+
+export interface LayoutResult {
+  placed: number;
+  unplaced: number[];
+  strategy: string;
+  attempts: number;
+  dry_run: boolean;
+  placements: LayoutPlacement[];
+}
+
+export interface MapChanges {
+  map_id: number;
+  since: number;
+  revision: number;
+  reset: boolean;
+  map: Map | null;
+  positions: BoatWithPosition[];
+  deleted: number[];
+}
+
+export type MapChangeEvent =
+  | { type: 'subscribed'; map_id: number }
+  | { type: 'resync'; map_id?: number }
+  | { type: 'position.created' | 'position.updated'; map_id: number; revision: number; position: Partial<BoatPosition> & { id: number } }
+  | { type: 'position.deleted'; map_id: number; revision: number; position_id: number }
+  | { type: 'boat.assigned'; map_id: number; revision: number; position_id: number; boat: Partial<BoatListing> & { id: number } }
+  | { type: 'boat.unassigned'; map_id: number; revision: number; position_id: number; boat_id: number }
+  | { type: 'boat.updated'; map_id: number; revision: number; boat: Partial<BoatListing> & { id: number } }
+  | { type: 'map.updated'; map_id: number; revision: number; map: Partial<Map> & { id: number } }
+  | { type: 'map.deleted'; map_id: number };
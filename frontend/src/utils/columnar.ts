@@ -0,0 +1,19 @@
+// frontend/src/utils/columnar.ts
+import { ColumnarTable } from '../types/map';
+
+export const COLUMNAR_JSON = 'application/vnd.pier11.columnar+json';
+
+// Rebuild row objects from a columnar table (only when objects are needed;
+// the canvas can read the column arrays directly)
+export function columnRows<T>(table: ColumnarTable<T>): T[] {
+  const fields = Object.keys(table.columns) as (keyof T)[];
+  const rows: T[] = [];
+  for (let i = 0; i < table.count; i++) {
+    const row = {} as T;
+    for (const field of fields) {
+      row[field] = table.columns[field][i];
+    }
+    rows.push(row);
+  }
+  return rows;
+}